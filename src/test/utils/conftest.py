@@ -0,0 +1,17 @@
+"""Testes dos módulos Python de src/utils (importados como em pdf-generator.py)"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+UTILS_DIR = Path(__file__).resolve().parents[2] / 'utils'
+DATA_DIR = Path(__file__).resolve().parents[3] / 'data'
+
+sys.path.insert(0, str(UTILS_DIR))
+
+
+@pytest.fixture(scope='session')
+def data_dir() -> Path:
+    """Diretório das bases de dados do repositório"""
+    return DATA_DIR
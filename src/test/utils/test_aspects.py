@@ -0,0 +1,85 @@
+"""Intervalos de aspecto (find_aspect_intervals) e refinamento de AspectEngine.sweep"""
+
+import datetime
+
+import numpy as np
+import pytest
+
+from aspects import ASPECTS, AspectEngine, find_aspect_intervals, orb_residual, signed_separation
+from ephemeris import Ephemeris
+
+CONJUNCTION, SQUARE = list(ASPECTS).index('conjuncao'), list(ASPECTS).index('quadratura')
+
+
+def _intervals(found):
+    return sorted(zip(found['pair'].tolist(), found['aspect'].tolist(),
+                      found['first'].tolist(), found['last'].tolist()))
+
+
+def test_find_aspect_intervals_on_synthetic_motion():
+    # B anda 1° por amostra de 350° a 100°, A fica parado em 0°
+    jd = np.arange(111.0)
+    longitudes = {'A': np.zeros(len(jd)), 'B': np.mod(350.0 + jd, 360.0)}
+    orbs = np.full((1, len(ASPECTS)), 5.0)
+    found = _intervals(find_aspect_intervals(jd, longitudes, [('B', 'A')], orbs))
+    # Conjunção de 355° a 5° (amostras 5-15), sextil de 55° a 65° e quadratura de 85° a 95°
+    assert found == [(0, CONJUNCTION, 5, 15), (0, list(ASPECTS).index('sextil'), 65, 75),
+                     (0, SQUARE, 95, 105)]
+
+
+def test_find_aspect_intervals_marks_open_ends():
+    jd = np.arange(11.0)
+    longitudes = {'A': np.zeros(len(jd)), 'B': 85.0 + jd}
+    found = find_aspect_intervals(jd, longitudes, [('B', 'A')], np.full((1, len(ASPECTS)), 5.0))
+    # Quadratura já aberta no início (-1) e ainda aberta no fim (T)
+    assert _intervals(found) == [(0, SQUARE, -1, len(jd))]
+
+
+@pytest.fixture(scope='module')
+def december_2020(data_dir):
+    ephemeris = Ephemeris(data_dir)
+    engine = AspectEngine(ephemeris, data_dir)
+    return engine, engine.sweep(datetime.datetime(2020, 12, 1), datetime.datetime(2021, 1, 1))
+
+
+def _exact(timeline, bodies, aspect):
+    return [moment for moment, interval in timeline.exact_between(datetime.datetime(2020, 12, 1),
+                                                                  datetime.datetime(2021, 1, 1))
+            if interval['bodies'] == bodies and interval['aspect'] == aspect]
+
+
+def test_exact_lunations_december_2020(december_2020):
+    _, timeline = december_2020
+    # Lua Nova (eclipse total) 14/12 16:17 UTC e Lua Cheia 30/12 03:28 UTC
+    new_moon, = _exact(timeline, ('Sol', 'Lua'), 'conjuncao')
+    full_moon, = _exact(timeline, ('Sol', 'Lua'), 'oposicao')
+    assert abs(new_moon - datetime.datetime(2020, 12, 14, 16, 17)) < datetime.timedelta(minutes=2)
+    assert abs(full_moon - datetime.datetime(2020, 12, 30, 3, 28)) < datetime.timedelta(minutes=2)
+
+
+def test_great_conjunction_2020(december_2020):
+    _, timeline = december_2020
+    great, = _exact(timeline, ('Jupiter', 'Saturno'), 'conjuncao')
+    # Conjunção em longitude eclíptica em 21/12/2020 ~18:20 UTC (posições geométricas: ~10 min antes)
+    assert abs(great - datetime.datetime(2020, 12, 21, 18, 20)) < datetime.timedelta(minutes=15)
+    interval = next(interval for interval in timeline.active_at(great) if interval['bodies'] == ('Jupiter', 'Saturno'))
+    # Dentro do orbe o mês inteiro: entrada e saída fora da varredura
+    assert interval['entry'] is None and interval['exit'] is None
+
+
+def test_refined_entry_exit_and_exact_residuals(december_2020):
+    engine, timeline = december_2020
+    closed = [interval for interval in timeline.intervals
+              if interval['entry'] is not None and interval['exit'] is not None]
+    assert closed
+    for interval in closed:
+        a, b = interval['bodies']
+        for jd in (interval['entry_jd'], interval['exit_jd']):
+            longitudes = engine.ephemeris.longitudes(jd, [a, b])
+            s = signed_separation(longitudes[a], longitudes[b])
+            assert abs(float(orb_residual(s, interval['angle'], interval['orb']))) < 1e-4
+        for jd in interval['exact_jd']:
+            assert interval['entry_jd'] <= jd <= interval['exit_jd']
+            longitudes = engine.ephemeris.longitudes(jd, [a, b])
+            separation = abs(float(signed_separation(longitudes[a], longitudes[b])))
+            assert separation == pytest.approx(interval['angle'], abs=1e-4)
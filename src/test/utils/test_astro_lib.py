@@ -0,0 +1,57 @@
+"""Conversões de tempo e utilitários angulares de astro_lib.py"""
+
+import datetime
+
+import numpy as np
+import pytest
+
+from astro_lib import (J2000, find_angle_crossings, format_longitude, from_julian_day,
+                       lunar_phase_name, to_julian_day, zodiac_sign)
+
+
+def test_julian_day_of_j2000():
+    assert to_julian_day(datetime.datetime(2000, 1, 1, 12)) == J2000
+
+
+def test_julian_day_meeus_example_7a():
+    # Meeus, exemplo 7.a: 1957-10-04.81 = JD 2436116.31
+    moment = datetime.datetime(1957, 10, 4) + datetime.timedelta(days=0.81)
+    assert to_julian_day(moment) == pytest.approx(2436116.31, abs=1e-6)
+
+
+def test_julian_day_of_date_is_noon_utc():
+    assert to_julian_day(datetime.date(2024, 1, 1)) == to_julian_day(datetime.datetime(2024, 1, 1, 12))
+
+
+def test_julian_day_of_aware_datetime_is_utc():
+    brasilia = datetime.timezone(datetime.timedelta(hours=-3))
+    assert to_julian_day(datetime.datetime(2024, 1, 1, 9, tzinfo=brasilia)) == to_julian_day(datetime.datetime(2024, 1, 1, 12))
+
+
+def test_from_julian_day_round_trip():
+    moment = datetime.datetime(2024, 3, 20, 3, 6)
+    assert abs(from_julian_day(to_julian_day(moment)) - moment) < datetime.timedelta(milliseconds=1)
+
+
+def test_zodiac_signs_and_formatting():
+    assert zodiac_sign(0.0) == 'Áries'
+    assert zodiac_sign(359.99) == 'Peixes'
+    assert zodiac_sign(-31.0) == 'Aquário'
+    assert format_longitude(133.5) == "13°30' Leão"
+    assert format_longitude(359.9999) == "0°00' Áries"
+
+
+def test_lunar_phase_octants():
+    assert lunar_phase_name(100.0, 100.0) == 'Nova'
+    assert lunar_phase_name(100.0, 190.0) == 'Crescente'
+    assert lunar_phase_name(100.0, 280.0) == 'Cheia'
+    assert lunar_phase_name(100.0, 10.0) == 'Minguante'
+
+
+def test_find_angle_crossings_on_linear_angle():
+    # 10°/dia a partir de 0° em JD 2460000.0: 90° no dia 9, 0° (360°) no dia 36
+    start = 2460000.0
+    jds, kinds = find_angle_crossings(lambda jd: np.mod(10.0 * (jd - start), 360.0),
+                                      start + 0.5, start + 40.0, [0.0, 90.0], step=1.0)
+    assert kinds.tolist() == [1, 0]
+    assert jds == pytest.approx([start + 9.0, start + 36.0], abs=1e-7)
@@ -0,0 +1,19 @@
+"""Benchmark (benchmark.py): execução sem linha de base"""
+
+import sys
+
+import pytest
+
+import benchmark
+
+
+def test_missing_baseline_fails_before_measuring(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(benchmark, 'run', lambda *args: pytest.fail('mediu sem linha de base'))
+    monkeypatch.setattr(benchmark, 'REPO_DIR', tmp_path)
+    monkeypatch.setattr(benchmark, 'DEFAULT_BASELINE', tmp_path / 'baseline.json')
+    for argv in ([], ['--baseline', str(tmp_path / 'outra.json')]):
+        monkeypatch.setattr(sys, 'argv', ['benchmark.py', *argv])
+        with pytest.raises(SystemExit) as exit_info:
+            benchmark.main()
+        assert exit_info.value.code != 0
+        assert '--save-baseline' in capsys.readouterr().err
@@ -0,0 +1,45 @@
+"""Tabela Chebyshev (chebyshev.py): precisão e invalidação pelo manifest"""
+
+import json
+
+import numpy as np
+import pytest
+
+from chebyshev import MANIFEST_NAME, ChebyshevEphemeris, theory_fingerprint
+from lua import moon_longitude
+from vsop87 import VSOP87Engine
+
+
+@pytest.fixture(scope='module')
+def table_dir(data_dir, tmp_path_factory):
+    directory = tmp_path_factory.mktemp('chebyshev')
+    ChebyshevEphemeris.build(directory, data_dir / 'vsop87', 2024, 2024, ['Sol', 'Lua'])
+    return directory
+
+
+def test_table_matches_series(table_dir, data_dir):
+    table = ChebyshevEphemeris(table_dir)
+    jd = table.start_jd + np.linspace(0.0, 365.0, 1000)
+    sun = VSOP87Engine(data_dir / 'vsop87').geocentric_longitude('Sol', jd)
+    for body, expected in (('Sol', sun), ('Lua', moon_longitude(jd))):
+        error = np.abs((table.longitude(body, jd) - expected + 180.0) % 360.0 - 180.0)
+        assert error.max() < 1.0 / 3600.0
+
+
+def test_manifest_records_theory(table_dir):
+    with open(table_dir / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+        assert json.load(f)['theory'] == theory_fingerprint()
+
+
+def test_table_from_other_theory_is_rejected(table_dir, tmp_path, capsys):
+    stale = tmp_path / 'stale'
+    stale.mkdir()
+    for path in table_dir.iterdir():
+        (stale / path.name).write_bytes(path.read_bytes())
+    manifest = json.loads((stale / MANIFEST_NAME).read_text(encoding='utf-8'))
+    manifest['theory'] = '0' * 64
+    (stale / MANIFEST_NAME).write_text(json.dumps(manifest), encoding='utf-8')
+
+    assert ChebyshevEphemeris.open(stale) is None
+    assert 'reconstrua' in capsys.readouterr().err
+    assert ChebyshevEphemeris.open(tmp_path / 'missing') is None
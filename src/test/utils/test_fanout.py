@@ -0,0 +1,63 @@
+"""Agrupamento de assinantes por variante do PDF (pdf-generator.py)"""
+
+import datetime
+
+import pytest
+
+from aurora_pdf import generator
+
+group_subscribers = generator.group_subscribers
+variant_id = generator.variant_id
+variant_options = generator.variant_options
+
+DEFAULT_VARIANT = {'hemisphere': 'south', 'language': 'pt-BR',
+                   'includeMansions': True, 'includeCorrespondences': True}
+
+
+def test_variant_options_defaults():
+    assert variant_options(None) == DEFAULT_VARIANT
+    assert variant_options({}) == DEFAULT_VARIANT
+
+
+def test_variant_ignores_options_without_effect():
+    # Sem seção de hinos e sem textos em inglês: o PDF é o mesmo
+    assert variant_options({'includeHymns': False, 'language': 'en-US'}) == DEFAULT_VARIANT
+    north = variant_options({'hemisphere': 'north', 'includeMansions': False})
+    assert north == {**DEFAULT_VARIANT, 'hemisphere': 'north', 'includeMansions': False}
+    assert variant_id(north) == variant_id(dict(reversed(list(north.items()))))
+    assert variant_id(north) != variant_id(DEFAULT_VARIANT)
+
+
+@pytest.mark.parametrize('options', [
+    {'font': 'Comic'},
+    {'includeMansions': 'sim'},
+    {'language': 'fr-FR'},
+    {'hemisphere': 'east'},
+    ['pt-BR'],
+])
+def test_variant_rejects_invalid_options(options):
+    with pytest.raises(ValueError):
+        variant_options(options)
+
+
+def test_group_subscribers():
+    groups, errors = group_subscribers({
+        'ana': None,
+        'bia': {'language': 'en-US', 'includeHymns': False},
+        'caio': {'hemisphere': 'north'},
+        'davi': {'hemisphere': 'east'},
+        'eva': {'hemisphere': 'north', 'includeHymns': True},
+    })
+    assert {key: group['subscribers'] for key, group in groups.items()} == {
+        variant_id(DEFAULT_VARIANT): ['ana', 'bia'],
+        variant_id({**DEFAULT_VARIANT, 'hemisphere': 'north'}): ['caio', 'eva'],
+    }
+    assert all(group['options'] == variant_options(group['options']) for group in groups.values())
+    assert list(errors) == ['davi']
+    assert errors['davi']['success'] is False
+    assert errors['davi']['error'].startswith('Opções inválidas: Hemisfério desconhecido')
+
+
+def test_fanout_filename():
+    name = generator.fanout_filename(datetime.date(2025, 3, 20), variant_id(DEFAULT_VARIANT))
+    assert name == f"aurora_sagrada_20250320_{variant_id(DEFAULT_VARIANT)}.pdf"
@@ -0,0 +1,31 @@
+"""Favorabilidade dos temas no relatório diário (pdf-generator.py) na escala do motor de eleições"""
+
+import datetime
+from collections import Counter
+
+import pytest
+
+from aurora_pdf import generator
+
+
+@pytest.fixture(scope='module')
+def report(data_dir):
+    return generator.AuroraReportGenerator(str(data_dir))
+
+
+def test_labels_follow_min_score(report):
+    min_score = round(report.elections.min_score * 100)
+    assert report._get_favorability_text(2 * min_score) == 'Excelente'
+    assert report._get_favorability_text(min_score) == 'Favorável'
+    assert report._get_favorability_text(min_score - 1) == 'Neutro'
+    assert report._get_favorability_text(0) == 'Desfavorável'
+
+
+def test_labels_spread_over_a_year(report):
+    counts = Counter()
+    for day in range(365):
+        scores = report._calculate_theme_scores(datetime.date(2025, 1, 1) + datetime.timedelta(days=day))
+        counts.update(report._get_favorability_text(score) for score in scores.values())
+    total = sum(counts.values())
+    assert set(counts) == {'Excelente', 'Favorável', 'Neutro', 'Desfavorável'}
+    assert counts['Desfavorável'] < total / 2
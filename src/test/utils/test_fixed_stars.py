@@ -0,0 +1,76 @@
+"""Estrelas fixas (fixed_stars.py): volta 0°/360°, orbe de cada ponto e precessão"""
+
+import json
+
+import numpy as np
+import pytest
+
+from fixed_stars import FixedStarIndex, general_precession, parse_longitude
+
+J2000 = 2451545.0
+
+
+@pytest.fixture
+def index(tmp_path):
+    catalog = {
+        'configuracao': {'orbe_padrao': 2, 'incluir_algol': False},
+        'estrelas_fixas': {
+            'fim': {'nome': 'Fim', 'longitude_2000': "29°30' Peixes", 'orbe': 1},
+            'inicio': {'nome': 'Início', 'longitude_2000': "0°30' Áries"},
+            'estreita': {'nome': 'Estreita', 'longitude_2000': "10° Áries", 'orbe': 0.5},
+            'algol': {'nome': 'Algol', 'longitude_2000': "26°10' Touro"},
+        },
+    }
+    (tmp_path / 'estrelas-fixas.json').write_text(json.dumps(catalog, ensure_ascii=False), encoding='utf-8')
+    return FixedStarIndex(tmp_path)
+
+
+def matched(index, jd, longitude):
+    found = index.matches(jd, longitude)
+    return {index.points[point]['key']: round(float(separation), 6)
+            for point, separation in zip(found['points'], found['separations'])}
+
+
+def test_parse_longitude():
+    assert parse_longitude("29°50' Leão") == pytest.approx(149.0 + 50.0 / 60.0)
+    assert parse_longitude("10° Áries") == 10.0
+    with pytest.raises(ValueError):
+        parse_longitude("10° Ofiúco")
+
+
+def test_catalog_configuration(index, tmp_path):
+    assert [point['key'] for point in index.points] == ['inicio', 'estreita', 'fim']
+    assert [point['orb'] for point in index.points] == [2.0, 0.5, 1.0]
+    assert len(FixedStarIndex(tmp_path, include_all=True)) == 4
+
+
+def test_matches_across_wrap(index):
+    assert matched(index, J2000, 359.9) == {'fim': 0.4, 'inicio': -0.6}
+    assert matched(index, J2000, 0.1) == {'fim': 0.6, 'inicio': -0.4}
+    assert matched(index, J2000, 358.5) == {'fim': -1.0, 'inicio': -2.0}
+    assert matched(index, J2000, 358.0) == {}
+    assert matched(index, J2000, 1.6) == {'inicio': 1.1}
+
+
+def test_per_point_orbs(index):
+    assert matched(index, J2000, 10.4) == {'estreita': 0.4}
+    assert matched(index, J2000, 10.6) == {}
+    assert matched(index, J2000, 2.4) == {'inicio': 1.9}
+
+
+def test_precession_and_batches(index):
+    jd = J2000 + 36525.0 * 0.25
+    shift = float(general_precession(jd))
+    assert shift == pytest.approx(0.349, abs=0.001)
+    assert matched(index, jd, 10.0 + shift) == {'estreita': 0.0}
+
+    longitudes = np.array([[359.9, 10.4], [357.0, 10.6]])
+    found = index.matches(J2000, longitudes)
+    assert list(found['queries']) == [0, 0, 1]
+    assert index.longitudes_at(J2000) == pytest.approx(index.longitudes)
+
+
+def test_repository_catalog(data_dir):
+    index = FixedStarIndex(data_dir)
+    assert {point['kind'] for point in index.points} == {'estrela'}
+    assert [point['key'] for point in index.points] == ['aldebaran', 'regulus', 'spica', 'antares']
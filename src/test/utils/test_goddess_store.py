@@ -0,0 +1,55 @@
+"""Deusas do dia (goddess_store.py): rodízio dos dias sem registro e o dia 366"""
+
+import datetime
+
+import pytest
+
+from goddess_store import DAYS, GoddessStore, store_path
+
+
+@pytest.fixture
+def store(tmp_path):
+    (tmp_path / 'BasedeDadosdoguiaLunar.js.backup').write_text('''
+        const deusas365Completa = {
+            1: { nome: "Hécate", correspondencias: { cor: "preto", historia: "Senhora das encruzilhadas" } },
+            3: { nome: "Selene" },
+        };
+    ''', encoding='utf-8')
+    (tmp_path / 'BasedeDadosdoguiaLunar.js').write_text('''
+        export const deusas365Completa = { 1: { nome: "Ártemis" }, 2: { nome: "Ísis" } };
+    ''', encoding='utf-8')
+    opened = GoddessStore.open(tmp_path, tmp_path / 'store')
+    yield opened
+    opened.close()
+
+
+def test_sources_merge_with_full_base_first(store, tmp_path):
+    assert store_path(tmp_path, tmp_path / 'store').exists()
+    assert store.record(1) == {'nome': 'Hécate', 'correspondencias': {'cor': 'preto'},
+                               'historia': 'Senhora das encruzilhadas'}
+    assert store.record(2)['nome'] == 'Ísis'
+    assert store.record(3)['nome'] == 'Selene'
+
+
+def test_missing_days_rotate_over_existing(store):
+    names = ['Hécate', 'Ísis', 'Selene']
+    for day in (4, 5, 6, 100, 365):
+        assert store.record(day)['nome'] == names[(day - 1) % 3]
+
+
+def test_day_366(store):
+    assert len(store) == DAYS == 366
+    assert store.record(366)['nome'] == 'Selene'
+    assert store.for_date(datetime.date(2024, 12, 31)) == store.record(366)
+    assert store.for_date(datetime.date(2025, 12, 31)) == store.record(365)
+    for day in (0, 367):
+        with pytest.raises(KeyError):
+            store.record(day)
+
+
+def test_repository_store(data_dir, tmp_path):
+    store = GoddessStore.open(data_dir, tmp_path)
+    try:
+        assert all(store.record(day).get('nome') for day in (1, 290, 366))
+    finally:
+        store.close()
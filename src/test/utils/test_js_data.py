@@ -0,0 +1,91 @@
+"""Bases JavaScript (js_data.py): formas de declaração de data/ e snapshots"""
+
+import os
+import shutil
+
+import pytest
+
+from js_data import SNAPSHOT_HEADER, load_js_file, parse_js, snapshot_path
+
+
+def test_declaration_forms():
+    source = '''
+        export const deusas = { 1: { nome: "Hécate" }, 2: { nome: 'Selene' } };
+        let fases = ["Nova", `Crescente`], ignorada = calcular(1);
+        const pesos: Record<string, number> = { sol: 1.5, lua: -2 };
+        export function dia(n) { const interna = { x: 1 }; return interna; }
+        export default { deusas, fases };
+    '''
+    data = parse_js(source)
+    assert data['deusas'] == {1: {'nome': 'Hécate'}, 2: {'nome': 'Selene'}}
+    assert data['fases'] == ['Nova', 'Crescente']
+    assert data['pesos'] == {'sol': 1.5, 'lua': -2}
+    assert 'ignorada' not in data and 'interna' not in data
+    assert data['default'] == {'deusas': data['deusas'], 'fases': data['fases']}
+
+
+def test_stray_pairs_and_mismatched_closers():
+    data = parse_js('''
+        const casa = {
+            planetas: { sol: "Foco", lua: "Emoção" ],
+            aspectos: [ "Mercúrio rege", "Saturno ensina" },
+            regentes: [ sol: "Leão", lua: "Câncer" ],
+            fim: true
+        };
+    ''')
+    assert data['casa'] == {
+        'planetas': {'sol': 'Foco', 'lua': 'Emoção'},
+        'aspectos': ['Mercúrio rege', 'Saturno ensina'],
+        'regentes': {'sol': 'Leão', 'lua': 'Câncer'},
+        'fim': True,
+    }
+
+
+def test_repository_bases(data_dir, tmp_path):
+    current = load_js_file(data_dir / 'BasedeDadosdoguiaLunar.js', tmp_path)
+    assert 1 in current['deusas365Completa']
+    # Propriedade abreviada de função não tem valor literal
+    assert current['default'] == {'deusas365Completa': current['deusas365Completa']}
+
+    # A cópia antiga fecha objetos com ']' (ex.: planetas_na_casa da Casa 6)
+    backup = parse_js((data_dir / 'BasedeDadosdoguiaLunar.js.backup').read_text(encoding='utf-8'))
+    casa = backup['casasAstrologicas']['Casa 6']
+    assert isinstance(casa['planetas_na_casa'], dict) and 'plutao' in casa['planetas_na_casa']
+    assert casa['aspectos_importantes'][0] == 'Mercúrio rege esta casa e é fundamental'
+    assert 'timingLunarPaungger' in backup
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / 'base.js'
+    path.write_text('const base = { versao: 1 };\n', encoding='utf-8')
+    return path
+
+
+def test_snapshot_follows_source(source, tmp_path):
+    snapshots = tmp_path / 'snapshots'
+    assert load_js_file(source, snapshots) == {'base': {'versao': 1}}
+    assert snapshot_path(source, snapshots).exists()
+
+    source.write_text('const base = { versao: 2 };\n', encoding='utf-8')
+    assert load_js_file(source, snapshots) == {'base': {'versao': 2}}
+
+    # Mesmo conteúdo com mtime novo (ex.: checkout): o snapshot continua válido
+    copy = tmp_path / 'copia.js'
+    shutil.copy(source, copy)
+    os.replace(copy, source)
+    assert load_js_file(source, snapshots) == {'base': {'versao': 2}}
+    header = SNAPSHOT_HEADER.unpack(snapshot_path(source, snapshots).read_bytes()[:SNAPSHOT_HEADER.size])
+    assert header[3:5] == (source.stat().st_size, source.stat().st_mtime_ns)
+
+
+def test_corrupt_snapshot_is_rebuilt(source, tmp_path):
+    snapshots = tmp_path / 'snapshots'
+    load_js_file(source, snapshots)
+    path = snapshot_path(source, snapshots)
+    path.write_bytes(path.read_bytes()[:SNAPSHOT_HEADER.size + 3])
+    assert load_js_file(source, snapshots) == {'base': {'versao': 1}}
+
+    path.write_bytes(b'lixo')
+    assert load_js_file(source, snapshots) == {'base': {'versao': 1}}
+    assert path.read_bytes()[:8] == b'AURJSDB2'
@@ -0,0 +1,74 @@
+"""Teoria lunar (lua.py) e períodos de Lua fora de curso (void_of_course.py)"""
+
+import datetime
+
+import numpy as np
+import pytest
+
+from ephemeris import Ephemeris
+from lua import moon_distance, moon_longitude, moon_position
+from void_of_course import ELONGATION_ASPECTS, SIGNS, VoidOfCourseTimeline
+
+# Meeus, exemplo 47.a: 1992-04-12 0h TD
+MEEUS_47A_JDE = 2448724.5
+
+
+def test_moon_position_meeus_example_47a():
+    position = moon_position(MEEUS_47A_JDE)
+    assert float(position['longitude']) == pytest.approx(133.162655, abs=1e-6)
+    assert float(position['latitude']) == pytest.approx(-3.229126, abs=1e-6)
+    assert float(position['distance']) == pytest.approx(368409.7, abs=0.1)
+
+
+def test_blocks_match_single_evaluation():
+    # Mais instantes que BLOCK_SIZE: a avaliação em blocos não pode mudar o resultado
+    jde = MEEUS_47A_JDE + np.linspace(0.0, 30.0, 5000)
+    longitudes, distances = moon_longitude(jde), moon_distance(jde)
+    for i in (0, 2047, 2048, 4999):
+        assert longitudes[i] == pytest.approx(float(moon_longitude(jde[i])), abs=1e-9)
+        assert distances[i] == pytest.approx(float(moon_distance(jde[i])), abs=1e-6)
+
+
+@pytest.fixture(scope='module')
+def ephemeris(data_dir):
+    return Ephemeris(data_dir)
+
+
+@pytest.fixture(scope='module')
+def timeline(ephemeris):
+    return VoidOfCourseTimeline(ephemeris)
+
+
+def test_void_of_course_before_libra_ingress_2024_01_03(timeline):
+    # Último aspecto (quadratura a Marte) 22:14 UTC, ingresso em Libra 00:46 UTC
+    period = timeline.period_at(datetime.datetime(2024, 1, 2, 23))
+    assert period is not None
+    assert period['sign'] == 'Libra'
+    assert period['body'] == 'Marte'
+    assert abs(period['start'] - datetime.datetime(2024, 1, 2, 22, 14)) < datetime.timedelta(minutes=5)
+    assert abs(period['end'] - datetime.datetime(2024, 1, 3, 0, 46)) < datetime.timedelta(minutes=5)
+    assert timeline.period_at(datetime.datetime(2024, 1, 2, 21)) is None
+
+
+def test_void_of_course_intervals_are_consistent(timeline, ephemeris):
+    periods = timeline.periods_between(datetime.datetime(2024, 1, 1), datetime.datetime(2024, 3, 1))
+    assert len(periods) > 15
+    for period, following in zip(periods, periods[1:]):
+        assert period['start_jd'] < period['end_jd'] <= following['start_jd']
+
+    for period in periods:
+        moon = float(ephemeris.longitudes(period['end_jd'], ['Lua'])['Lua'])
+        # Termina no ingresso (longitude múltipla de 30°) no signo anunciado
+        assert min(moon % 30.0, 30.0 - moon % 30.0) < 1e-4
+        assert SIGNS[int(round(moon / 30.0)) % 12] == period['sign']
+        if period['body'] is not None:
+            # Começa num aspecto exato ao planeta informado
+            longitudes = ephemeris.longitudes(period['start_jd'], ['Lua', period['body']])
+            elongation = float(np.mod(longitudes['Lua'] - longitudes[period['body']], 360.0))
+            assert min(abs((elongation - angle + 180.0) % 360.0 - 180.0) for angle, _ in ELONGATION_ASPECTS) < 1e-4
+
+    inside = [(period['start_jd'] + period['end_jd']) / 2.0 for period in periods]
+    outside = [following['start_jd'] - 1e-3 for period, following in zip(periods, periods[1:])
+               if following['start_jd'] - period['end_jd'] > 1e-3]
+    assert timeline.is_void(np.array(inside)).all()
+    assert not timeline.is_void(np.array(outside)).any()
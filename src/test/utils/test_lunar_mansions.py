@@ -0,0 +1,63 @@
+"""Mansões lunares (lunar_mansions.py): ingressos contra a longitude da Lua"""
+
+import datetime
+
+import numpy as np
+import pytest
+
+from astro_lib import to_julian_day
+from ephemeris import Ephemeris
+from lunar_mansions import MANSION_COUNT, LunarMansionTimeline, mansion_boundaries
+
+
+@pytest.fixture(scope='module')
+def timeline(data_dir):
+    return LunarMansionTimeline(Ephemeris(data_dir), data_dir)
+
+
+def expected_mansions(timeline, jd):
+    """Mansão pela longitude da Lua calculada diretamente"""
+    longitude = timeline.moon_longitude(jd)
+    return np.searchsorted(timeline.boundaries, longitude, side='right')
+
+
+def test_boundaries_from_base():
+    starts = mansion_boundaries({'1': {'numero': 1, 'grausInicio': 0}, 'x': {'numero': 3, 'grausInicio': 26.0},
+                                 '40': {'grausInicio': 1.0}})
+    assert len(starts) == MANSION_COUNT
+    assert starts[2] == 26.0
+    assert starts[1] == pytest.approx(360.0 / MANSION_COUNT)
+
+
+def test_ingresses_cross_boundaries(timeline):
+    year = timeline.year(2025)
+    times, mansions = year['times'], year['mansions']
+    assert 360 < len(times) < 390
+    assert np.all(np.diff(times) > 0)
+    # Cada ingresso leva à mansão seguinte (a Lua não retrograda)
+    previous = np.concatenate([[year['initial']], mansions[:-1]])
+    assert np.all(mansions == previous % MANSION_COUNT + 1)
+    error = np.abs((timeline.moon_longitude(times) - timeline.boundaries[mansions - 1] + 180.0) % 360.0 - 180.0)
+    assert error.max() < 1e-4
+
+
+def test_mansions_at_matches_moon_longitude(timeline):
+    jd = to_julian_day(datetime.datetime(2025, 1, 1)) + np.linspace(0.0, 364.9, 5000)
+    assert np.array_equal(timeline.mansions_at(jd), expected_mansions(timeline, jd))
+
+
+def test_queries_across_year_end(timeline):
+    start = datetime.datetime(2025, 12, 28)
+    end = datetime.datetime(2026, 1, 4)
+    ingresses = timeline.ingresses_between(start, end)
+    assert ingresses[0]['instant'].year == 2025 and ingresses[-1]['instant'].year == 2026
+    assert ingresses[0] == timeline.next_ingress(start)
+    for ingress in ingresses:
+        assert timeline.mansion_at(ingress['instant'] + datetime.timedelta(minutes=1)) == ingress['mansion']
+
+    first = to_julian_day(datetime.datetime(2026, 1, 1))
+    assert timeline.mansion_at(datetime.datetime(2026, 1, 1)) == int(expected_mansions(timeline, first))
+    assert timeline.year(2026)['initial'] == timeline.mansion_at(datetime.datetime(2026, 1, 1))
+
+    timeline.release(2026)
+    assert 2025 not in timeline._years and 2026 in timeline._years
@@ -0,0 +1,57 @@
+"""Fases principais e luas especiais de lunar_phases.py contra horários publicados"""
+
+import datetime
+
+import pytest
+
+from ephemeris import Ephemeris
+from lunar_phases import FULL_MOON, NEW_MOON, LunarPhaseIndex
+
+# Desvio aceito em relação aos horários publicados (UTC, arredondados ao minuto)
+TOLERANCE = datetime.timedelta(minutes=2)
+
+
+@pytest.fixture(scope='module')
+def phases(data_dir):
+    return LunarPhaseIndex(Ephemeris(data_dir))
+
+
+def test_january_2024_new_and_full_moon(phases):
+    events = phases.events_between(datetime.datetime(2024, 1, 1), datetime.datetime(2024, 2, 1),
+                                   kinds=[NEW_MOON, FULL_MOON])
+    assert [event['name'] for event in events] == ['Lua Nova', 'Lua Cheia']
+    new_moon, full_moon = events
+    assert abs(new_moon['instant'] - datetime.datetime(2024, 1, 11, 11, 57)) < TOLERANCE
+    assert abs(full_moon['instant'] - datetime.datetime(2024, 1, 25, 17, 54)) < TOLERANCE
+
+
+def test_phase_sequence_is_ordered(phases):
+    events = phases.events_between(datetime.datetime(2024, 1, 1), datetime.datetime(2025, 1, 1))
+    kinds = [event['kind'] for event in events]
+    assert all((b - a) % 4 == 1 for a, b in zip(kinds, kinds[1:]))
+    assert [event['instant'] for event in events] == sorted(event['instant'] for event in events)
+
+
+def test_next_and_previous_event(phases):
+    moment = datetime.datetime(2024, 1, 20)
+    assert phases.next_event(moment, FULL_MOON)['instant'].date() == datetime.date(2024, 1, 25)
+    assert phases.previous_event(moment, NEW_MOON)['instant'].date() == datetime.date(2024, 1, 11)
+
+
+def test_blue_moon_august_2023(phases):
+    blue_moons = phases.blue_moons(2023)
+    assert len(blue_moons) == 1
+    assert abs(blue_moons[0]['instant'] - datetime.datetime(2023, 8, 31, 1, 36)) < TOLERANCE
+    assert phases.is_blue_moon(datetime.date(2023, 8, 31))
+    assert not phases.is_blue_moon(datetime.date(2023, 8, 1))
+
+
+def test_august_2023_full_moons_are_supermoons(phases):
+    assert phases.is_supermoon(datetime.date(2023, 8, 1))
+    assert phases.is_supermoon(datetime.date(2023, 8, 31))
+    assert not phases.is_supermoon(datetime.date(2024, 1, 25))
+
+
+def test_phase_at(phases):
+    assert phases.phase_at(datetime.datetime(2024, 1, 11, 12)) == 'Nova'
+    assert phases.phase_at(datetime.datetime(2024, 1, 25, 18)) == 'Cheia'
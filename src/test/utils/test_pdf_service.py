@@ -0,0 +1,28 @@
+"""Serviço de PDF (pdf_service.py): recuperação do pool de renderização"""
+
+import os
+import signal
+import asyncio
+
+from pdf_service import PDFService
+
+
+def test_render_recovers_from_dead_worker(data_dir, tmp_path):
+    async def scenario():
+        service = PDFService(data_dir, tmp_path / 'pdfs', workers=1, reload_interval=3600)
+        await service.start()
+        try:
+            loop = asyncio.get_running_loop()
+            pid = await loop.run_in_executor(service._executor, os.getpid)
+            os.kill(pid, signal.SIGKILL)
+            await asyncio.sleep(0.5)
+
+            status, response = await service.generate({'date': '2025-03-20'})
+            assert status == 200, response
+            assert (tmp_path / 'pdfs' / response['filename']).stat().st_size > 0
+            assert service.stats['pool_restarts'] == 1
+            assert service.status()['available']
+        finally:
+            await service.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,99 @@
+"""Horas planetárias (planetary_hours.py): nascer/pôr, cache por local arredondado e CLI"""
+
+import datetime
+import sys
+
+import pytest
+
+import planetary_hours
+from ephemeris import Ephemeris
+from planetary_hours import CHALDEAN_ORDER, PlanetaryHoursCalculator
+
+EQUINOX = datetime.date(2025, 3, 20)
+SOLSTICE = datetime.date(2025, 6, 21)
+SAO_PAULO = (-23.5505, -46.6333)
+LONDON = (51.5074, -0.1278)
+
+
+@pytest.fixture
+def calculator(data_dir):
+    return PlanetaryHoursCalculator(Ephemeris(data_dir), max_entries=4)
+
+
+def minutes(moment: datetime.datetime) -> int:
+    return moment.hour * 60 + moment.minute
+
+
+def test_sunrise_sunset(calculator):
+    sao_paulo = calculator.hours_for(EQUINOX, *SAO_PAULO)
+    assert abs(minutes(sao_paulo['sunrise']) - (9 * 60 + 10)) <= 2
+    assert abs(minutes(sao_paulo['sunset']) - (21 * 60 + 18)) <= 2
+    london = calculator.hours_for(SOLSTICE, *LONDON)
+    assert abs(minutes(london['sunrise']) - (3 * 60 + 43)) <= 2
+    assert abs(minutes(london['sunset']) - (20 * 60 + 21)) <= 2
+
+
+def test_hours_follow_chaldean_order(calculator):
+    day = calculator.hours_for(EQUINOX, *SAO_PAULO)
+    assert day['day_ruler'] == 'Jupiter' == day['hours'][0]['planet']
+    planets = [hour['planet'] for hour in day['hours']]
+    start = CHALDEAN_ORDER.index('Jupiter')
+    assert planets == [CHALDEAN_ORDER[(start + i) % 7] for i in range(24)]
+    assert all(a['end'] == b['start'] for a, b in zip(day['hours'], day['hours'][1:]))
+    assert [hour['day'] for hour in day['hours']] == [True] * 12 + [False] * 12
+    # A última hora da noite termina no nascer seguinte
+    assert day['hours'][-1]['end'] == calculator.hours_for(EQUINOX + datetime.timedelta(days=1), *SAO_PAULO)['sunrise']
+
+
+def test_polar_day_has_no_hours(calculator):
+    day = calculator.hours_for(SOLSTICE, 80.0, 0.0)
+    assert day['hours'] == [] and day['sunrise'] is None
+    assert calculator.hour_at(datetime.datetime(2025, 6, 21, 12), 80.0, 0.0) is None
+
+
+def test_cache_buckets_nearby_locations(calculator):
+    assert PlanetaryHoursCalculator.bucket(-23.5505, -46.6333) == (-23.55, -46.63)
+    first = calculator.hours_for(EQUINOX, *SAO_PAULO)
+    assert calculator.hours_for(EQUINOX, -23.553, -46.628) is first
+    assert calculator.hours_for(EQUINOX, -23.57, -46.6333) is not first
+    assert len(calculator._cache) == 2
+
+
+def test_cache_is_lru(calculator):
+    dates = [EQUINOX + datetime.timedelta(days=i) for i in range(3)]
+    table = calculator.table(dates, [SAO_PAULO, LONDON])
+    assert len(table) == 3 and len(table[0]) == 2
+    assert table[0][1]['hours'][0]['planet'] == 'Jupiter'
+    assert len(calculator._cache) == 4
+    # Os dois primeiros dias-local (menos recentes) foram despejados
+    remaining = [key[2] for key in calculator._cache]
+    assert dates[0] not in remaining
+    calculator.hours_for(dates[2], *SAO_PAULO)
+    assert list(calculator._cache)[-1] == PlanetaryHoursCalculator.bucket(*SAO_PAULO) + (dates[2],)
+
+
+def test_hour_at(calculator):
+    day = calculator.hours_for(EQUINOX, *SAO_PAULO)
+    third = day['hours'][2]
+    assert calculator.hour_at(third['start'] + datetime.timedelta(minutes=1), *SAO_PAULO) == third
+    # Antes do nascer ainda é a noite do dia anterior
+    early = calculator.hour_at(day['sunrise'] - datetime.timedelta(minutes=1), *SAO_PAULO)
+    assert early == calculator.hours_for(EQUINOX - datetime.timedelta(days=1), *SAO_PAULO)['hours'][-1]
+
+
+def test_cli_location(data_dir, monkeypatch, capsys):
+    monkeypatch.setattr(sys, 'argv', ['planetary_hours.py', '--date', '2025-06-21', '--data-dir', str(data_dir),
+                                      '--lat', str(LONDON[0]), '--lon', str(LONDON[1])])
+    planetary_hours.main()
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == 'Regente do dia: Saturno'
+    assert lines[1].split()[2].startswith('03:4')
+
+    monkeypatch.setattr(sys, 'argv', ['planetary_hours.py', '--date', '2025-03-20', '--data-dir', str(data_dir)])
+    planetary_hours.main()
+    assert capsys.readouterr().out.splitlines()[1].split()[2].startswith('09:1')
+
+    monkeypatch.setattr(sys, 'argv', ['planetary_hours.py', '--date', '2025-06-21', '--data-dir', str(data_dir),
+                                      '--lat', '80', '--lon', '0'])
+    planetary_hours.main()
+    assert capsys.readouterr().out.splitlines()[-1] == 'Sem nascer ou pôr do Sol nesta data e latitude'
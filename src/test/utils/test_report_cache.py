@@ -0,0 +1,63 @@
+"""Cache de relatórios (report_cache.py): despejo LRU, faltas e varredura única por render"""
+
+import datetime
+import io
+import os
+
+import pytest
+
+from aurora_pdf import generator
+from report_cache import ReportCache
+
+DATE = datetime.date(2025, 3, 20)
+
+
+@pytest.fixture
+def cache(tmp_path, data_dir):
+    return ReportCache(tmp_path / 'cache', data_dir, max_bytes=100)
+
+
+def test_evict_removes_least_recent(cache):
+    old = cache.write('old', b'x' * 60)
+    os.utime(old, (1, 1))
+    new = cache.write('new', b'y' * 60)
+    assert new.exists() and not old.exists()
+    assert cache.counters['evictions'] == 1
+
+
+def test_add_keeps_entry_larger_than_cache(cache):
+    path = cache.write('big', b'z' * 500)
+    assert path.exists()
+    assert cache.counters['evictions'] == 0
+    with cache.open('big') as f:
+        assert f.read() == b'z' * 500
+
+
+def test_open_after_eviction_is_a_miss(cache):
+    cache.write('gone', b'pdf')
+    cache.path('gone').unlink()
+    assert cache.open('gone') is None
+    assert cache.counters['misses'] == 1
+
+
+def test_open_file_survives_eviction(cache):
+    cache.write('kept', b'pdf')
+    f = cache.open('kept')
+    cache.path('kept').unlink()
+    with f:
+        assert f.read() == b'pdf'
+
+
+def test_render_fingerprints_inputs_once(data_dir, tmp_path, monkeypatch):
+    report = generator.AuroraReportGenerator(str(data_dir), cache_dir=str(tmp_path / 'cache'))
+    calls = []
+    fingerprint = report.cache.inputs_fingerprint
+    monkeypatch.setattr(report.cache, 'inputs_fingerprint', lambda: calls.append(1) or fingerprint())
+
+    first = io.BytesIO()
+    report.render_daily_report(DATE, first)
+    assert len(calls) == 1 and report.cache.counters['puts'] == 1
+
+    second = b''.join(report.iter_daily_report(DATE))
+    assert len(calls) == 2 and report.cache.counters['hits'] == 1
+    assert second == first.getvalue()
@@ -0,0 +1,89 @@
+"""Subconjuntos compactos de report_fonts.py, lidos de volta de um PDF com o pypdf"""
+
+import struct
+from io import BytesIO
+
+import pytest
+from pypdf import PdfReader
+from reportlab.pdfgen import canvas
+
+from report_fonts import (HINTING_TABLES, MORE_COMPONENTS, WE_HAVE_INSTRUCTIONS, _checksum, _tables,
+                          register_fonts)
+
+# Acentos (glifos compostos no DejaVu Sans) e símbolos
+SAMPLE = 'Ação de graças à Deusa Hécate ☽ ♀'
+
+
+@pytest.fixture(scope='module')
+def embedded_font():
+    fonts = register_fonts()
+    if not fonts.embedded:
+        pytest.skip('nenhuma fonte TrueType instalada')
+    buffer = BytesIO()
+    pdf = canvas.Canvas(buffer)
+    pdf.setFont(fonts['regular'], 12)
+    pdf.drawString(72, 720, SAMPLE)
+    pdf.save()
+
+    reader = PdfReader(BytesIO(buffer.getvalue()))
+    for font in reader.pages[0]['/Resources']['/Font'].values():
+        descriptor = font.get_object().get('/FontDescriptor')
+        if descriptor is not None and '/FontFile2' in descriptor.get_object():
+            return reader, descriptor.get_object()['/FontFile2'].get_object().get_data()
+    pytest.fail('fonte não embutida')
+
+
+def _glyphs(font: bytes):
+    tables = _tables(font)
+    count = struct.unpack('>H', tables['maxp'][4:6])[0]
+    long_offsets = struct.unpack('>h', tables['head'][50:52])[0]
+    loca = tables['loca']
+    if long_offsets:
+        offsets = struct.unpack(f'>{count + 1}I', loca)
+    else:
+        offsets = [2 * offset for offset in struct.unpack(f'>{count + 1}H', loca)]
+    assert list(offsets) == sorted(offsets) and offsets[-1] <= len(tables['glyf'])
+    return [tables['glyf'][start:end] for start, end in zip(offsets, offsets[1:])]
+
+
+def test_subset_is_valid_sfnt(embedded_font):
+    _, font = embedded_font
+    count = struct.unpack('>H', font[4:6])[0]
+    for i in range(count):
+        tag, checksum, offset, length = struct.unpack('>4sIII', font[12 + 16 * i:28 + 16 * i])
+        data = font[offset:offset + length]
+        if tag == b'head':
+            data = data[:8] + b'\0\0\0\0' + data[12:]
+        assert _checksum(data) == checksum, tag
+    assert _checksum(font) == 0xB1B0AFBA
+    assert not set(HINTING_TABLES) & set(_tables(font))
+
+
+def test_no_glyph_keeps_instructions(embedded_font):
+    _, font = embedded_font
+    composites = 0
+    for glyph in _glyphs(font):
+        if len(glyph) < 10:
+            continue
+        contours = struct.unpack('>h', glyph[:2])[0]
+        if contours >= 0:
+            at = 10 + 2 * contours
+            assert struct.unpack('>H', glyph[at:at + 2])[0] == 0
+            continue
+        composites += 1
+        at = 10
+        while True:
+            flags = struct.unpack('>H', glyph[at:at + 2])[0]
+            assert not flags & WE_HAVE_INSTRUCTIONS
+            at += 4 + (4 if flags & 0x0001 else 2) + (2 if flags & 0x0008 else 4 if flags & 0x0040 else
+                                                      8 if flags & 0x0080 else 0)
+            if not flags & MORE_COMPONENTS:
+                break
+        assert len(glyph) - at < 4  # só o alinhamento a 4 bytes
+    assert composites
+
+
+def test_text_round_trips(embedded_font):
+    reader, _ = embedded_font
+    text = reader.pages[0].extract_text()
+    assert 'Ação de graças à Deusa Hécate' in text
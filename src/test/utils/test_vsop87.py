@@ -0,0 +1,63 @@
+"""Posições do motor VSOP87A (vsop87.py) contra valores publicados"""
+
+import os
+import shutil
+import datetime
+
+import numpy as np
+import pytest
+
+from astro_lib import to_julian_day
+from vsop87 import (VSOP87Engine, _read_header, compile_vsop87_file, compiled_path, is_compiled_current,
+                    load_compiled_table, parse_vsop87_file)
+
+# 2024-01-01 0h TT
+JDE_2024 = to_julian_day(datetime.datetime(2024, 1, 1))
+
+
+@pytest.fixture(scope='module')
+def engine(data_dir):
+    return VSOP87Engine(data_dir / 'vsop87')
+
+
+def test_sun_meeus_example_25b(engine):
+    # Meeus, exemplo 25.b: 1992-10-13 0h TD, L = 199.907372° (VSOP87 completa, equinócio da data)
+    assert float(engine.geocentric_longitude('Sol', 2448908.5)) == pytest.approx(199.907372, abs=2e-4)
+
+
+def test_sun_and_jupiter_2024_01_01(engine):
+    # Longitudes geométricas: Sol em 10° Capricórnio, Júpiter (estacionário) em 5°35' Touro
+    longitudes = engine.geocentric_longitudes(JDE_2024, ['Sol', 'Jupiter'])
+    assert float(longitudes['Sol']) == pytest.approx(280.045, abs=0.01)
+    assert float(longitudes['Jupiter']) == pytest.approx(35.584, abs=0.01)
+
+
+def test_batch_matches_single_evaluation(engine):
+    jd = JDE_2024 + np.arange(0.0, 365.0, 36.5)
+    batch = engine.geocentric_longitudes(jd, ['Sol', 'Marte'])
+    for planet in ('Sol', 'Marte'):
+        single = [float(engine.geocentric_longitude(planet, value)) for value in jd]
+        np.testing.assert_allclose(batch[planet], single, atol=1e-9)
+
+
+def test_compiled_table_matches_text(data_dir, tmp_path):
+    source = data_dir / 'vsop87' / 'VSOP87A.mer'
+    target = compile_vsop87_file(source, tmp_path / 'VSOP87A.mer.bin')
+    compiled, parsed = load_compiled_table(target), parse_vsop87_file(source)
+    for variable, powers in parsed.items():
+        for compiled_terms, parsed_terms in zip(compiled[variable], powers):
+            np.testing.assert_array_equal(compiled_terms, parsed_terms)
+
+
+def test_header_stamp_refreshed_when_checksum_matches(data_dir, tmp_path):
+    source = tmp_path / 'VSOP87A.mer'
+    shutil.copy(data_dir / 'vsop87' / 'VSOP87A.mer', source)
+    target = compile_vsop87_file(source, compiled_path(source))
+    # Mesmo conteúdo com outro mtime (ex.: checkout novo)
+    os.utime(source, ns=(1, 1_000_000_000))
+    assert is_compiled_current(source, target)
+    assert _read_header(target)[3] == source.stat().st_mtime_ns
+
+    with open(source, 'a', encoding='ascii') as f:
+        f.write('\n')
+    assert not is_compiled_current(source, target)
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AURORA SAGRADA - EXPORTAÇÃO DOS DADOS DO ALMANAQUE
+Registros por dia (fase, mansão e correspondências, deusa, estação, scores
+dos temas) ou por hora (fase, mansão, hora planetária, posição da Lua, Lua
+fora de curso) e eventos (fases, esbats de data/esbats.json, ingressos nas
+mansões, períodos de Lua fora de curso) de qualquer intervalo,
+gerados em blocos e escritos à medida que são produzidos em NDJSON, CSV ou
+iCalendar: a memória usada não cresce com o tamanho do intervalo.
+
+    python src/utils/almanac_export.py --from 2025-01-01 --to 2035-12-31 --format ndjson
+    python src/utils/almanac_export.py --from 2025-01-01 --to 2026-12-31 --format ics --output luas.ics
+"""
+
+import io
+import csv
+import sys
+import json
+import heapq
+import bisect
+import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+import numpy as np
+
+from astro_lib import to_julian_day
+from lunar_phases import FULL_MOON, NEW_MOON, PHASE_EVENTS, PHASE_NAMES
+
+FORMATS = ('ndjson', 'csv', 'ics')
+KINDS = ('daily', 'hourly', 'events')
+
+# Dias calculados juntos (arrays vetorizados); só um bloco fica em memória
+CHUNK_DAYS = 32
+
+MONTH_KEYS = ['janeiro', 'fevereiro', 'marco', 'abril', 'maio', 'junho', 'julho',
+              'agosto', 'setembro', 'outubro', 'novembro', 'dezembro']
+
+# Colunas do CSV por tipo de registro (cada tipo de evento usa só parte delas);
+# os scores dos temas (scores.<tema>) vêm depois das colunas diárias
+CSV_COLUMNS = {
+    'daily': ['date', 'weekday', 'phase', 'mansion', 'mansion_name', 'mansion_nature', 'mansion_herbs',
+              'mansion_stones', 'mansion_colors', 'goddess', 'goddess_element', 'goddess_domain', 'season'],
+    'hourly': ['datetime', 'phase', 'mansion', 'moon_longitude', 'moon_latitude', 'moon_distance_km',
+               'moon_speed', 'void_of_course', 'planetary_hour', 'planetary_hour_number'],
+    'events': ['type', 'instant', 'end', 'name', 'description', 'distance_km', 'mansion', 'uses'],
+}
+
+# Hemisférios das opções do gerador -> seções de esbats.json
+ESBAT_HEMISPHERES = {'south': 'sul', 'north': 'norte'}
+
+ICS_PRODID = '-//Aurora Sagrada//Almanaque//PT'
+ICS_LINE_OCTETS = 75
+
+
+def iter_dates(start: datetime.date, end: datetime.date) -> Iterator[datetime.date]:
+    """Datas de start até end, inclusive, sem materializar a lista"""
+    date = start
+    while date <= end:
+        yield date
+        date += datetime.timedelta(days=1)
+
+
+def iter_chunks(start: datetime.date, end: datetime.date, days: int = CHUNK_DAYS) -> Iterator[List[datetime.date]]:
+    """Blocos consecutivos de até days datas"""
+    chunk = []
+    for date in iter_dates(start, end):
+        chunk.append(date)
+        if len(chunk) == days:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iso_utc(moment: datetime.datetime) -> str:
+    """Instante UTC ingênuo em ISO 8601 com 'Z' (precisão de segundos)"""
+    return moment.replace(microsecond=0).isoformat() + 'Z'
+
+
+class AlmanacExporter:
+    """Registros e eventos do almanaque calculados sob demanda, bloco a bloco"""
+
+    def __init__(self, generator):
+        """
+        Args:
+            generator: AuroraReportGenerator (bases, estilos e motores carregados
+                sob demanda); o hemisfério das opções dele vale para as estações
+                e para os nomes das luas cheias
+        """
+        self.generator = generator
+        self.esbats = generator.bases_data.get('esbats.json', {})
+        config = self.esbats.get('configuracao', {})
+        self.include_new_moon = config.get('incluir_lua_nova', True)
+
+    def _release(self, year: int):
+        """Descarta os índices anuais que um percurso em ordem não usa mais"""
+        self.generator.lunar_phases.release(year - 1)
+        self.generator.lunar_mansions.release(year - 1)
+        self.generator.void_of_course.release(year - 1)
+
+    def daily_records(self, start: datetime.date, end: datetime.date) -> Iterator[Dict[str, Any]]:
+        """Um registro por dia (fatos do relatório diário, ao meio-dia UTC)"""
+        generator = self.generator
+        for chunk in iter_chunks(start, end):
+            jd = to_julian_day(chunk[0]) + np.arange(len(chunk))
+            phases = generator.lunar_phases.phases_at(jd)
+            mansions = generator.lunar_mansions.mansions_at(jd)
+            scores = generator.elections.scores(jd)
+            for i, date in enumerate(chunk):
+                mansion = generator.get_lunar_mansion_data(int(mansions[i]))
+                correspondences = mansion.get('correspondencias', {})
+                goddess = generator.get_goddess_of_day(date)
+                yield {
+                    'date': date.isoformat(),
+                    'weekday': date.strftime('%A'),
+                    'phase': PHASE_NAMES[phases[i]],
+                    'mansion': int(mansions[i]),
+                    'mansion_name': mansion.get('nome'),
+                    'mansion_nature': mansion.get('natureza'),
+                    'mansion_herbs': correspondences.get('ervas', []),
+                    'mansion_stones': correspondences.get('pedras', []),
+                    'mansion_colors': correspondences.get('cores', []),
+                    'goddess': goddess.get('nome'),
+                    'goddess_element': goddess.get('elemento'),
+                    'goddess_domain': goddess.get('dominio'),
+                    'season': generator._get_season(date),
+                    'scores': {theme: int(round(float(score[i]) * 100)) for theme, score in scores.items()},
+                }
+            self._release(chunk[-1].year)
+
+    def hourly_records(self, start: datetime.date, end: datetime.date) -> Iterator[Dict[str, Any]]:
+        """Um registro por hora UTC (fase, mansão, Lua e hora planetária do local do gerador)"""
+        generator = self.generator
+        location = (generator.location['latitude'], generator.location['longitude'])
+        for chunk in iter_chunks(start, end):
+            midnight = to_julian_day(datetime.datetime.combine(chunk[0], datetime.time()))
+            jd = midnight + np.arange(len(chunk) * 24) / 24.0
+            phases = generator.lunar_phases.phases_at(jd)
+            mansions = generator.lunar_mansions.mansions_at(jd)
+            moon = generator.ephemeris.moon(jd)
+            void = generator.void_of_course.is_void(jd)
+
+            # Horas planetárias do bloco e do dia anterior (noite que atravessa 0h UTC)
+            days = [chunk[0] - datetime.timedelta(days=1)] + chunk
+            hours = [hour for row in generator.planetary_hours.table(days, [location]) for hour in row[0]['hours']]
+            starts = [hour['start'] for hour in hours]
+
+            for i in range(len(jd)):
+                moment = datetime.datetime.combine(chunk[i // 24], datetime.time(i % 24))
+                j = bisect.bisect_right(starts, moment) - 1
+                hour = hours[j] if j >= 0 and moment < hours[j]['end'] else None
+                yield {
+                    'datetime': iso_utc(moment),
+                    'phase': PHASE_NAMES[phases[i]],
+                    'mansion': int(mansions[i]),
+                    'moon_longitude': round(float(moon['longitude'][i]), 4),
+                    'moon_latitude': round(float(moon['latitude'][i]), 4),
+                    'moon_distance_km': round(float(moon['distance'][i])),
+                    'moon_speed': round(float(moon['speed'][i]), 4),
+                    'void_of_course': bool(void[i]),
+                    'planetary_hour': hour['planet'] if hour else None,
+                    'planetary_hour_number': hour['hour'] if hour else None,
+                }
+            self._release(chunk[-1].year)
+
+    def _esbat(self, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Esbat de uma lua cheia (pelo mês e hemisfério) ou nova"""
+        if event['kind'] == FULL_MOON:
+            month = MONTH_KEYS[event['instant'].month - 1]
+            hemisphere = ESBAT_HEMISPHERES[self.generator.options['hemisphere']]
+            esbat = self.esbats.get(f"hemisferio_{hemisphere}", {}).get(month)
+        elif event['kind'] == NEW_MOON and self.include_new_moon:
+            esbat = self.esbats.get('lua_nova')
+        else:
+            esbat = None
+        if not esbat:
+            return None
+        return {
+            'type': 'esbat',
+            'instant': event['instant'],
+            'name': esbat.get('nome', PHASE_EVENTS[event['kind']]),
+            'description': esbat.get('significado', ''),
+            'uses': esbat.get('usos_magicos', []),
+        }
+
+    def _month_events(self, start: datetime.datetime, end: datetime.datetime) -> List[Dict[str, Any]]:
+        """Eventos de um intervalo curto, em ordem"""
+        phases, esbats = [], []
+        for event in self.generator.lunar_phases.events_between(start, end):
+            phases.append({
+                'type': 'phase',
+                'instant': event['instant'],
+                'name': event['name'],
+                'description': 'Superlua' if event['supermoon'] else '',
+                'distance_km': round(event['distance_km']),
+            })
+            esbat = self._esbat(event)
+            if esbat:
+                esbats.append(esbat)
+        ingresses = [{
+            'type': 'mansion',
+            'instant': ingress['instant'],
+            'name': f"Lua na Mansão {ingress['mansion']}" + (f" ({ingress['name']})" if ingress['name'] else ''),
+            'description': '',
+            'mansion': ingress['mansion'],
+        } for ingress in self.generator.lunar_mansions.ingresses_between(start, end)]
+        voids = [{
+            'type': 'void_of_course',
+            'instant': period['start'],
+            'end': period['end'],
+            'name': f"Lua fora de curso (entra em {period['sign']})",
+            'description': (f"Após {period['aspect']} com {period['body']}" if period['body']
+                            else 'Sem aspectos no signo'),
+        } for period in self.generator.void_of_course.periods_between(start, end) if period['start'] >= start]
+        return list(heapq.merge(phases, esbats, ingresses, voids, key=lambda event: event['instant']))
+
+    def events(self, start: datetime.date, end: datetime.date) -> Iterator[Dict[str, Any]]:
+        """Fases, esbats, ingressos nas mansões e Lua fora de curso de start até end (inclusive), mês a mês"""
+        month = datetime.datetime(start.year, start.month, 1)
+        first = datetime.datetime.combine(start, datetime.time())
+        last = datetime.datetime.combine(end + datetime.timedelta(days=1), datetime.time())
+        while month < last:
+            next_month = (month + datetime.timedelta(days=32)).replace(day=1)
+            for event in self._month_events(max(month, first), min(next_month, last)):
+                if 'end' in event:
+                    event['end'] = iso_utc(event['end'])
+                yield {**event, 'instant': iso_utc(event['instant'])}
+            self._release(month.year)
+            month = next_month
+
+    def columns(self, kind: str) -> List[str]:
+        """Colunas do CSV de um tipo de registro"""
+        if kind not in CSV_COLUMNS:
+            raise ValueError(f"Tipo de exportação desconhecido: {kind}")
+        if kind == 'daily':
+            return CSV_COLUMNS[kind] + [f"scores.{theme}" for theme in self.generator.elections.themes]
+        return list(CSV_COLUMNS[kind])
+
+    def records(self, kind: str, start: datetime.date, end: datetime.date) -> Iterator[Dict[str, Any]]:
+        """Registros do tipo kind ('daily', 'hourly' ou 'events')"""
+        if kind == 'daily':
+            return self.daily_records(start, end)
+        if kind == 'hourly':
+            return self.hourly_records(start, end)
+        if kind == 'events':
+            return self.events(start, end)
+        raise ValueError(f"Tipo de exportação desconhecido: {kind}")
+
+
+def _flatten(record: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+    """Achata dicts aninhados (chave.subchave) e junta listas com '; '"""
+    flat = {}
+    for key, value in record.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, list):
+            flat[f"{prefix}{key}"] = '; '.join(str(item) for item in value)
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def write_ndjson(records: Iterable[Dict[str, Any]], stream: TextIO) -> int:
+    """Um objeto JSON por linha; devolve o número de registros"""
+    count = 0
+    for record in records:
+        stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+        count += 1
+    return count
+
+
+def write_csv(records: Iterable[Dict[str, Any]], stream: TextIO, columns: List[str]) -> int:
+    """
+    CSV com colunas fixas (vazias nos registros sem o campo); devolve o
+    número de registros
+
+    Raises:
+        ValueError: Registro com campo fora de columns
+    """
+    writer = csv.DictWriter(stream, fieldnames=columns, restval='', extrasaction='raise')
+    writer.writeheader()
+    count = 0
+    for record in records:
+        writer.writerow(_flatten(record))
+        count += 1
+    return count
+
+
+def _ics_text(value: str) -> str:
+    """Escapa um valor TEXT do iCalendar (RFC 5545, 3.3.11)"""
+    return (value.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+            .replace('\r\n', '\\n').replace('\n', '\\n'))
+
+
+def _ics_time(value: str) -> str:
+    """Instante ISO UTC ('...Z') no formato DATE-TIME UTC do iCalendar"""
+    return datetime.datetime.fromisoformat(value.rstrip('Z')).strftime('%Y%m%dT%H%M%SZ')
+
+
+def _ics_line(line: str) -> str:
+    """Dobra uma linha de conteúdo em 75 octetos (sem partir caracteres UTF-8)"""
+    parts, current, size = [], '', 0
+    for char in line:
+        width = len(char.encode('utf-8'))
+        if size + width > ICS_LINE_OCTETS:
+            parts.append(current)
+            current, size = ' ', 1
+        current += char
+        size += width
+    parts.append(current)
+    return '\r\n'.join(parts) + '\r\n'
+
+
+def write_ics(events: Iterable[Dict[str, Any]], stream: TextIO,
+              stamp: Optional[datetime.datetime] = None) -> int:
+    """
+    Eventos como VEVENTs de um VCALENDAR (instantâneos, salvo os que têm 'end');
+    devolve o número de eventos
+
+    Args:
+        events: Eventos de AlmanacExporter.events (instant em ISO UTC)
+        stamp: DTSTAMP dos eventos (padrão: agora, UTC)
+    """
+    stamp = (stamp or datetime.datetime.now(datetime.timezone.utc)).strftime('%Y%m%dT%H%M%SZ')
+    for line in ('BEGIN:VCALENDAR', 'VERSION:2.0', f'PRODID:{ICS_PRODID}', 'CALSCALE:GREGORIAN'):
+        stream.write(_ics_line(line))
+    count = 0
+    for event in events:
+        start = _ics_time(event['instant'])
+        lines = [
+            'BEGIN:VEVENT',
+            f"UID:{event['type']}-{start}-{event.get('mansion', '')}@aurora-sagrada",
+            f'DTSTAMP:{stamp}',
+            f'DTSTART:{start}',
+        ]
+        # Eventos instantâneos ficam sem DTEND (RFC 5545, 3.8.2.2: DTEND > DTSTART)
+        if event.get('end'):
+            lines.append(f"DTEND:{_ics_time(event['end'])}")
+        lines += [
+            f"SUMMARY:{_ics_text(event['name'])}",
+            f"CATEGORIES:{event['type'].upper()}",
+        ]
+        description = event.get('description', '')
+        if event.get('uses'):
+            description = f"{description}\nUsos: {', '.join(event['uses'])}"
+        if description:
+            lines.append(f'DESCRIPTION:{_ics_text(description)}')
+        lines.append('END:VEVENT')
+        for line in lines:
+            stream.write(_ics_line(line))
+        count += 1
+    stream.write(_ics_line('END:VCALENDAR'))
+    return count
+
+
+WRITERS = {'ndjson': write_ndjson, 'csv': write_csv, 'ics': write_ics}
+
+
+def export(exporter: AlmanacExporter, kind: str, fmt: str, start: datetime.date, end: datetime.date,
+           stream: TextIO) -> int:
+    """Exporta os registros do tipo kind no formato fmt; devolve quantos foram escritos"""
+    if fmt not in WRITERS:
+        raise ValueError(f"Formato desconhecido: {fmt}")
+    if fmt == 'ics' and kind != 'events':
+        raise ValueError("O formato ics só exporta eventos (--kind events)")
+    if fmt == 'csv':
+        return write_csv(exporter.records(kind, start, end), stream, exporter.columns(kind))
+    return WRITERS[fmt](exporter.records(kind, start, end), stream)
+
+
+def main():
+    """Exporta os dados do almanaque de um intervalo de datas"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Exportação dos dados do almanaque Aurora Sagrada')
+    parser.add_argument('--from', dest='date_from', type=str, required=True, help='Data inicial YYYY-MM-DD')
+    parser.add_argument('--to', dest='date_to', type=str, required=True, help='Data final YYYY-MM-DD (inclusive)')
+    parser.add_argument('--format', type=str, default='ndjson', choices=FORMATS, help='Formato de saída')
+    parser.add_argument('--kind', type=str, choices=KINDS,
+                        help='Registros por dia, por hora ou eventos (padrão: events para ics, senão daily)')
+    parser.add_argument('--output', type=str, default='-', help="Arquivo de saída ('-' para a saída padrão)")
+    parser.add_argument('--hemisphere', type=str, choices=list(ESBAT_HEMISPHERES),
+                        help='Hemisfério das estações e dos nomes das luas (padrão: south)')
+    parser.add_argument('--lat', type=float, help='Latitude das horas planetárias (padrão: São Paulo)')
+    parser.add_argument('--lon', type=float, help='Longitude das horas planetárias (leste positiva)')
+    parser.add_argument('--data-dir', type=str, help='Diretório das bases de dados')
+
+    args = parser.parse_args()
+
+    try:
+        start = datetime.datetime.strptime(args.date_from, '%Y-%m-%d').date()
+        end = datetime.datetime.strptime(args.date_to, '%Y-%m-%d').date()
+    except ValueError:
+        parser.error("Formato de data inválido. Use YYYY-MM-DD")
+    kind = args.kind or ('events' if args.format == 'ics' else 'daily')
+    if args.format == 'ics' and kind != 'events':
+        parser.error("O formato ics só exporta eventos (--kind events)")
+
+    from aurora_pdf import generator
+
+    location = {}
+    if args.lat is not None and args.lon is not None:
+        location = {'latitude': args.lat, 'longitude': args.lon}
+    data_dir = args.data_dir or str(Path(__file__).resolve().parent.parent.parent / 'data')
+    options = {'hemisphere': args.hemisphere} if args.hemisphere else {}
+    exporter = AlmanacExporter(generator.AuroraReportGenerator(data_dir=data_dir, location=location,
+                                                               options=options))
+
+    if args.output == '-':
+        stream = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', newline='')
+        count = export(exporter, kind, args.format, start, end, stream)
+        stream.flush()
+        stream.detach()
+    else:
+        with open(args.output, 'w', encoding='utf-8', newline='') as stream:
+            count = export(exporter, kind, args.format, start, end, stream)
+        print(f"{count} registros exportados: {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AURORA SAGRADA - ASPECTOS AO LONGO DO TEMPO
+Varre as longitudes de todos os corpos numa grade de tempo e encontra, de
+uma vez para todos os pares e aspectos, os intervalos dentro do orbe
+(orbes de data/config.json). Entrada, saída e instantes exatos são
+refinados por regula falsi vetorizada sobre as efemérides; o resultado é uma
+lista de intervalos consultável por data.
+
+    python src/utils/aspects.py --from 2025-01-01 --to 2025-01-31
+"""
+
+import json
+import datetime
+from itertools import combinations
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from astro_lib import from_julian_day, to_julian_day
+from chebyshev import BODIES
+from ephemeris import Ephemeris
+
+# Aspectos ptolomaicos (chaves de eleicoes-magickas.json) e nomes exibidos
+ASPECTS = {'conjuncao': 0.0, 'sextil': 60.0, 'quadratura': 90.0, 'trigono': 120.0, 'oposicao': 180.0}
+ASPECT_NAMES = {'conjuncao': 'conjunção', 'sextil': 'sextil', 'quadratura': 'quadratura',
+                'trigono': 'trígono', 'oposicao': 'oposição'}
+
+# Chaves de orbs em config.json
+CONFIG_ASPECT_KEYS = {'conjuncao': 'conjunction', 'sextil': 'sextile', 'quadratura': 'square',
+                      'trigono': 'trine', 'oposicao': 'opposition'}
+CONFIG_BODY_KEYS = {'Sol': 'sun', 'Lua': 'moon', 'Mercurio': 'mercury', 'Venus': 'venus', 'Marte': 'mars',
+                    'Jupiter': 'jupiter', 'Saturno': 'saturn', 'Urano': 'uranus', 'Netuno': 'neptune'}
+
+# Orbes padrão de aspectos.ts
+DEFAULT_ASPECT_ORBS = {'conjunction': 8, 'sextile': 4, 'square': 6, 'trine': 6, 'opposition': 8}
+
+# Passo da grade (dias): bem menor que o tempo da Lua no menor orbe
+DEFAULT_STEP = 0.125
+
+# Refinamento: precisão em dias (~0,1 s) e limite de iterações
+REFINE_TOLERANCE = 1e-6
+REFINE_ITERATIONS = 40
+
+
+def signed_separation(a, b) -> np.ndarray:
+    """Diferença de longitude a - b em (-180, 180]"""
+    return 180.0 - np.mod(180.0 - (np.asarray(a) - np.asarray(b)), 360.0)
+
+
+def orb_residual(s, angle, orb) -> np.ndarray:
+    """Negativo dentro do orbe: |separação - ângulo| - orbe"""
+    return np.abs(np.abs(s) - angle) - orb
+
+
+def exact_residual(s, angle) -> np.ndarray:
+    """Muda de sinal no aspecto exato (sem as dobras de |s| em 0° e 180°)"""
+    return np.where(angle == 0.0, s,
+                    np.where(angle == 180.0, signed_separation(s, 180.0), np.abs(s) - angle))
+
+
+def load_orbs(data_dir: Path) -> Dict[str, Any]:
+    """Orbes por aspecto e por planeta de config.json (padrões de aspectos.ts)"""
+    orbs = {'aspects': dict(DEFAULT_ASPECT_ORBS), 'planets': {}}
+    path = Path(data_dir) / 'config.json'
+    if path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            config = json.load(f).get('orbs', {})
+        for key, value in config.items():
+            orbs['aspects' if key in DEFAULT_ASPECT_ORBS else 'planets'][key] = float(value)
+    return orbs
+
+
+def pair_orbs(orbs: Dict[str, Any], pairs: Sequence[Tuple[str, str]]) -> np.ndarray:
+    """
+    Orbe de cada par × aspecto: o orbe do aspecto, limitado pelo maior
+    orbe planetário do par
+    """
+    table = np.empty((len(pairs), len(ASPECTS)))
+    for i, (a, b) in enumerate(pairs):
+        planet = max(orbs['planets'].get(CONFIG_BODY_KEYS.get(body), np.inf) for body in (a, b))
+        for j, aspect in enumerate(ASPECTS):
+            table[i, j] = min(orbs['aspects'][CONFIG_ASPECT_KEYS[aspect]], planet)
+    return table
+
+
+def find_aspect_intervals(jd: np.ndarray, longitudes: Dict[str, np.ndarray],
+                          pairs: Sequence[Tuple[str, str]], orbs: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Intervalos dentro do orbe numa grade, para todos os pares e aspectos de uma vez
+
+    Args:
+        jd: Grade de tempo (T)
+        longitudes: Longitude de cada corpo na grade
+        pairs: Pares de corpos (P)
+        orbs: Orbe de cada par × aspecto (P × A)
+
+    Returns:
+        Arrays paralelos por intervalo: 'pair', 'aspect', 'first' e 'last'
+        (índices de grade dentro do orbe; -1/T quando o intervalo já estava
+        aberto no início ou segue aberto no fim da grade)
+    """
+    s = np.stack([signed_separation(longitudes[a], longitudes[b]) for a, b in pairs])
+    angles = np.array(list(ASPECTS.values()))
+    inside = orb_residual(s[:, None, :], angles[None, :, None], orbs[:, :, None]) <= 0.0
+
+    # Bordas das sequências True ao longo do tempo
+    padded = np.pad(inside, ((0, 0), (0, 0), (1, 1)))
+    edges = np.diff(padded.astype(np.int8), axis=-1)
+    pair, aspect, first = np.nonzero(edges == 1)
+    _, _, stop = np.nonzero(edges == -1)
+    last = stop - 1
+    first = np.where(first == 0, -1, first)
+    last = np.where(last == len(jd) - 1, len(jd), last)
+    return {'pair': pair, 'aspect': aspect, 'first': first, 'last': last, 's': s}
+
+
+class AspectTimeline:
+    """Intervalos de aspecto ordenados pela entrada, consultáveis por data"""
+
+    def __init__(self, intervals: List[Dict[str, Any]]):
+        self.intervals = sorted(intervals, key=lambda interval: interval['entry_jd'])
+        self._entries = np.array([interval['entry_jd'] for interval in self.intervals])
+        self._exits = np.array([interval['exit_jd'] for interval in self.intervals])
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    def between(self, start, end) -> List[Dict[str, Any]]:
+        """Intervalos que se sobrepõem a [start, end)"""
+        start_jd, end_jd = to_julian_day(start), to_julian_day(end)
+        candidates = np.arange(int(np.searchsorted(self._entries, end_jd)))
+        return [self.intervals[i] for i in candidates[self._exits[candidates] > start_jd]]
+
+    def active_at(self, moment) -> List[Dict[str, Any]]:
+        """Aspectos dentro do orbe num instante ou data (12:00 UTC)"""
+        jd = to_julian_day(moment)
+        candidates = np.arange(int(np.searchsorted(self._entries, jd, side='right')))
+        return [self.intervals[i] for i in candidates[self._exits[candidates] > jd]]
+
+    def exact_between(self, start, end) -> List[Tuple[datetime.datetime, Dict[str, Any]]]:
+        """Aspectos que se tornam exatos em [start, end), em ordem de tempo"""
+        start_jd, end_jd = to_julian_day(start), to_julian_day(end)
+        hits = [(jd, interval) for interval in self.between(start, end)
+                for jd in interval['exact_jd'] if start_jd <= jd < end_jd]
+        return [(from_julian_day(jd), interval) for jd, interval in sorted(hits, key=lambda hit: hit[0])]
+
+
+class AspectEngine:
+    """Aspectos entre todos os pares de corpos ao longo de um intervalo"""
+
+    def __init__(self, ephemeris: Ephemeris, data_dir: Path, bodies: Optional[Sequence[str]] = None):
+        """
+        Args:
+            ephemeris: Fonte das longitudes
+            data_dir: Diretório das bases (config.json)
+            bodies: Corpos considerados (padrão: todos)
+        """
+        self.ephemeris = ephemeris
+        self.bodies = list(bodies or BODIES)
+        self.pairs = list(combinations(self.bodies, 2))
+        self.orbs = pair_orbs(load_orbs(data_dir), self.pairs)
+
+    def _separations(self, jd: np.ndarray, pair: np.ndarray) -> np.ndarray:
+        """Diferença de longitude do par pair[i] no instante jd[i] (só os corpos envolvidos)"""
+        first = np.array([self.bodies.index(self.pairs[p][0]) for p in pair], dtype=np.int64)
+        second = np.array([self.bodies.index(self.pairs[p][1]) for p in pair], dtype=np.int64)
+        a, b = np.empty(len(jd)), np.empty(len(jd))
+        for index in np.union1d(first, second):
+            body = self.bodies[index]
+            used = (first == index) | (second == index)
+            longitude = self.ephemeris.longitudes(jd[used], [body])[body]
+            a[used] = np.where(first[used] == index, longitude, a[used])
+            b[used] = np.where(second[used] == index, longitude, b[used])
+        return signed_separation(a, b)
+
+    def _solve(self, lo: np.ndarray, hi: np.ndarray, pair: np.ndarray, residual) -> np.ndarray:
+        """Raízes de residual(separação) em [lo, hi], todas ao mesmo tempo (regula falsi de Illinois)"""
+        if len(lo) == 0:
+            return lo
+        f_lo = residual(self._separations(lo, pair))
+        f_hi = residual(self._separations(hi, pair))
+        side = np.zeros(len(lo))
+        t = (lo + hi) / 2.0
+        for _ in range(REFINE_ITERATIONS):
+            denominator = f_hi - f_lo
+            safe = denominator != 0.0
+            t_next = np.where(safe, (lo * f_hi - hi * f_lo) / np.where(safe, denominator, 1.0), (lo + hi) / 2.0)
+            converged = np.max(np.abs(t_next - t)) < REFINE_TOLERANCE
+            t = t_next
+            if converged:
+                break
+            f = residual(self._separations(t, pair))
+            left = np.sign(f) == np.sign(f_lo)
+            # A ponta mantida duas vezes seguidas tem o resíduo dividido por dois
+            f_hi = np.where(left & (side == 1), f_hi / 2.0, f_hi)
+            f_lo = np.where(~left & (side == -1), f_lo / 2.0, f_lo)
+            lo, f_lo = np.where(left, t, lo), np.where(left, f, f_lo)
+            hi, f_hi = np.where(left, hi, t), np.where(left, f_hi, f)
+            side = np.where(left, 1, -1)
+        return t
+
+    def sweep(self, start, end, step: float = DEFAULT_STEP) -> AspectTimeline:
+        """
+        Todos os aspectos em [start, end) com entrada, saída e instantes exatos
+
+        Entrada/saída fora do intervalo varrido ficam como None (jd ±inf).
+        """
+        start_jd, end_jd = to_julian_day(start), to_julian_day(end)
+        jd = start_jd + step * np.arange(int(np.ceil((end_jd - start_jd) / step)) + 1)
+        found = find_aspect_intervals(jd, self.ephemeris.longitudes(jd, self.bodies), self.pairs, self.orbs)
+        pair, aspect, first, last, s = found['pair'], found['aspect'], found['first'], found['last'], found['s']
+        angles = np.array(list(ASPECTS.values()))[aspect]
+        orbs = self.orbs[pair, aspect]
+
+        # Entradas e saídas: o resíduo do orbe muda de sinal entre duas amostras
+        opened, closed = first >= 0, last < len(jd)
+        entry = np.full(len(pair), -np.inf)
+        exit_ = np.full(len(pair), np.inf)
+        entry[opened] = self._solve(jd[first[opened] - 1], jd[first[opened]], pair[opened],
+                                     lambda sep, m=opened: orb_residual(sep, angles[m], orbs[m]))
+        exit_[closed] = self._solve(jd[last[closed]], jd[last[closed] + 1], pair[closed],
+                                     lambda sep, m=closed: orb_residual(sep, angles[m], orbs[m]))
+
+        # Instantes exatos: trocas de sinal do resíduo exato dentro de cada intervalo
+        residual = exact_residual(s[pair], angles[:, None])
+        flips = np.nonzero(np.sign(residual[:, :-1]) != np.sign(residual[:, 1:]))
+        lo, hi = np.maximum(first, 0), np.minimum(last, len(jd) - 1)
+        keep = (flips[1] >= lo[flips[0]]) & (flips[1] < hi[flips[0]])
+        owner, index = flips[0][keep], flips[1][keep]
+        exact = self._solve(jd[index], jd[index + 1], pair[owner],
+                             lambda sep: exact_residual(sep, angles[owner]))
+
+        intervals = []
+        for i in range(len(pair)):
+            a, b = self.pairs[pair[i]]
+            key = list(ASPECTS)[aspect[i]]
+            intervals.append({
+                'bodies': (a, b),
+                'aspect': key,
+                'name': ASPECT_NAMES[key],
+                'angle': float(angles[i]),
+                'orb': float(orbs[i]),
+                'entry_jd': float(entry[i]),
+                'exit_jd': float(exit_[i]),
+                'exact_jd': [float(t) for t in exact[owner == i]],
+                'entry': from_julian_day(entry[i]) if np.isfinite(entry[i]) else None,
+                'exit': from_julian_day(exit_[i]) if np.isfinite(exit_[i]) else None,
+                'exact': [from_julian_day(t) for t in exact[owner == i]],
+            })
+        return AspectTimeline(intervals)
+
+
+def main():
+    """Lista os aspectos que se tornam exatos num intervalo"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Aspectos Aurora Sagrada')
+    parser.add_argument('--from', dest='start', type=str, help='Data inicial YYYY-MM-DD (padrão: hoje)')
+    parser.add_argument('--to', dest='end', type=str, help='Data final YYYY-MM-DD (padrão: 7 dias)')
+    parser.add_argument('--step', type=float, default=DEFAULT_STEP, help='Passo da grade em dias')
+    parser.add_argument('--data-dir', type=str, help='Diretório das bases de dados')
+
+    args = parser.parse_args()
+
+    data_dir = Path(args.data_dir) if args.data_dir else Path(__file__).resolve().parent.parent.parent / 'data'
+    engine = AspectEngine(Ephemeris(data_dir), data_dir)
+
+    start = datetime.datetime.strptime(args.start, '%Y-%m-%d') if args.start else datetime.datetime.utcnow()
+    end = (datetime.datetime.strptime(args.end, '%Y-%m-%d') + datetime.timedelta(days=1)
+           if args.end else start + datetime.timedelta(days=7))
+
+    timeline = engine.sweep(start, end, args.step)
+    for moment, interval in timeline.exact_between(start, end):
+        a, b = interval['bodies']
+        entry = f"{interval['entry']:%d/%m %H:%M}" if interval['entry'] else '…'
+        exit_ = f"{interval['exit']:%d/%m %H:%M}" if interval['exit'] else '…'
+        print(f"{moment:%Y-%m-%d %H:%M} UTC  {a} {interval['name']} {b}  (orbe {interval['orb']:g}°: {entry} – {exit_})")
+
+
+if __name__ == '__main__':
+    main()
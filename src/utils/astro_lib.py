@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AURORA SAGRADA - UTILITÁRIOS ASTRONÔMICOS
+Conversões de tempo e ângulo compartilhadas pelos módulos Python
+(equivalente a src/lib/date.ts e src/lib/math.ts)
+"""
+
+import datetime
+from typing import Callable, Iterable, Tuple, Union
+
+import numpy as np
+
+J2000 = 2451545.0
+UNIX_EPOCH_JD = 2440587.5
+
+SIGNS = [
+    'Áries', 'Touro', 'Gêmeos', 'Câncer', 'Leão', 'Virgem',
+    'Libra', 'Escorpião', 'Sagitário', 'Capricórnio', 'Aquário', 'Peixes'
+]
+
+DateLike = Union[datetime.date, datetime.datetime]
+
+
+def to_julian_day(value: DateLike) -> float:
+    """
+    Calcula o Julian Day para uma data
+
+    Datetimes ingênuos são tratados como UTC; datas sem hora usam 12:00 UTC.
+    """
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        delta = value - datetime.datetime(1970, 1, 1)
+        return UNIX_EPOCH_JD + delta.total_seconds() / 86400.0
+    return UNIX_EPOCH_JD + (value.toordinal() - datetime.date(1970, 1, 1).toordinal()) + 0.5
+
+
+def to_julian_days(values: Iterable[DateLike]) -> np.ndarray:
+    """Converte uma sequência de datas em um array de Julian Days"""
+    return np.array([to_julian_day(v) for v in values], dtype=np.float64)
+
+
+def from_julian_day(jd: float) -> datetime.datetime:
+    """Converte Julian Day para datetime UTC (ingênuo)"""
+    return datetime.datetime(1970, 1, 1) + datetime.timedelta(days=float(jd) - UNIX_EPOCH_JD)
+
+
+def delta_t(jd) -> np.ndarray:
+    """
+    ΔT = TT - UT em segundos (polinômios de Espenak e Meeus)
+
+    As séries VSOP87A e lunares são em tempo dinâmico; somar ΔT/86400 a um
+    Julian Day em UT dá o instante correspondente em TT.
+    """
+    y = 2000.0 + (np.asarray(jd, dtype=np.float64) - J2000) / 365.25
+    u = (y - 1820.0) / 100.0
+    t = y - np.select([y < 1920, y < 1941, y < 1961, y < 1986, y < 2005], [1900, 1920, 1950, 1975, 2000], 2000)
+    return np.select(
+        [y < 1900, y < 1920, y < 1941, y < 1961, y < 1986, y < 2005, y < 2050, y < 2150],
+        [
+            -20 + 32 * u**2,
+            -2.79 + 1.494119 * t - 0.0598939 * t**2 + 0.0061966 * t**3 - 0.000197 * t**4,
+            21.20 + 0.84493 * t - 0.076100 * t**2 + 0.0020936 * t**3,
+            29.07 + 0.407 * t - t**2 / 233 + t**3 / 2547,
+            45.45 + 1.067 * t - t**2 / 260 - t**3 / 718,
+            63.86 + 0.3345 * t - 0.060374 * t**2 + 0.0017275 * t**3 + 0.000651814 * t**4 + 0.00002373599 * t**5,
+            62.92 + 0.32217 * t + 0.005589 * t**2,
+            -20 + 32 * u**2 - 0.5628 * (2150 - y),
+        ],
+        -20 + 32 * u**2,
+    )
+
+
+def julian_centuries(jd) -> np.ndarray:
+    """Séculos julianos desde J2000"""
+    return (np.asarray(jd, dtype=np.float64) - J2000) / 36525.0
+
+
+def normalize_degrees(degrees):
+    """Normaliza graus para o range 0-360 (escalares ou arrays)"""
+    return np.mod(degrees, 360.0)
+
+
+def zodiac_sign(longitude: float) -> str:
+    """Obtém o nome do signo zodiacal para uma longitude"""
+    return SIGNS[int(float(normalize_degrees(longitude)) // 30) % 12]
+
+
+def format_longitude(longitude: float) -> str:
+    """Formata longitude como grau e minuto no signo, ex.: 12°05' Leão"""
+    minutes = int(round(float(normalize_degrees(longitude)) * 60)) % (360 * 60)
+    sign, rest = divmod(minutes, 30 * 60)
+    return f"{rest // 60}°{rest % 60:02d}' {SIGNS[sign]}"
+
+
+def lunar_phase_name(sun_longitude: float, moon_longitude: float) -> str:
+    """Fase lunar pela elongação Lua-Sol (mesmos octantes de calculateLunarPhase)"""
+    diff = float(normalize_degrees(moon_longitude - sun_longitude))
+    if diff < 45 or diff >= 315:
+        return "Nova"
+    elif diff < 135:
+        return "Crescente"
+    elif diff < 225:
+        return "Cheia"
+    else:
+        return "Minguante"
+
+
+def find_angle_crossings(angle: Callable[[np.ndarray], np.ndarray], start_jd: float, end_jd: float,
+                         targets: Iterable[float], step: float,
+                         tolerance: float = 1e-7, max_iterations: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Instantes em que um ângulo sempre crescente (elongação, longitude da Lua)
+    atinge cada valor alvo, em [start_jd, end_jd)
+
+    O ângulo é amostrado numa grade única, os cruzamentos são localizados por
+    busca binária na série desenrolada e refinados todos juntos pelo método
+    da secante.
+
+    Args:
+        angle: Função vetorizada jd -> graus
+        targets: Valores alvo em graus (0-360)
+        step: Passo da grade em dias; o ângulo deve avançar menos de 360° por passo
+        tolerance: Precisão em dias
+
+    Returns:
+        (jds ordenados, índice do alvo de cada cruzamento)
+    """
+    targets = np.mod(np.asarray(list(targets), dtype=np.float64), 360.0)
+    grid = start_jd - step + step * np.arange(int(np.ceil((end_jd - start_jd) / step)) + 3)
+    unwrapped = np.degrees(np.unwrap(np.radians(angle(grid))))
+
+    # Todos os valores alvo + 360k cobertos pela grade, já em ordem crescente
+    first = np.ceil((unwrapped[0] - targets) / 360.0)
+    last = np.floor((unwrapped[-1] - targets) / 360.0)
+    values = np.concatenate([t + 360.0 * np.arange(a, b + 1) for t, a, b in zip(targets, first, last)])
+    kinds = np.concatenate([np.full(int(max(b - a + 1, 0)), i) for i, (a, b) in enumerate(zip(first, last))])
+    order = np.argsort(values, kind='stable')
+    values, kinds = values[order], kinds[order].astype(np.int64)
+
+    upper = np.clip(np.searchsorted(unwrapped, values), 1, len(grid) - 1)
+    t_prev = grid[upper - 1]
+    r_prev = unwrapped[upper - 1] - values
+    t = t_prev + step * (values - unwrapped[upper - 1]) / (unwrapped[upper] - unwrapped[upper - 1])
+    target_angles = targets[kinds]
+
+    for _ in range(max_iterations):
+        r = np.mod(angle(t) - target_angles + 180.0, 360.0) - 180.0
+        slope = r - r_prev
+        safe = np.abs(slope) > 1e-15
+        t_next = np.where(safe, t - r * (t - t_prev) / np.where(safe, slope, 1.0), t)
+        t_prev, r_prev, t = t, r, t_next
+        if np.max(np.abs(t - t_prev), initial=0.0) < tolerance:
+            break
+
+    inside = (t >= start_jd) & (t < end_jd)
+    return t[inside], kinds[inside]
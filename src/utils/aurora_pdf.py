@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AURORA SAGRADA - ACESSO IMPORTÁVEL AO GERADOR DE PDF
+pdf-generator.py tem hífen no nome e não pode ser importado diretamente;
+este módulo o carrega uma única vez como 'pdf_generator' (registrado em
+sys.modules, para que funções do gerador possam ser enviadas a um pool de
+processos).
+
+    from aurora_pdf import generator
+    generator.AuroraReportGenerator()
+"""
+
+import sys
+import importlib.util
+from pathlib import Path
+
+MODULE_NAME = 'pdf_generator'
+GENERATOR_PATH = Path(__file__).resolve().with_name('pdf-generator.py')
+
+
+def load_generator_module():
+    """Carrega (ou reutiliza) o módulo pdf-generator.py"""
+    main = sys.modules.get('__main__')
+    if getattr(main, '__file__', None) and Path(main.__file__).resolve() == GENERATOR_PATH:
+        # Executado como script: reutiliza o módulo principal
+        sys.modules.setdefault(MODULE_NAME, main)
+    if MODULE_NAME not in sys.modules:
+        spec = importlib.util.spec_from_file_location(MODULE_NAME, GENERATOR_PATH)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[MODULE_NAME] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[MODULE_NAME]
+            raise
+    return sys.modules[MODULE_NAME]
+
+
+generator = load_generator_module()
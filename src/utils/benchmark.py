@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AURORA SAGRADA - BENCHMARK DO GERADOR DE RELATÓRIOS
+Mede separadamente cada etapa de pdf-generator.py (carga das bases, parser
+JavaScript, estilos, cada seção, build do ReportLab, relatório completo e
+lote de N datas), a frio (processo novo) e a quente, com vazão, pico de
+memória e tamanho do PDF. Grava JSON, compara com uma linha de base e
+termina com erro se alguma métrica piorar além do limite.
+
+    python src/utils/benchmark.py --dates 10 --output bench.json
+    python src/utils/benchmark.py --save-baseline
+    python src/utils/benchmark.py --threshold 0.15
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import resource
+import datetime
+import tempfile
+import statistics
+import subprocess
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+BENCHMARK_VERSION = 1
+
+REPO_DIR = Path(__file__).resolve().parent.parent.parent
+DEFAULT_BASELINE = REPO_DIR / 'benchmarks' / 'baseline.json'
+DEFAULT_THRESHOLD = 0.2
+
+# Tempos abaixo disso (s) são ruído demais para acusar regressão
+DEFAULT_MIN_TIME = 0.001
+
+# Seções do relatório diário, na ordem de _build_day_sections
+SECTIONS = [
+    'general_info',
+    'planetary_positions_section',
+    'lunar_mansion_section',
+    'goddess_section',
+    'lunar_phase_section',
+    'transits_section',
+    'fixed_stars_section',
+    'magical_elections_section',
+    'correspondences_section',
+    'planetary_hours_section',
+]
+
+
+def peak_rss_kib(who: int = resource.RUSAGE_SELF) -> int:
+    """Pico de memória residente em KiB (ru_maxrss vem em bytes no macOS)"""
+    peak = resource.getrusage(who).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def metric(value: float, unit: str, better: str = 'lower', **extra) -> Dict[str, Any]:
+    """Uma métrica do resultado"""
+    return {'value': value, 'unit': unit, 'better': better, **extra}
+
+
+def timing(samples: List[float]) -> Dict[str, Any]:
+    """Métrica de tempo pela mediana das amostras"""
+    return metric(statistics.median(samples), 's', samples=len(samples),
+                  min=min(samples), max=max(samples))
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """Executa fn repeat vezes e mede cada execução"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return timing(samples)
+
+
+def cold_probe(data_dir: str, date: datetime.date) -> Dict[str, float]:
+    """Etapas de uma primeira execução, medidas dentro de um processo novo"""
+    start = time.perf_counter()
+    from aurora_pdf import generator
+    imported = time.perf_counter()
+    instance = generator.AuroraReportGenerator(data_dir=data_dir)
+    initialized = time.perf_counter()
+    size = len(instance.daily_report_bytes(date))
+    finished = time.perf_counter()
+    return {
+        'import': imported - start,
+        'init': initialized - imported,
+        'first_report': finished - initialized,
+        'total': finished - start,
+        'peak_rss_kib': peak_rss_kib(),
+        'output_bytes': size,
+    }
+
+
+def run_cold(data_dir: str, date: datetime.date, runs: int) -> Dict[str, Dict[str, Any]]:
+    """Mede runs execuções a frio, cada uma num interpretador novo"""
+    probes = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, str(Path(__file__).resolve()), '--cold-probe',
+             '--data-dir', data_dir, '--date', date.isoformat()],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        probes.append(json.loads(output.strip().splitlines()[-1]))
+    results = {f'cold.{stage}': timing([probe[stage] for probe in probes])
+               for stage in ('import', 'init', 'first_report', 'total')}
+    results['cold.peak_rss_kib'] = metric(max(probe['peak_rss_kib'] for probe in probes), 'KiB')
+    return results
+
+
+def run_warm(data_dir: str, dates: List[datetime.date], repeat: int) -> Dict[str, Dict[str, Any]]:
+    """Mede as etapas num gerador já inicializado"""
+    from aurora_pdf import generator
+    from js_data import parse_js
+    from report_layout import report_document
+
+    instance = generator.AuroraReportGenerator(data_dir=data_dir)
+    results = {}
+
+    results['load_bases'] = measure(instance._load_bases, repeat)
+    for path in sorted(Path(data_dir).glob('*.js')):
+        source = path.read_text(encoding='utf-8')
+        results[f'parse_js.{path.name}'] = measure(lambda: parse_js(source), repeat)
+        results[f'load_js.{path.name}'] = measure(lambda: instance._parse_js_file(path), repeat)
+    results['create_styles'] = measure(instance._create_styles, repeat)
+
+    # Cada seção em todas as datas (a primeira passada também aquece índices e fragmentos)
+    for name in SECTIONS:
+        build = getattr(instance, f'_build_{name}')
+        samples = []
+        for _ in range(repeat):
+            for date in dates:
+                start = time.perf_counter()
+                build(date)
+                samples.append(time.perf_counter() - start)
+        results[f'section.{name}'] = timing(samples)
+
+    def build_document(date: datetime.date) -> int:
+        story = instance._build_header(date) + instance._build_day_sections(date) + instance._build_footer()
+        buffer = BytesIO()
+        doc = report_document(buffer)
+        start = time.perf_counter()
+        doc.build(story)
+        samples.append(time.perf_counter() - start)
+        return len(buffer.getvalue())
+
+    samples = []
+    for _ in range(repeat):
+        for date in dates:
+            build_document(date)
+    results['doc_build'] = timing(samples)
+
+    with tempfile.TemporaryDirectory(prefix='aurora_bench_') as tmp_dir:
+        output_path = str(Path(tmp_dir) / 'report.pdf')
+        results['daily_report'] = measure(lambda: instance.generate_daily_report(dates[0], output_path), repeat)
+        results['output_bytes'] = metric(os.path.getsize(output_path), 'bytes')
+
+    results['peak_rss_kib'] = metric(peak_rss_kib(), 'KiB')
+    return results
+
+
+def run_batch(data_dir: str, dates: List[datetime.date], workers: int) -> Dict[str, Dict[str, Any]]:
+    """Lote de relatórios pelo pool de processos do gerador"""
+    from aurora_pdf import generator
+
+    with tempfile.TemporaryDirectory(prefix='aurora_bench_') as tmp_dir:
+        start = time.perf_counter()
+        results = generator.generate_batch_reports(dates, tmp_dir, data_dir, workers)
+        elapsed = time.perf_counter() - start
+    failures = [result for result in results if not result['success']]
+    if failures:
+        raise RuntimeError(f"Falha no lote: {failures[0]['error']}")
+    return {
+        'batch.total': metric(elapsed, 's', reports=len(dates), workers=workers),
+        'batch.throughput': metric(len(dates) / elapsed, 'reports/s', 'higher'),
+        'batch.peak_rss_kib': metric(peak_rss_kib(resource.RUSAGE_CHILDREN), 'KiB'),
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float,
+            min_time: float = DEFAULT_MIN_TIME) -> List[Dict[str, Any]]:
+    """
+    Métricas que pioraram mais que threshold (fração) em relação à linha de base
+
+    Métricas ausentes de um dos lados e tempos abaixo de min_time são ignorados.
+    """
+    regressions = []
+    for name, now in current['metrics'].items():
+        before = baseline.get('metrics', {}).get(name)
+        if not before or before['unit'] != now['unit'] or not before['value']:
+            continue
+        if now['unit'] == 's' and max(now['value'], before['value']) < min_time:
+            continue
+        change = now['value'] / before['value'] - 1.0
+        worse = change > threshold if now['better'] == 'lower' else change < -threshold
+        if worse:
+            regressions.append({'metric': name, 'baseline': before['value'], 'current': now['value'],
+                                'change': change, 'unit': now['unit']})
+    return regressions
+
+
+def run(data_dir: str, dates: List[datetime.date], repeat: int, cold_runs: int, workers: int) -> Dict[str, Any]:
+    """Executa o benchmark completo"""
+    metrics = {}
+    metrics.update(run_cold(data_dir, dates[0], cold_runs))
+    metrics.update(run_batch(data_dir, dates, workers))
+    metrics.update(run_warm(data_dir, dates, repeat))
+    return {
+        'version': BENCHMARK_VERSION,
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'config': {'data_dir': data_dir, 'start': dates[0].isoformat(), 'dates': len(dates),
+                   'repeat': repeat, 'cold_runs': cold_runs, 'workers': workers},
+        'metrics': metrics,
+    }
+
+
+def main():
+    """Executa o benchmark e compara com a linha de base"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark do gerador de relatórios Aurora Sagrada')
+    parser.add_argument('--date', type=str, help='Primeira data YYYY-MM-DD (padrão: 2025-01-01)')
+    parser.add_argument('--dates', type=int, default=7, help='Número de datas (seções e lote)')
+    parser.add_argument('--repeat', type=int, default=3, help='Repetições das medições a quente')
+    parser.add_argument('--cold-runs', type=int, default=3, help='Execuções a frio')
+    parser.add_argument('--workers', type=int, default=1, help='Processos do lote')
+    parser.add_argument('--data-dir', type=str, help='Diretório das bases de dados')
+    parser.add_argument('--output', type=str, help='Arquivo JSON de resultados')
+    parser.add_argument('--baseline', type=str,
+                        help=f'Linha de base JSON (padrão: {DEFAULT_BASELINE.relative_to(REPO_DIR)})')
+    parser.add_argument('--save-baseline', action='store_true', help='Grava os resultados como linha de base')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Piora relativa tolerada (0.2 = 20%%)')
+    parser.add_argument('--min-time', type=float, default=DEFAULT_MIN_TIME,
+                        help='Tempos menores que isso (s) não contam como regressão')
+    parser.add_argument('--cold-probe', action='store_true', help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    data_dir = args.data_dir or str(REPO_DIR / 'data')
+    start = datetime.datetime.strptime(args.date, '%Y-%m-%d').date() if args.date else datetime.date(2025, 1, 1)
+
+    if args.cold_probe:
+        print(json.dumps(cold_probe(data_dir, start)))
+        return
+
+    # Sem linha de base não há comparação: falha antes de medir tudo
+    baseline_path = Path(args.baseline) if args.baseline else DEFAULT_BASELINE
+    if not args.save_baseline and not baseline_path.exists():
+        parser.error(f"linha de base não encontrada: {baseline_path} (grave uma com --save-baseline)")
+
+    dates = [start + datetime.timedelta(days=i) for i in range(args.dates)]
+    results = run(data_dir, dates, args.repeat, args.cold_runs, args.workers)
+
+    for name, value in results['metrics'].items():
+        print(f"{name:<45} {value['value']:>12.4f} {value['unit']}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = baseline_path.with_name(f"{baseline_path.name}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        os.replace(tmp_path, baseline_path)
+        print(f"Linha de base gravada: {baseline_path}")
+        return
+
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold, args.min_time)
+    for regression in regressions:
+        print(f"REGRESSÃO {regression['metric']}: {regression['baseline']:.4f} → "
+              f"{regression['current']:.4f} {regression['unit']} ({regression['change']:+.0%})")
+    if regressions:
+        sys.exit(1)
+    print(f"Sem regressões acima de {args.threshold:.0%}")
+
+
+if __name__ == '__main__':
+    main()
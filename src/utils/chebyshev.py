@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AURORA SAGRADA - EFEMÉRIDES PRÉ-CALCULADAS EM CHEBYSHEV
+Coeficientes de Chebyshev por segmento para as longitudes do Sol, da Lua e
+dos planetas, gravados em arquivos .npy e abertos com mmap. Qualquer data do
+intervalo é respondida com uma indexação O(1) e um polinômio curto.
+
+    python src/utils/chebyshev.py build --from 1900 --to 2100
+"""
+
+import os
+import sys
+import json
+import hashlib
+import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.polynomial import chebyshev as C
+
+from astro_lib import to_julian_day
+from lua import moon_longitude
+from vsop87 import VSOP87Engine
+
+MANIFEST_NAME = 'manifest.json'
+FORMAT_VERSION = 1
+
+# Módulos das séries que geram os coeficientes: mudar qualquer um invalida as tabelas
+THEORY_SOURCES = ('astro_lib.py', 'lua.py', 'vsop87.py')
+
+# Corpo -> (dias por segmento, grau do polinômio); erro < 1" no intervalo 1900-2100
+BODIES: Dict[str, Tuple[int, int]] = {
+    'Sol': (32, 10),
+    'Lua': (8, 14),
+    'Mercurio': (8, 11),
+    'Venus': (16, 11),
+    'Marte': (16, 10),
+    'Jupiter': (32, 9),
+    'Saturno': (32, 9),
+    'Urano': (64, 8),
+    'Netuno': (64, 8),
+}
+
+# Amplitude mínima dos termos VSOP87A usados na construção (UA, ~0.0002")
+BUILD_MIN_AMPLITUDE = 1e-9
+
+
+def _fit_segments(values: np.ndarray) -> np.ndarray:
+    """
+    Coeficientes de Chebyshev a partir dos valores nos nós de cada segmento
+
+    Args:
+        values: Array (segmentos, n) amostrado nos nós cos(π(k+½)/n)
+    """
+    n = values.shape[1]
+    k = np.arange(n) + 0.5
+    basis = np.cos(np.pi * np.outer(k, np.arange(n)) / n)
+    coeffs = values @ basis * (2.0 / n)
+    coeffs[:, 0] /= 2.0
+    return coeffs
+
+
+@lru_cache(maxsize=None)
+def theory_fingerprint() -> str:
+    """sha256 dos módulos em THEORY_SOURCES (gravado no manifest de cada tabela)"""
+    digest = hashlib.sha256()
+    for filename in THEORY_SOURCES:
+        digest.update((Path(__file__).resolve().parent / filename).read_bytes())
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def _clenshaw(coeffs: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Avalia uma série de Chebyshev distinta para cada ponto (coeffs: (N, n))"""
+    b1 = np.zeros_like(x)
+    b2 = np.zeros_like(x)
+    for j in range(coeffs.shape[1] - 1, 0, -1):
+        b1, b2 = 2.0 * x * b1 - b2 + coeffs[:, j], b1
+    return x * b1 - b2 + coeffs[:, 0]
+
+
+class ChebyshevEphemeris:
+    """Tabela de efemérides por segmentos de Chebyshev"""
+
+    def __init__(self, directory: Path):
+        """
+        Abre uma tabela já construída
+
+        Args:
+            directory: Diretório com manifest.json e um .npy por corpo
+        """
+        self.directory = Path(directory)
+        with open(self.directory / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+            self.manifest = json.load(f)
+        if self.manifest.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Versão de tabela Chebyshev incompatível: {self.directory}")
+        if self.manifest.get('theory') != theory_fingerprint():
+            raise ValueError(f"Tabela Chebyshev gerada por outra versão das séries: {self.directory}")
+
+        self.start_jd = self.manifest['start_jd']
+        self.end_jd = self.manifest['end_jd']
+        self._coeffs: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def open(cls, directory: Path) -> Optional['ChebyshevEphemeris']:
+        """
+        Abre a tabela se existir e for válida; None caso contrário
+
+        Uma tabela desatualizada é recusada com um aviso (as séries passam a
+        responder até que seja reconstruída).
+        """
+        try:
+            return cls(directory)
+        except OSError:
+            return None
+        except (ValueError, KeyError) as e:
+            print(f"Tabela Chebyshev ignorada ({e}); reconstrua com: python src/utils/chebyshev.py build",
+                  file=sys.stderr)
+            return None
+
+    @property
+    def bodies(self) -> Sequence[str]:
+        return list(self.manifest['bodies'])
+
+    def covers(self, jd) -> bool:
+        """Verifica se todas as datas estão dentro do intervalo da tabela"""
+        jd = np.asarray(jd, dtype=np.float64)
+        return bool(np.all((jd >= self.start_jd) & (jd < self.end_jd)))
+
+    def _segments(self, body: str, jd) -> Tuple[np.ndarray, np.ndarray, float, Tuple]:
+        """Localiza o segmento e a abscissa normalizada de cada data"""
+        if body not in self.manifest['bodies']:
+            raise ValueError(f"Corpo não disponível na tabela: {body}")
+        if body not in self._coeffs:
+            self._coeffs[body] = np.load(self.directory / self.manifest['bodies'][body]['file'], mmap_mode='r')
+
+        jd = np.asarray(jd, dtype=np.float64)
+        if not self.covers(jd):
+            raise ValueError("Data fora do intervalo da tabela Chebyshev")
+
+        span = self.manifest['bodies'][body]['segment_days']
+        flat = jd.ravel()
+        offset = flat - self.start_jd
+        index = np.minimum((offset // span).astype(np.int64), len(self._coeffs[body]) - 1)
+        x = 2.0 * (offset - index * span) / span - 1.0
+        return self._coeffs[body][index], x, span, jd.shape
+
+    def longitude(self, body: str, jd) -> np.ndarray:
+        """Longitude eclíptica geocêntrica (equinócio da data), em graus"""
+        coeffs, x, _, shape = self._segments(body, jd)
+        return np.mod(_clenshaw(coeffs, x), 360.0).reshape(shape)
+
+    def speed(self, body: str, jd) -> np.ndarray:
+        """Velocidade em longitude, em graus por dia (negativa se retrógrado)"""
+        coeffs, x, span, shape = self._segments(body, jd)
+        derivative = C.chebder(coeffs, axis=1)
+        return (_clenshaw(derivative, x) * 2.0 / span).reshape(shape)
+
+    def longitudes(self, jd, bodies: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """Longitudes de vários corpos para as mesmas datas"""
+        return {body: self.longitude(body, jd) for body in (bodies or self.bodies)}
+
+    @classmethod
+    def build(cls, directory: Path, vsop_dir: Path, start_year: int = 1900,
+              end_year: int = 2100, bodies: Optional[Sequence[str]] = None) -> 'ChebyshevEphemeris':
+        """
+        Constrói a tabela para [1º jan start_year, 1º jan end_year + 1)
+
+        Todas as amostras de um corpo são avaliadas numa única chamada vetorizada.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        engine = VSOP87Engine(vsop_dir, min_amplitude=BUILD_MIN_AMPLITUDE)
+
+        start_jd = to_julian_day(datetime.datetime(start_year, 1, 1))
+        end_jd = to_julian_day(datetime.datetime(end_year + 1, 1, 1))
+
+        manifest = {
+            'version': FORMAT_VERSION,
+            'theory': theory_fingerprint(),
+            'start_jd': start_jd,
+            'end_jd': end_jd,
+            'start_year': start_year,
+            'end_year': end_year,
+            'bodies': {},
+        }
+
+        for body in bodies or BODIES:
+            span, degree = BODIES[body]
+            n = degree + 1
+            count = int(np.ceil((end_jd - start_jd) / span))
+            nodes = np.cos(np.pi * (np.arange(n) + 0.5) / n)
+            times = start_jd + span * (np.arange(count)[:, None] + (nodes[None, :] + 1.0) / 2.0)
+
+            if body == 'Lua':
+                values = moon_longitude(times)
+            else:
+                values = engine.geocentric_longitude(body, times)
+            values = np.unwrap(np.radians(values), axis=1)
+
+            filename = f"{body}.npy"
+            tmp_path = directory / f"{filename}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                np.save(f, _fit_segments(np.degrees(values)))
+            os.replace(tmp_path, directory / filename)
+
+            manifest['bodies'][body] = {'segment_days': span, 'degree': degree, 'file': filename}
+
+        tmp_path = directory / f"{MANIFEST_NAME}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, directory / MANIFEST_NAME)
+
+        return cls(directory)
+
+
+def main():
+    """Constrói a tabela de efemérides Chebyshev"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Efemérides Chebyshev Aurora Sagrada')
+    parser.add_argument('command', choices=['build'], help='Ação a executar')
+    parser.add_argument('--from', dest='start_year', type=int, default=1900, help='Ano inicial')
+    parser.add_argument('--to', dest='end_year', type=int, default=2100, help='Ano final (inclusive)')
+    parser.add_argument('--data-dir', type=str, help='Diretório das bases de dados')
+
+    args = parser.parse_args()
+
+    data_dir = Path(args.data_dir) if args.data_dir else Path(__file__).resolve().parent.parent.parent / 'data'
+    table = ChebyshevEphemeris.build(
+        data_dir / 'chebyshev', data_dir / 'vsop87', args.start_year, args.end_year
+    )
+    print(f"Tabela Chebyshev gerada: {table.directory} ({args.start_year}-{args.end_year})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AURORA SAGRADA - ELEIÇÕES MÁGICAS VETORIZADAS
+Pontua todos os temas de data/eleicoes-magickas.json sobre uma grade de
+datas/horas de uma só vez, a partir do estado do céu em arrays NumPy
+(mesmos critérios de src/astro/eleicoes.ts), e busca as melhores janelas
+de um tema num intervalo.
+
+    python src/utils/elections.py amor --from 2025-01-01 --to 2025-03-01 --step 1
+"""
+
+import re
+import json
+import datetime
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from aspects import ASPECTS
+from astro_lib import SIGNS, julian_centuries, to_julian_day
+from chebyshev import BODIES
+from ephemeris import Ephemeris
+from lua import fundamental_arguments
+
+
+def _ascii_key(text: str) -> str:
+    """'Capricórnio' -> 'capricornio' (formato das chaves de eleicoes-magickas.json)"""
+    return unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii').lower()
+
+
+# Chave nas regras -> corpo
+PLANET_KEYS = {_ascii_key(body): body for body in BODIES}
+
+SIGN_KEYS = [_ascii_key(sign) for sign in SIGNS]
+ELEMENT_SIGNS = {'fogo': (0, 4, 8), 'terra': (1, 5, 9), 'ar': (2, 6, 10), 'agua': (3, 7, 11)}
+
+# Na ordem dos octantes de lunar_phase_name
+PHASE_KEYS = ['nova', 'crescente', 'cheia', 'minguante']
+
+ASPECT_PLURALS = {'conjuncoes': 'conjuncao', 'sextis': 'sextil', 'quadraturas': 'quadratura',
+                  'trigonos': 'trigono', 'oposicoes': 'oposicao'}
+
+# Dignidades essenciais simplificadas (evaluateDignity em eleicoes.ts)
+DIGNITIES = {
+    'Sol': {'Leão': 0.5, 'Áries': 0.3, 'Aquário': -0.3, 'Libra': -0.5},
+    'Lua': {'Câncer': 0.5, 'Touro': 0.3, 'Capricórnio': -0.3, 'Escorpião': -0.5},
+    'Mercurio': {'Gêmeos': 0.5, 'Virgem': 0.5, 'Sagitário': -0.3, 'Peixes': -0.5},
+    'Venus': {'Touro': 0.5, 'Libra': 0.5, 'Peixes': 0.3, 'Escorpião': -0.3, 'Áries': -0.5},
+    'Marte': {'Áries': 0.5, 'Escorpião': 0.5, 'Capricórnio': 0.3, 'Libra': -0.3, 'Touro': -0.5},
+    'Jupiter': {'Sagitário': 0.5, 'Peixes': 0.5, 'Câncer': 0.3, 'Gêmeos': -0.3, 'Virgem': -0.5},
+    'Saturno': {'Capricórnio': 0.5, 'Aquário': 0.5, 'Libra': 0.3, 'Câncer': -0.3, 'Áries': -0.5},
+}
+
+DOMICILES = {
+    'Sol': ('Leão',), 'Lua': ('Câncer',), 'Mercurio': ('Gêmeos', 'Virgem'),
+    'Venus': ('Touro', 'Libra'), 'Marte': ('Áries', 'Escorpião'),
+    'Jupiter': ('Sagitário', 'Peixes'), 'Saturno': ('Capricórnio', 'Aquário'),
+    'Urano': ('Aquário',), 'Netuno': ('Peixes',),
+}
+
+# Condição de um planeta (evaluatePlanet em eleicoes.ts): base neutra,
+# dignidade, retrogradação e movimento quase estacionário
+PLANET_BASE = 0.5
+RETROGRADE_PENALTY = 0.3
+STATIONARY_SPEED = 0.1
+STATIONARY_PENALTY = 0.1
+
+# Número de aspectos exatos em que 'trigonos', 'sextis'... atingem o máximo
+ASPECT_COUNT_SATURATION = 3.0
+
+# Redução de score de uma condição de 'evitar' sem regra própria
+DEFAULT_AVOID_PENALTY = 0.5
+DEFAULT_ORB = 3.0
+
+# Eclipse "exato": Lua a menos de ~½ dia da sizígia e dentro do limite eclíptico
+ECLIPSE_SYZYGY_DEG = 6.0
+ECLIPSE_LIMIT_SOLAR = 18.5
+ECLIPSE_LIMIT_LUNAR = 12.2
+
+# Aspectos ptolomaicos (ângulos de 0 a 360) considerados para a Lua fora de curso
+_VOID_ANGLES = np.array([0.0, 60.0, 90.0, 120.0, 180.0, 240.0, 270.0, 300.0])
+
+_RULE_ORB = re.compile(r'orb_max_graus_(\d+(?:\.\d+)?)$')
+_RULE_MAIN_RETROGRADE = re.compile(r'retrogradacao_planeta_principal_reduz_(\d+)_porcento$')
+_RULE_PENALTY = re.compile(r'(\w+?)_reduz_score_(\d+)_porcento$')
+_RULE_ECLIPSE = re.compile(r'sem_eclipse_exato')
+
+
+class SkyState:
+    """Estado do céu numa grade de datas, com fatores de eleição memorizados"""
+
+    def __init__(self, jd: np.ndarray, longitudes: Dict[str, np.ndarray],
+                 speeds: Dict[str, np.ndarray], orb: float = DEFAULT_ORB):
+        """
+        Args:
+            jd: Datas julianas (1-D)
+            longitudes: Corpo -> longitudes em graus
+            speeds: Corpo -> velocidades em graus/dia
+            orb: Orbe máximo dos aspectos, em graus
+        """
+        self.jd = np.asarray(jd, dtype=np.float64)
+        self.longitudes = longitudes
+        self.speeds = speeds
+        self.orb = orb
+        self._factors: Dict[str, Optional[np.ndarray]] = {}
+
+    @classmethod
+    def compute(cls, ephemeris: Ephemeris, jd, orb: float = DEFAULT_ORB) -> 'SkyState':
+        """Avalia longitudes e velocidades de todos os corpos numa única passada"""
+        jd = np.atleast_1d(np.asarray(jd, dtype=np.float64))
+        return cls(jd, ephemeris.longitudes(jd), ephemeris.speeds(jd), orb)
+
+    def sign_index(self, body: str) -> np.ndarray:
+        return (self.longitudes[body] // 30.0).astype(np.int64) % 12
+
+    def retrograde(self, body: str) -> np.ndarray:
+        return self.speeds[body] < 0.0
+
+    def separation(self, a: str, b: str) -> np.ndarray:
+        """Distância angular entre dois corpos (0-180°)"""
+        diff = np.mod(self.longitudes[a] - self.longitudes[b], 360.0)
+        return np.minimum(diff, 360.0 - diff)
+
+    def aspect_strength(self, a: str, b: str, angle: float) -> np.ndarray:
+        """1 no aspecto exato, caindo linearmente a 0 no limite do orbe"""
+        return np.clip(1.0 - np.abs(self.separation(a, b) - angle) / self.orb, 0.0, 1.0)
+
+    def elongation(self) -> np.ndarray:
+        return np.mod(self.longitudes['Lua'] - self.longitudes['Sol'], 360.0)
+
+    def phase_index(self) -> np.ndarray:
+        """Índice em PHASE_KEYS (mesmos octantes de lunar_phase_name)"""
+        return ((self.elongation() + 45.0) // 90.0).astype(np.int64) % 4
+
+    def planet_condition(self, body: str) -> np.ndarray:
+        """Condição do planeta entre 0 e 1"""
+        dignity = np.zeros(12)
+        for sign, value in DIGNITIES.get(body, {}).items():
+            dignity[SIGNS.index(sign)] = value
+        condition = (PLANET_BASE + dignity[self.sign_index(body)]
+                     - RETROGRADE_PENALTY * self.retrograde(body)
+                     - STATIONARY_PENALTY * (np.abs(self.speeds[body]) < STATIONARY_SPEED))
+        return np.clip(condition, 0.0, 1.0)
+
+    def moon_void_of_course(self) -> np.ndarray:
+        """
+        Lua fora de curso: nenhum aspecto ptolomaico a um planeta se completa
+        antes de ela deixar o signo (movimentos supostos lineares)
+        """
+        moon = self.longitudes['Lua']
+        moon_speed = self.speeds['Lua']
+        to_sign_end = (30.0 - np.mod(moon, 30.0)) / moon_speed
+
+        next_aspect = np.full_like(moon, np.inf)
+        for body in self.longitudes:
+            if body == 'Lua':
+                continue
+            relative_speed = moon_speed - self.speeds[body]
+            separation = np.mod(moon - self.longitudes[body], 360.0)
+            ahead = np.mod(_VOID_ANGLES[:, None] - separation[None, :], 360.0).min(axis=0)
+            next_aspect = np.minimum(next_aspect, ahead / relative_speed)
+        return next_aspect > to_sign_end
+
+    def exact_eclipse(self) -> np.ndarray:
+        """Sizígia próxima de um nodo lunar"""
+        elongation = self.elongation()
+        F = np.degrees(fundamental_arguments(julian_centuries(self.jd))[4])
+        node_distance = np.minimum(np.mod(F, 180.0), 180.0 - np.mod(F, 180.0))
+        new_moon = np.minimum(elongation, 360.0 - elongation) < ECLIPSE_SYZYGY_DEG
+        full_moon = np.abs(elongation - 180.0) < ECLIPSE_SYZYGY_DEG
+        return ((new_moon & (node_distance < ECLIPSE_LIMIT_SOLAR))
+                | (full_moon & (node_distance < ECLIPSE_LIMIT_LUNAR)))
+
+    def factor(self, key: str) -> Optional[np.ndarray]:
+        """
+        Valor (0 a 1) de uma chave de eleicoes-magickas.json em cada data;
+        None se a chave não for reconhecida
+        """
+        if key not in self._factors:
+            value = self._evaluate(key)
+            self._factors[key] = None if value is None else np.asarray(value, dtype=np.float64)
+        return self._factors[key]
+
+    def _evaluate(self, key: str) -> Optional[np.ndarray]:
+        if key in PLANET_KEYS:
+            return self.planet_condition(PLANET_KEYS[key])
+        if key in ASPECT_PLURALS:
+            angle = ASPECTS[ASPECT_PLURALS[key]]
+            bodies = list(self.longitudes)
+            total = sum(self.aspect_strength(a, b, angle)
+                        for i, a in enumerate(bodies) for b in bodies[i + 1:])
+            return np.minimum(total / ASPECT_COUNT_SATURATION, 1.0)
+        if key == 'lua_vazia':
+            return self.moon_void_of_course()
+
+        parts = key.split('_')
+        body = PLANET_KEYS.get(parts[0])
+        if body is None:
+            return None
+        rest = parts[1:]
+
+        if body == 'Lua' and len(rest) == 1 and rest[0] in PHASE_KEYS:
+            return self.phase_index() == PHASE_KEYS.index(rest[0])
+        if rest == ['rx']:
+            return self.retrograde(body)
+        if rest == ['rx', 'forte']:
+            # Retrogradação plena, fora das estações
+            return self.speeds[body] < -STATIONARY_SPEED
+        if len(rest) == 2 and rest[0] == 'em':
+            target = rest[1]
+            if target == 'domicilio':
+                return np.isin(self.sign_index(body), [SIGNS.index(s) for s in DOMICILES.get(body, ())])
+            if target in SIGN_KEYS:
+                return self.sign_index(body) == SIGN_KEYS.index(target)
+            if target in ELEMENT_SIGNS:
+                return np.isin(self.sign_index(body), ELEMENT_SIGNS[target])
+        if len(rest) == 2 and rest[0] in ASPECTS and rest[1] in PLANET_KEYS:
+            return self.aspect_strength(body, PLANET_KEYS[rest[1]], ASPECTS[rest[0]])
+        return None
+
+
+class ElectionRules:
+    """Pesos por tema e regras gerais de data/eleicoes-magickas.json"""
+
+    def __init__(self, config: Dict[str, Any]):
+        self.weights: Dict[str, Dict[str, Any]] = config.get('weights', {})
+        self.descriptions: Dict[str, str] = config.get('descriptions', {})
+        self.orb = DEFAULT_ORB
+        self.main_retrograde_penalty = 0.0
+        self.penalties: Dict[str, float] = {}
+        self.no_exact_eclipse = False
+
+        for rule in config.get('rules', []):
+            if _RULE_ORB.match(rule):
+                self.orb = float(_RULE_ORB.match(rule).group(1))
+            elif _RULE_MAIN_RETROGRADE.match(rule):
+                self.main_retrograde_penalty = int(_RULE_MAIN_RETROGRADE.match(rule).group(1)) / 100
+            elif _RULE_PENALTY.match(rule):
+                factor, percent = _RULE_PENALTY.match(rule).groups()
+                self.penalties[factor] = int(percent) / 100
+            elif _RULE_ECLIPSE.match(rule):
+                self.no_exact_eclipse = True
+
+    @property
+    def themes(self) -> List[str]:
+        return list(self.weights)
+
+    def main_planet(self, theme: str) -> Optional[str]:
+        """Planeta de maior peso do tema"""
+        planets = [(weight, key) for key, weight in self.weights[theme].items()
+                   if key in PLANET_KEYS and isinstance(weight, (int, float))]
+        return PLANET_KEYS[max(planets)[1]] if planets else None
+
+
+class ElectionsEngine:
+    """Scores de todos os temas sobre grades de datas e busca de melhores janelas"""
+
+    def __init__(self, ephemeris: Ephemeris, data_dir: Path):
+        """
+        Args:
+            ephemeris: Fonte das posições planetárias
+            data_dir: Diretório com eleicoes-magickas.json e config.json
+        """
+        self.ephemeris = ephemeris
+        data_dir = Path(data_dir)
+        self.rules = ElectionRules(self._read_json(data_dir / 'eleicoes-magickas.json'))
+
+        settings = self._read_json(data_dir / 'config.json').get('elections', {})
+        self.max_days_ahead: Optional[int] = settings.get('maxDaysAhead')
+        self.min_score: float = settings.get('minScore', 0.0)
+
+    @staticmethod
+    def _read_json(path: Path) -> Dict[str, Any]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    @property
+    def themes(self) -> List[str]:
+        return self.rules.themes
+
+    def sky(self, jd) -> SkyState:
+        return SkyState.compute(self.ephemeris, jd, self.rules.orb)
+
+    def score_theme(self, sky: SkyState, theme: str) -> np.ndarray:
+        """
+        Score (0 a 1) de um tema em cada data da grade
+
+        Média ponderada dos fatores com peso numérico, reduzida pelas
+        condições de 'evitar', pela retrogradação do planeta principal e
+        zerada em eclipses exatos, conforme as regras.
+        """
+        if theme not in self.rules.weights:
+            raise ValueError(f"Tema desconhecido: {theme}")
+        weights = self.rules.weights[theme]
+
+        total = np.zeros_like(sky.jd)
+        weight_sum = 0.0
+        for key, weight in weights.items():
+            if not isinstance(weight, (int, float)):
+                continue
+            value = sky.factor(key)
+            if value is not None:
+                total += weight * value
+                weight_sum += weight
+        score = total / weight_sum if weight_sum else total
+
+        for key in weights.get('evitar', []):
+            value = sky.factor(key)
+            if value is not None:
+                score = score * (1.0 - self.rules.penalties.get(key, DEFAULT_AVOID_PENALTY) * value)
+
+        main = self.rules.main_planet(theme)
+        if main and self.rules.main_retrograde_penalty:
+            score = score * (1.0 - self.rules.main_retrograde_penalty * sky.retrograde(main))
+
+        if self.rules.no_exact_eclipse:
+            score = np.where(sky.exact_eclipse(), 0.0, score)
+
+        return np.clip(score, 0.0, 1.0)
+
+    def scores(self, jd, themes: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """Scores de vários temas sobre a mesma grade (o céu é calculado uma vez)"""
+        sky = self.sky(jd)
+        return {theme: self.score_theme(sky, theme) for theme in (themes or self.themes)}
+
+    def best_windows(self, theme: str, start: datetime.datetime,
+                     end: Optional[datetime.datetime] = None, k: int = 5, step_hours: float = 1.0,
+                     min_score: Optional[float] = None,
+                     max_days_ahead: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Melhores janelas contínuas para um tema entre start e end
+
+        Uma janela é um trecho da grade com score >= min_score; as k janelas
+        de maior pico são retornadas em ordem decrescente de pico.
+
+        Args:
+            theme: Tema de eleicoes-magickas.json
+            start: Início da busca (datas sem hora começam à 00:00 UTC)
+            end: Fim da busca (padrão e limite: start + max_days_ahead)
+            k: Número de janelas
+            step_hours: Resolução da grade, em horas
+            min_score: Score mínimo (padrão: elections.minScore de config.json)
+            max_days_ahead: Horizonte máximo (padrão: elections.maxDaysAhead)
+
+        Returns:
+            Lista de {'start', 'end', 'peak', 'score', 'mean'}; datetimes no fuso
+            de start (UTC se ingênuo)
+        """
+        min_score = self.min_score if min_score is None else min_score
+        max_days_ahead = self.max_days_ahead if max_days_ahead is None else max_days_ahead
+
+        start = _as_datetime(start)
+        start_jd = to_julian_day(start)
+        end_jd = to_julian_day(_as_datetime(end)) if end else None
+        if max_days_ahead:
+            horizon = start_jd + max_days_ahead
+            end_jd = horizon if end_jd is None else min(end_jd, horizon)
+        if end_jd is None or end_jd < start_jd:
+            raise ValueError("Intervalo de busca inválido")
+
+        step = step_hours / 24.0
+        index = np.arange(int(np.floor((end_jd - start_jd) / step + 1e-9)) + 1)
+        score = self.scores(start_jd + index * step, [theme])[theme]
+
+        def time_at(i) -> datetime.datetime:
+            return start + datetime.timedelta(hours=step_hours * int(i))
+
+        # Trechos contínuos acima do mínimo
+        above = np.concatenate(([False], score >= min_score, [False]))
+        edges = np.flatnonzero(np.diff(above.astype(np.int8)))
+        starts, ends = edges[::2], edges[1::2]
+        if len(starts) == 0:
+            return []
+
+        # Entre o fim de um trecho e o início do próximo o score fica abaixo
+        # do mínimo, então o máximo por reduceat é o pico do trecho
+        peaks = np.maximum.reduceat(score, starts)
+        cumulative = np.concatenate(([0.0], np.cumsum(score)))
+        sums = cumulative[ends] - cumulative[starts]
+
+        order = np.argsort(-peaks, kind='stable')[:k]
+        windows = []
+        for i in order:
+            run = slice(starts[i], ends[i])
+            peak_index = starts[i] + int(np.argmax(score[run]))
+            windows.append({
+                'start': time_at(starts[i]),
+                'end': time_at(ends[i] - 1),
+                'peak': time_at(peak_index),
+                'score': float(score[peak_index]),
+                'mean': float(sums[i] / (ends[i] - starts[i])),
+            })
+        return windows
+
+
+def _as_datetime(value) -> datetime.datetime:
+    """Datas sem hora viram 00:00 UTC"""
+    if isinstance(value, datetime.datetime):
+        return value
+    return datetime.datetime(value.year, value.month, value.day)
+
+
+def main():
+    """Lista as melhores janelas para um tema"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Eleições mágicas Aurora Sagrada')
+    parser.add_argument('theme', help='Tema (amor, trabalho, beleza, prosperidade, justica, contato)')
+    parser.add_argument('--from', dest='start', type=str, help='Data inicial YYYY-MM-DD (padrão: hoje)')
+    parser.add_argument('--to', dest='end', type=str, help='Data final YYYY-MM-DD')
+    parser.add_argument('--step', type=float, default=1.0, help='Resolução em horas')
+    parser.add_argument('--top', type=int, default=5, help='Número de janelas')
+    parser.add_argument('--min-score', type=float, help='Score mínimo (padrão: config.json)')
+    parser.add_argument('--max-days', type=int, help='Horizonte máximo em dias (padrão: config.json)')
+    parser.add_argument('--data-dir', type=str, help='Diretório das bases de dados')
+
+    args = parser.parse_args()
+
+    data_dir = Path(args.data_dir) if args.data_dir else Path(__file__).resolve().parent.parent.parent / 'data'
+    engine = ElectionsEngine(Ephemeris(data_dir), data_dir)
+
+    start = datetime.datetime.strptime(args.start, '%Y-%m-%d') if args.start else datetime.datetime.utcnow()
+    end = datetime.datetime.strptime(args.end, '%Y-%m-%d') + datetime.timedelta(days=1) if args.end else None
+
+    windows = engine.best_windows(args.theme, start, end, args.top, args.step,
+                                  args.min_score, args.max_days)
+    for window in windows:
+        print(f"{window['start']:%Y-%m-%d %H:%M} – {window['end']:%Y-%m-%d %H:%M} UTC  "
+              f"pico {window['peak']:%Y-%m-%d %H:%M} ({window['score']:.0%}, média {window['mean']:.0%})")
+    if not windows:
+        print("Nenhuma janela acima do score mínimo")
+
+
+if __name__ == '__main__':
+    main()
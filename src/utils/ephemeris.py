@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AURORA SAGRADA - EFEMÉRIDES VETORIZADAS
+Longitudes e velocidades geocêntricas do Sol, da Lua e dos planetas para
+lotes de datas julianas: a tabela Chebyshev é usada quando cobre todas as
+datas; caso contrário as séries (VSOP87A e Meeus) são avaliadas diretamente.
+Latitude e distância da Lua vêm sempre da teoria lunar (lua.py).
+As datas de entrada são em UT; a conversão para TT (ΔT) é feita aqui.
+"""
+
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from astro_lib import delta_t
+from chebyshev import BODIES, ChebyshevEphemeris
+from lua import moon_longitude, moon_position
+from vsop87 import VSOP87Engine
+
+# Passo (dias) da diferença central usada para velocidades sem a tabela
+SPEED_STEP = 0.05
+
+
+def terrestrial_time(jd) -> np.ndarray:
+    """Julian Day em UT convertido para TT"""
+    jd = np.asarray(jd, dtype=np.float64)
+    return jd + delta_t(jd) / 86400.0
+
+
+class Ephemeris:
+    """Posições de todos os corpos, da fonte mais rápida disponível"""
+
+    def __init__(self, data_dir: Path):
+        """
+        Args:
+            data_dir: Diretório das bases (com vsop87/ e, opcionalmente, chebyshev/)
+        """
+        data_dir = Path(data_dir)
+        self.series = VSOP87Engine(data_dir / 'vsop87')
+        self.table = ChebyshevEphemeris.open(data_dir / 'chebyshev')
+
+    def _from_table(self, jd) -> bool:
+        return self.table is not None and self.table.covers(jd)
+
+    def longitudes(self, jd, bodies: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """Longitudes eclípticas geocêntricas (equinócio da data), em graus"""
+        bodies = list(bodies or BODIES)
+        jd = terrestrial_time(jd)
+        if self._from_table(jd):
+            return self.table.longitudes(jd, bodies)
+
+        longitudes = {}
+        if 'Lua' in bodies:
+            longitudes['Lua'] = moon_longitude(jd)
+        others = [body for body in bodies if body != 'Lua']
+        if others:
+            longitudes.update(self.series.geocentric_longitudes(jd, others))
+        return {body: longitudes[body] for body in bodies}
+
+    def speeds(self, jd, bodies: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """Velocidades em longitude, em graus por dia (negativas se retrógrado)"""
+        bodies = list(bodies or BODIES)
+        if self._from_table(terrestrial_time(jd)):
+            return {body: self.table.speed(body, terrestrial_time(jd)) for body in bodies}
+
+        jd = np.asarray(jd, dtype=np.float64)
+        speeds = {}
+        if 'Lua' in bodies:
+            # Derivada analítica da teoria lunar
+            speeds['Lua'] = moon_position(terrestrial_time(jd), ('speed',))['speed']
+        others = [body for body in bodies if body != 'Lua']
+        if others:
+            before = self.longitudes(jd - SPEED_STEP, others)
+            after = self.longitudes(jd + SPEED_STEP, others)
+            speeds.update({
+                body: (np.mod(after[body] - before[body] + 180.0, 360.0) - 180.0) / (2 * SPEED_STEP)
+                for body in others
+            })
+        return {body: speeds[body] for body in bodies}
+
+    def moon(self, jd) -> Dict[str, np.ndarray]:
+        """
+        Longitude, latitude (graus), distância (km) e velocidade (graus/dia)
+        da Lua; longitude e velocidade vêm da mesma fonte que longitudes()
+        """
+        jde = terrestrial_time(jd)
+        if not self._from_table(jde):
+            return moon_position(jde)
+        position = moon_position(jde, ('latitude', 'distance'))
+        position['longitude'] = self.table.longitudes(jde, ['Lua'])['Lua']
+        position['speed'] = self.table.speed('Lua', jde)
+        return position
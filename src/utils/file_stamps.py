@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AURORA SAGRADA - CARIMBOS DE ARQUIVOS DERIVADOS
+Tabelas VSOP87 compiladas, snapshots das bases JavaScript e o arquivo das
+deusas guardam no cabeçalho o tamanho e o mtime_ns das origens, pares
+'<Qq' consecutivos, mais um sha256 do conteúdo. Metadados iguais bastam
+para aceitar o arquivo; quando só o checksum confere (ex.: checkout novo),
+os metadados são regravados no lugar para a próxima abertura não reler as
+origens.
+"""
+
+import os
+import struct
+from pathlib import Path
+from typing import List, Sequence
+
+# Tamanho e mtime_ns de uma origem
+STAMP = struct.Struct('<Qq')
+
+
+def source_stamp(stat: os.stat_result) -> List[int]:
+    """Tamanho e mtime_ns de uma origem, na ordem do cabeçalho"""
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def refresh_stamps(path: Path, offset: int, stamps: Sequence[int]):
+    """
+    Regrava os pares (tamanho, mtime_ns) no cabeçalho de um arquivo derivado
+
+    Só os metadados mudam; o resto do arquivo (inclusive páginas já mapeadas
+    por outros processos) fica intacto.
+
+    Args:
+        path: Arquivo derivado
+        offset: Posição do primeiro par no cabeçalho
+        stamps: Tamanho e mtime_ns de cada origem, em sequência
+    """
+    try:
+        with open(path, 'r+b') as f:
+            f.seek(offset)
+            f.write(b''.join(STAMP.pack(*stamps[i:i + 2]) for i in range(0, len(stamps), 2)))
+    except OSError:
+        # Diretório somente leitura: o checksum volta a ser conferido na próxima abertura
+        pass
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AURORA SAGRADA - ESTRELAS FIXAS
+Os catálogos de data/estrelas-fixas.json e data/asteroides.json (pontos com
+longitude_2000) viram um índice ordenado por longitude J2000. A precessão
+desloca todos os pontos igualmente, então a consulta é levada a J2000 e a
+busca binária num array estendido de -360° a 720° responde "quais pontos
+estão dentro do orbe de λ" em tempo logarítmico, inclusive na volta 0°/360°;
+arrays de longitudes (vários astros ao longo de um intervalo) são
+consultados de uma vez.
+
+    python src/utils/fixed_stars.py --from 2025-01-01 --to 2025-01-31
+"""
+
+import re
+import json
+import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from astro_lib import SIGNS, DateLike, from_julian_day, julian_centuries, to_julian_day
+from chebyshev import BODIES
+from ephemeris import Ephemeris
+
+# Orbe quando nem o ponto nem a configuração do catálogo definem um
+DEFAULT_ORB = 2.0
+
+# Passo (dias) das consultas em lote: a Lua anda ~0,5° por hora
+CONTACT_STEP = 1.0 / 24.0
+
+LONGITUDE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)°\s*(?:(\d+(?:\.\d+)?)')?\s*(.+?)\s*$")
+
+
+def parse_longitude(text: str) -> float:
+    """
+    Longitude eclíptica em graus a partir de "29°50' Leão"
+
+    Raises:
+        ValueError: Texto fora do formato ou signo desconhecido
+    """
+    match = LONGITUDE_PATTERN.match(text)
+    if not match or match.group(3) not in SIGNS:
+        raise ValueError(f"Longitude inválida: {text!r}")
+    degrees, minutes, sign = match.groups()
+    return SIGNS.index(sign) * 30.0 + float(degrees) + float(minutes or 0) / 60.0
+
+
+def general_precession(jd) -> np.ndarray:
+    """Precessão geral em longitude desde J2000, em graus (Lieske, em Meeus cap. 21)"""
+    t = julian_centuries(jd)
+    return (5029.0966 * t + 1.11113 * t**2 - 0.000006 * t**3) / 3600.0
+
+
+def load_catalog(data_dir: Path, include_all: bool = False) -> List[Dict[str, Any]]:
+    """
+    Pontos dos catálogos com longitude J2000
+
+    Estrelas de estrelas-fixas.json (Algol só com incluir_algol) e as
+    entradas de asteroides.json que tragam longitude_2000; include_all
+    ignora incluir_algol. Os asteroides da base atual não trazem
+    longitude_2000 (não são pontos fixos), então só as estrelas entram.
+    """
+    points = []
+    catalogs = [('estrelas-fixas.json', 'estrelas_fixas', 'estrela'), ('asteroides.json', 'asteroides', 'asteroide')]
+    for filename, section, kind in catalogs:
+        path = Path(data_dir) / filename
+        if not path.exists():
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            catalog = json.load(f)
+        config = catalog.get('configuracao', {})
+        for key, entry in catalog.get(section, {}).items():
+            if 'longitude_2000' not in entry:
+                continue
+            if key == 'algol' and not (include_all or config.get('incluir_algol', True)):
+                continue
+            points.append({
+                'key': key,
+                'name': entry.get('nome', key),
+                'kind': kind,
+                'symbol': entry.get('simbolo'),
+                'longitude_2000': parse_longitude(entry['longitude_2000']),
+                'orb': float(entry.get('orbe', config.get('orbe_padrao', DEFAULT_ORB))),
+                'nature': entry.get('natureza'),
+                'meaning': entry.get('significado'),
+            })
+    return points
+
+
+class FixedStarIndex:
+    """Índice por longitude dos pontos fixos, com precessão até a época da consulta"""
+
+    def __init__(self, data_dir: Path, include_all: bool = False):
+        """
+        Args:
+            data_dir: Diretório das bases (estrelas-fixas.json, asteroides.json)
+            include_all: Inclui pontos que a configuração dos catálogos deixa de fora
+        """
+        points = load_catalog(data_dir, include_all)
+        self.points = sorted(points, key=lambda point: point['longitude_2000'])
+        self.longitudes = np.array([point['longitude_2000'] for point in self.points], dtype=np.float64)
+        self.orbs = np.array([point['orb'] for point in self.points], dtype=np.float64)
+        self.max_orb = float(self.orbs.max()) if len(self.points) else 0.0
+        # Cópias a -360° e +360°: janelas que cruzam 0°/360° continuam contíguas
+        self._wrapped = np.concatenate([self.longitudes - 360.0, self.longitudes, self.longitudes + 360.0])
+        self._wrapped_points = np.tile(np.arange(len(self.points)), 3)
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def longitudes_at(self, jd) -> np.ndarray:
+        """Longitudes (equinócio da data) de todos os pontos, na ordem de self.points"""
+        return np.mod(self.longitudes + float(general_precession(jd)), 360.0)
+
+    def matches(self, jd, longitudes) -> Dict[str, np.ndarray]:
+        """
+        Pares (consulta, ponto) dentro do orbe do ponto
+
+        Args:
+            jd: Julian Days (UT) das consultas, escalar ou array
+            longitudes: Longitudes consultadas (broadcast com jd)
+
+        Returns:
+            Arrays paralelos: 'queries' (índice na consulta achatada), 'points'
+            (índice em self.points) e 'separations' (λ consultada - λ do
+            ponto, em graus), em ordem de consulta e de longitude
+        """
+        jd, longitudes = np.broadcast_arrays(np.asarray(jd, dtype=np.float64),
+                                             np.asarray(longitudes, dtype=np.float64))
+        empty = {'queries': np.zeros(0, dtype=np.int64), 'points': np.zeros(0, dtype=np.int64),
+                 'separations': np.zeros(0)}
+        if not len(self.points) or not longitudes.size:
+            return empty
+
+        # λ na época da consulta vira λ J2000: uma subtração em vez de precessar o catálogo
+        query = np.mod(longitudes.ravel() - general_precession(jd.ravel()), 360.0)
+        lo = np.searchsorted(self._wrapped, query - self.max_orb, side='left')
+        hi = np.searchsorted(self._wrapped, query + self.max_orb, side='right')
+        width = hi - lo
+        if not width.any():
+            return empty
+
+        # Candidatos (no máximo a janela mais larga) filtrados pelo orbe de cada ponto
+        offsets = np.arange(width.max())
+        queries, offsets = np.nonzero(offsets < width[:, None])
+        slots = lo[queries] + offsets
+        separations = query[queries] - self._wrapped[slots]
+        points = self._wrapped_points[slots]
+        keep = np.abs(separations) <= self.orbs[points]
+        return {'queries': queries[keep], 'points': points[keep], 'separations': separations[keep]}
+
+    def within_orb(self, longitude: float, moment: DateLike) -> List[Dict[str, Any]]:
+        """Pontos dentro do orbe de uma longitude numa data (12:00 UTC) ou instante"""
+        jd = to_julian_day(moment)
+        found = self.matches(jd, longitude)
+        current = self.longitudes_at(jd)
+        return [{**self.points[point], 'longitude': float(current[point]),
+                 'separation': float(separation)}
+                for point, separation in zip(found['points'], found['separations'])]
+
+    def contacts_between(self, ephemeris: Ephemeris, start: DateLike, end: DateLike,
+                         bodies: Optional[Sequence[str]] = None,
+                         step: float = CONTACT_STEP) -> List[Dict[str, Any]]:
+        """
+        Contatos de astros com os pontos em [start, end), numa grade de tempo
+
+        Todas as longitudes do intervalo são consultadas num único lote; cada
+        passagem de um astro pelo orbe de um ponto aparece uma vez, no
+        instante da grade mais próximo do exato.
+
+        Returns:
+            Dicts com os campos do ponto, 'body', 'instant', 'jd', 'longitude'
+            (do ponto no instante) e 'separation', em ordem de instante
+        """
+        bodies = list(bodies or BODIES)
+        first = to_julian_day(start)
+        jd = first + np.arange(np.ceil((to_julian_day(end) - first) / step)) * step
+        longitudes = ephemeris.longitudes(jd, bodies)
+        found = self.matches(np.tile(jd, len(bodies)), np.concatenate([longitudes[body] for body in bodies]))
+
+        if not len(found['queries']):
+            return []
+
+        # Uma passagem = amostras consecutivas do mesmo par; fica a de menor separação
+        body_index, time_index = np.divmod(found['queries'], len(jd))
+        pair = body_index * len(self.points) + found['points']
+        order = np.lexsort((time_index, pair))
+        pair, time_index, separations = pair[order], time_index[order], found['separations'][order]
+        starts = np.flatnonzero(np.r_[True, (np.diff(pair) != 0) | (np.diff(time_index) != 1)])
+        runs = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, len(pair)]))
+        ranked = np.lexsort((np.abs(separations), runs))
+        best = ranked[np.r_[True, np.diff(runs[ranked]) != 0]]
+
+        contacts = []
+        for i in best:
+            body, point = divmod(int(pair[i]), len(self.points))
+            time = int(time_index[i])
+            contacts.append({
+                **self.points[point],
+                'body': bodies[body],
+                'instant': from_julian_day(first) + datetime.timedelta(days=time * step),
+                'jd': float(jd[time]),
+                'longitude': float(self.longitudes_at(jd[time])[point]),
+                'separation': float(separations[i]),
+            })
+        return sorted(contacts, key=lambda contact: (contact['jd'], contact['body']))
+
+
+def main():
+    """Lista os contatos dos astros com as estrelas fixas num intervalo"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Estrelas fixas Aurora Sagrada')
+    parser.add_argument('--from', dest='start', type=str, help='Data inicial YYYY-MM-DD (padrão: hoje)')
+    parser.add_argument('--to', dest='end', type=str, help='Data final YYYY-MM-DD (padrão: 7 dias)')
+    parser.add_argument('--all', action='store_true', help='Inclui pontos desativados na configuração')
+    parser.add_argument('--data-dir', type=str, help='Diretório das bases de dados')
+
+    args = parser.parse_args()
+
+    data_dir = Path(args.data_dir) if args.data_dir else Path(__file__).resolve().parent.parent.parent / 'data'
+    index = FixedStarIndex(data_dir, args.all)
+
+    start = datetime.datetime.strptime(args.start, '%Y-%m-%d') if args.start else datetime.datetime.utcnow()
+    end = (datetime.datetime.strptime(args.end, '%Y-%m-%d') + datetime.timedelta(days=1)
+           if args.end else start + datetime.timedelta(days=7))
+
+    for contact in index.contacts_between(Ephemeris(data_dir), start, end):
+        print(f"{contact['instant']:%Y-%m-%d %H:%M} UTC  {contact['body']:<9} ☌ {contact['name']:<10} "
+              f"({contact['separation']:+.2f}°)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AURORA SAGRADA - DEUSAS DO DIA
+deusas365Completa (data/BasedeDadosdoguiaLunar.js.backup, completada pela
+versão simplificada BasedeDadosdoguiaLunar.js) compilada num arquivo
+compacto: um índice de largura fixa por dia do ano (offset e tamanho) seguido
+dos registros em JSON. O arquivo é aberto com mmap e só o registro do dia
+pedido é decodificado; a base JavaScript inteira é lida apenas ao compilar,
+quando uma das origens muda.
+
+    python src/utils/goddess_store.py --date 2025-03-14
+    python src/utils/goddess_store.py compile
+"""
+
+import os
+import json
+import mmap
+import struct
+import hashlib
+import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from file_stamps import refresh_stamps, source_stamp
+from js_data import SNAPSHOT_DIRNAME, load_js_file
+
+STORE_MAGIC = b'AURDEUS1'
+# Versão do formato: alterar invalida os arquivos existentes
+STORE_VERSION = 1
+STORE_FILENAME = 'deusas365.store'
+
+# Origens em ordem de preferência: a base completa e a simplificada (dias que faltam na completa)
+SOURCES = ('BasedeDadosdoguiaLunar.js.backup', 'BasedeDadosdoguiaLunar.js')
+DECLARATION = 'deusas365Completa'
+
+# Dias 1-366 (o 366º só existe em anos bissextos)
+DAYS = 366
+
+# magic, versão, dias, (tamanho, mtime_ns) de cada origem, sha256 das origens
+STORE_HEADER = struct.Struct('<8sII' + 'Qq' * len(SOURCES) + '32s')
+STAMPS_OFFSET = struct.calcsize('<8sII')
+# Entrada do índice: offset (a partir do fim do índice) e tamanho do registro
+INDEX_ENTRY = struct.Struct('<II')
+
+
+def store_path(data_dir: Path, store_dir: Optional[Path] = None) -> Path:
+    """Caminho do arquivo compilado (padrão: data/.snapshots/, ao lado dos snapshots)"""
+    directory = Path(store_dir) if store_dir else Path(data_dir) / SNAPSHOT_DIRNAME
+    return directory / STORE_FILENAME
+
+
+def _source_stamps(data_dir: Path) -> List[int]:
+    """Tamanho e mtime_ns de cada origem (zeros se ausente)"""
+    stamps = []
+    for filename in SOURCES:
+        try:
+            stat = (Path(data_dir) / filename).stat()
+            stamps.extend(source_stamp(stat))
+        except OSError:
+            stamps.extend([0, 0])
+    return stamps
+
+
+def _sources_digest(data_dir: Path) -> bytes:
+    digest = hashlib.sha256()
+    for filename in SOURCES:
+        path = Path(data_dir) / filename
+        digest.update(path.read_bytes() if path.exists() else b'')
+        digest.update(b'\0')
+    return digest.digest()
+
+
+def _normalize(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Registro de uma deusa, com a história no nível superior (a base completa às vezes a põe nas correspondências)"""
+    record = dict(entry)
+    correspondences = record.get('correspondencias')
+    if isinstance(correspondences, dict) and 'historia' in correspondences:
+        correspondences = dict(correspondences)
+        history = correspondences.pop('historia')
+        record.setdefault('historia', history)
+        record['correspondencias'] = correspondences
+    return record
+
+
+def load_goddesses(data_dir: Path) -> Dict[int, Dict[str, Any]]:
+    """
+    Deusas por dia do ano, de todas as origens
+
+    Um dia presente em mais de uma origem fica com o registro da primeira
+    (a base completa).
+    """
+    goddesses: Dict[int, Dict[str, Any]] = {}
+    for filename in SOURCES:
+        path = Path(data_dir) / filename
+        if not path.exists():
+            continue
+        entries = load_js_file(path).get(DECLARATION, {})
+        for key, entry in entries.items():
+            try:
+                day = int(key)
+            except (TypeError, ValueError):
+                continue
+            if 1 <= day <= DAYS and isinstance(entry, dict) and day not in goddesses:
+                goddesses[day] = _normalize(entry)
+    return goddesses
+
+
+def build_store(data_dir: Path) -> bytes:
+    """
+    Conteúdo do arquivo indexado a partir das origens
+
+    Dias sem registro em nenhuma origem apontam, em rodízio, para os
+    registros existentes (como getGoddessOfDay na base simplificada); os
+    dados não são duplicados, só a entrada do índice.
+
+    Raises:
+        ValueError: Nenhuma origem traz deusas
+    """
+    stamps = _source_stamps(data_dir)
+    goddesses = load_goddesses(data_dir)
+    if not goddesses:
+        raise ValueError(f"{DECLARATION} não encontrado em {data_dir}")
+
+    available = sorted(goddesses)
+    records, offsets = [], {}
+    size = 0
+    for day in available:
+        encoded = json.dumps(goddesses[day], ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        offsets[day] = (size, len(encoded))
+        records.append(encoded)
+        size += len(encoded)
+
+    index = b''.join(
+        INDEX_ENTRY.pack(*offsets[day if day in offsets else available[(day - 1) % len(available)]])
+        for day in range(1, DAYS + 1)
+    )
+    header = STORE_HEADER.pack(STORE_MAGIC, STORE_VERSION, DAYS, *stamps, _sources_digest(data_dir))
+    return b''.join([header, index, *records])
+
+
+def compile_store(data_dir: Path, store_dir: Optional[Path] = None) -> Path:
+    """Compila as deusas no arquivo indexado (escrita atômica)"""
+    content = build_store(data_dir)
+    target = store_path(data_dir, store_dir)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, target)
+    return target
+
+
+def _is_current(path: Path, data_dir: Path) -> bool:
+    """Se o arquivo compilado corresponde às origens atuais"""
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(STORE_HEADER.size)
+    except OSError:
+        return False
+    if len(header) != STORE_HEADER.size:
+        return False
+    magic, version, days, *stamps, checksum = STORE_HEADER.unpack(header)
+    if magic != STORE_MAGIC or version != STORE_VERSION or days != DAYS:
+        return False
+    current = _source_stamps(data_dir)
+    if stamps != current:
+        # Metadados diferentes (ex.: checkout novo): confere o conteúdo
+        if _sources_digest(data_dir) != checksum:
+            return False
+        refresh_stamps(path, STAMPS_OFFSET, current)
+    return True
+
+
+class GoddessStore:
+    """Deusas do dia num arquivo mapeado em memória, decodificadas uma a uma"""
+
+    def __init__(self, buffer):
+        """
+        Args:
+            buffer: Conteúdo gerado por build_store (mmap do arquivo ou bytes)
+
+        Raises:
+            ValueError: Conteúdo de outro formato ou versão
+        """
+        magic, version, days, *_ = STORE_HEADER.unpack_from(buffer)
+        if magic != STORE_MAGIC or version != STORE_VERSION:
+            raise ValueError("Arquivo de deusas inválido")
+        self._buffer = buffer
+        self.days = days
+        self._records_start = STORE_HEADER.size + days * INDEX_ENTRY.size
+
+    @classmethod
+    def from_file(cls, path: Path) -> 'GoddessStore':
+        """Mapeia o arquivo compilado (páginas compartilhadas entre processos)"""
+        with open(path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(buffer)
+        except (ValueError, struct.error):
+            buffer.close()
+            raise ValueError(f"Arquivo de deusas inválido: {path}")
+
+    @classmethod
+    def open(cls, data_dir: Path, store_dir: Optional[Path] = None) -> Optional['GoddessStore']:
+        """
+        Abre o arquivo, recompilando se as origens mudaram; None sem origens
+
+        Em diretório somente leitura o conteúdo compilado fica em memória.
+        """
+        path = store_path(data_dir, store_dir)
+        try:
+            if _is_current(path, data_dir):
+                return cls.from_file(path)
+            try:
+                return cls.from_file(compile_store(data_dir, store_dir))
+            except OSError:
+                return cls(build_store(data_dir))
+        except (OSError, ValueError):
+            return None
+
+    def __len__(self) -> int:
+        return self.days
+
+    def record(self, day_of_year: int) -> Dict[str, Any]:
+        """
+        Registro completo (invocação, correspondências, oferendas...) de um dia do ano
+
+        Raises:
+            KeyError: Dia fora de 1-366
+        """
+        if not 1 <= day_of_year <= self.days:
+            raise KeyError(day_of_year)
+        offset, length = INDEX_ENTRY.unpack_from(self._buffer, STORE_HEADER.size + (day_of_year - 1) * INDEX_ENTRY.size)
+        start = self._records_start + offset
+        return json.loads(self._buffer[start:start + length].decode('utf-8'))
+
+    def for_date(self, date: datetime.date) -> Dict[str, Any]:
+        """Deusa do dia de uma data"""
+        return self.record(date.timetuple().tm_yday)
+
+    def close(self):
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+
+def main():
+    """Mostra a deusa de uma data ou compila o arquivo indexado"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Deusas do dia Aurora Sagrada')
+    parser.add_argument('command', nargs='?', choices=['show', 'compile'], default='show', help='Ação a executar')
+    parser.add_argument('--date', type=str, help='Data YYYY-MM-DD (padrão: hoje)')
+    parser.add_argument('--data-dir', type=str, help='Diretório das bases de dados')
+    parser.add_argument('--store-dir', type=str, help='Diretório do arquivo compilado')
+
+    args = parser.parse_args()
+
+    data_dir = Path(args.data_dir) if args.data_dir else Path(__file__).resolve().parent.parent.parent / 'data'
+    store_dir = Path(args.store_dir) if args.store_dir else None
+
+    if args.command == 'compile':
+        print(f"Arquivo gerado: {compile_store(data_dir, store_dir)}")
+        return
+
+    store = GoddessStore.open(data_dir, store_dir)
+    if store is None:
+        parser.error(f"{DECLARATION} não encontrado em {data_dir}")
+    date = datetime.datetime.strptime(args.date, '%Y-%m-%d').date() if args.date else datetime.date.today()
+    print(json.dumps(store.for_date(date), ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
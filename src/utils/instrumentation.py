@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AURORA SAGRADA - INSTRUMENTAÇÃO
+Spans de tempo, contadores e ganchos para as etapas da geração de
+relatórios, exportados em texto no formato do Prometheus e em logs JSON
+(uma linha por evento). Desligada, cada ponto instrumentado custa só a
+verificação de um atributo.
+
+    metrics = Instrumentation(enabled=True)
+    metrics.subscribe(json_log_hook())
+    with metrics.span('doc_build'):
+        ...
+    metrics.count('pages', 3)
+    print(metrics.prometheus())
+"""
+
+import sys
+import json
+import time
+import threading
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple
+
+# Evento entregue aos ganchos: {type, name, labels, value, timestamp}
+Hook = Callable[[Dict[str, Any]], None]
+MetricKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class _NullSpan:
+    """Span de uma instrumentação desligada"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Mede o tempo de um bloco e registra ao sair"""
+
+    __slots__ = ('owner', 'name', 'labels', 'start')
+
+    def __init__(self, owner: 'Instrumentation', name: str, labels: Dict[str, Any]):
+        self.owner = owner
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        labels = self.labels if exc_type is None else {**self.labels, 'error': exc_type.__name__}
+        self.owner.observe(self.name, time.perf_counter() - self.start, **labels)
+        return False
+
+
+def _key(name: str, labels: Dict[str, Any]) -> MetricKey:
+    return name, tuple(sorted((str(k), str(v)) for k, v in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels_text(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in labels) + '}'
+
+
+class Instrumentation:
+    """Registro de spans e contadores, com ganchos de eventos"""
+
+    def __init__(self, enabled: bool = False, prefix: str = 'aurora', record_events: bool = False):
+        """
+        Args:
+            enabled: Se os pontos instrumentados registram algo
+            prefix: Prefixo dos nomes exportados ao Prometheus
+            record_events: Guarda os eventos no snapshot, para que merge() os
+                entregue aos ganchos de outro processo
+        """
+        self.enabled = enabled
+        self.prefix = prefix
+        self.record_events = record_events
+        self._lock = threading.Lock()
+        self._spans: Dict[MetricKey, List[float]] = {}
+        self._counters: Dict[MetricKey, float] = {}
+        self._events: List[Dict[str, Any]] = []
+        self._hooks: List[Hook] = []
+
+    def span(self, name: str, **labels):
+        """Context manager que mede o bloco (nada faz se desligada)"""
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self, name, labels)
+
+    def observe(self, name: str, seconds: float, **labels):
+        """Registra a duração de uma etapa já medida"""
+        if not self.enabled:
+            return
+        key = _key(name, labels)
+        with self._lock:
+            summary = self._spans.setdefault(key, [0, 0.0, 0.0])
+            summary[0] += 1
+            summary[1] += seconds
+            summary[2] = max(summary[2], seconds)
+        self._emit('span', name, labels, seconds)
+
+    def count(self, name: str, value: float = 1, **labels):
+        """Incrementa um contador"""
+        if not self.enabled:
+            return
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+        self._emit('counter', name, labels, value)
+
+    def subscribe(self, hook: Hook) -> Hook:
+        """Entrega cada evento a hook; devolve o próprio gancho (para unsubscribe)"""
+        self._hooks.append(hook)
+        return hook
+
+    def unsubscribe(self, hook: Hook):
+        """Remove um gancho"""
+        if hook in self._hooks:
+            self._hooks.remove(hook)
+
+    @property
+    def has_hooks(self) -> bool:
+        return bool(self._hooks)
+
+    def _emit(self, kind: str, name: str, labels: Dict[str, Any], value: float):
+        if not self._hooks and not self.record_events:
+            return
+        event = {'type': kind, 'name': name, 'labels': labels, 'value': value, 'timestamp': time.time()}
+        if self.record_events:
+            with self._lock:
+                self._events.append(event)
+        self._deliver(event)
+
+    def _deliver(self, event: Dict[str, Any]):
+        for hook in list(self._hooks):
+            try:
+                hook(event)
+            except Exception as e:
+                # Um gancho com defeito não interrompe a geração
+                print(f"Erro no gancho de instrumentação: {e}", file=sys.stderr)
+
+    def snapshot(self, reset: bool = False) -> Dict[str, List[Any]]:
+        """
+        Estado agregado serializável (para juntar métricas de outros processos)
+
+        Returns:
+            {'spans': [[nome, rótulos, n, soma, máx], ...], 'counters': [[nome, rótulos, valor], ...]},
+            mais 'events' (em ordem) com record_events
+        """
+        with self._lock:
+            data = {
+                'spans': [[name, list(labels), *summary] for (name, labels), summary in self._spans.items()],
+                'counters': [[name, list(labels), value] for (name, labels), value in self._counters.items()],
+            }
+            if self.record_events:
+                data['events'] = list(self._events)
+            if reset:
+                self._spans.clear()
+                self._counters.clear()
+                self._events.clear()
+        return data
+
+    def merge(self, snapshot: Dict[str, List[Any]]):
+        """Soma um snapshot (de outro processo) a este registro e entrega seus eventos aos ganchos"""
+        with self._lock:
+            for name, labels, count, total, peak in snapshot.get('spans', []):
+                summary = self._spans.setdefault((name, tuple(map(tuple, labels))), [0, 0.0, 0.0])
+                summary[0] += count
+                summary[1] += total
+                summary[2] = max(summary[2], peak)
+            for name, labels, value in snapshot.get('counters', []):
+                key = (name, tuple(map(tuple, labels)))
+                self._counters[key] = self._counters.get(key, 0) + value
+        for event in snapshot.get('events', []):
+            self._deliver(event)
+
+    def reset(self):
+        """Zera spans e contadores"""
+        self.snapshot(reset=True)
+
+    def prometheus(self) -> str:
+        """Exposição em texto do Prometheus (formato 0.0.4)"""
+        snapshot = self.snapshot()
+        lines = []
+        spans: Dict[str, List[Any]] = {}
+        for name, labels, count, total, peak in snapshot['spans']:
+            spans.setdefault(name, []).append((tuple(map(tuple, labels)), count, total, peak))
+        for name in sorted(spans):
+            metric = f"{self.prefix}_{name}_seconds"
+            lines.append(f"# HELP {metric} Duração da etapa {name}")
+            lines.append(f"# TYPE {metric} summary")
+            for labels, count, total, _ in sorted(spans[name]):
+                lines.append(f"{metric}_count{_labels_text(labels)} {count}")
+                lines.append(f"{metric}_sum{_labels_text(labels)} {total:.9f}")
+            lines.append(f"# TYPE {metric}_max gauge")
+            for labels, _, _, peak in sorted(spans[name]):
+                lines.append(f"{metric}_max{_labels_text(labels)} {peak:.9f}")
+
+        counters: Dict[str, List[Any]] = {}
+        for name, labels, value in snapshot['counters']:
+            counters.setdefault(name, []).append((tuple(map(tuple, labels)), value))
+        for name in sorted(counters):
+            metric = f"{self.prefix}_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for labels, value in sorted(counters[name]):
+                lines.append(f"{metric}{_labels_text(labels)} {value:g}")
+        return '\n'.join(lines) + '\n'
+
+
+def json_log_hook(stream: Optional[TextIO] = None) -> Hook:
+    """Gancho que escreve cada evento como uma linha JSON (padrão: stderr)"""
+    def hook(event: Dict[str, Any]):
+        target = stream or sys.stderr
+        target.write(json.dumps(event, ensure_ascii=False, default=str) + '\n')
+        target.flush()
+    return hook
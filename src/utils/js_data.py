@@ -0,0 +1,539 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AURORA SAGRADA - LEITURA DAS BASES DE DADOS JAVASCRIPT
+Tokenizador de passada única (tempo linear) que converte as declarações
+`const/let/var/export const NOME = <literal>` dos arquivos .js/.ts de data/
+em dicts e listas Python. Funções, métodos e expressões não literais são
+ignorados sem interromper a leitura.
+
+O resultado é gravado num snapshot binário versionado e invalidado quando o
+arquivo de origem muda:
+
+    python src/utils/js_data.py compile [--data-dir DIR]
+"""
+
+import os
+import re
+import marshal
+import struct
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from file_stamps import refresh_stamps, source_stamp
+
+# Snapshots em marshal: só tipos de dados (nada é executado ao carregar)
+SNAPSHOT_MAGIC = b'AURJSDB2'
+# Versão do parser: alterar invalida todos os snapshots
+PARSER_VERSION = 1
+# magic, versão do parser, versão do marshal, tamanho, mtime_ns, sha256 da origem
+SNAPSHOT_HEADER = struct.Struct('<8sIIQq32s')
+STAMP_OFFSET = struct.calcsize('<8sII')
+SNAPSHOT_SUFFIX = '.snapshot'
+SNAPSHOT_DIRNAME = '.snapshots'
+
+SOURCE_PATTERNS = ('*.js', '*.js.backup', '*.ts')
+
+# Tipos de token
+NAME, NUMBER, STRING, TEMPLATE, PUNCT, REGEX = 'name', 'number', 'string', 'template', 'punct', 'regex'
+
+_TOKEN_RE = re.compile(r'''
+    (?P<skip>(?:\s+|//[^\n]*|/\*.*?\*/)+)
+  | (?P<number>0[xX][0-9a-fA-F_]+|0[oO][0-7_]+|0[bB][01_]+
+        |(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][+-]?\d+)?n?)
+  | (?P<name>[A-Za-z_$\u00c0-\uffff][\w$\u00c0-\uffff]*)
+  | (?P<string>"(?:[^"\\\n]|\\.|\\\n)*"|'(?:[^'\\\n]|\\.|\\\n)*')
+  | (?P<template>`)
+  | (?P<punct>=>|\.\.\.|\?\?=?|\?\.|[=!]==?|[<>]=?|&&=?|\|\|=?|\*\*=?|[-+*/%&|^]=?|\+\+|--|[{}()\[\];,.:?~!<>=@\#])
+''', re.VERBOSE | re.DOTALL)
+
+_REGEX_RE = re.compile(r'/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[a-z]*')
+
+# Depois destes tokens uma '/' inicia uma expressão regular, não uma divisão
+_REGEX_AFTER_NAMES = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void', 'throw'}
+_REGEX_AFTER_PUNCT = set('([{,;:=!&|?+-*%<>~^') | {
+    '=>', '==', '===', '!=', '!==', '<=', '>=', '&&', '||', '??', '+=', '-=', '*=', '/=', '%='
+}
+
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+_ESCAPE_RE = re.compile(r'\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\n|.)', re.DOTALL)
+
+_KEYWORD_VALUES = {'true': True, 'false': False, 'null': None, 'undefined': None}
+_OPEN = {'(': ')', '[': ']', '{': '}'}
+
+Token = Tuple[str, str, int]
+
+
+class JSParseError(ValueError):
+    """Erro de sintaxe na leitura de uma base JavaScript"""
+
+
+class _Skipped:
+    """Marca valores não literais (funções, expressões) que não entram no resultado"""
+
+    def __repr__(self):
+        return '<não literal>'
+
+
+SKIPPED = _Skipped()
+
+
+def _unescape(match: 're.Match') -> str:
+    code = match.group(1)
+    if code == '\n':
+        return ''
+    if code[0] == 'u':
+        return chr(int(code[1:].strip('{}'), 16))
+    if code[0] == 'x':
+        return chr(int(code[1:], 16))
+    return _ESCAPES.get(code, code)
+
+
+def _string_value(raw: str) -> str:
+    """Conteúdo de um literal de string (sem aspas, escapes resolvidos)"""
+    body = raw[1:-1]
+    return _ESCAPE_RE.sub(_unescape, body) if '\\' in body else body
+
+
+def _number_value(raw: str):
+    raw = raw.replace('_', '').rstrip('n')
+    if raw[:2].lower() in ('0x', '0o', '0b'):
+        return int(raw, 0)
+    if any(c in raw for c in '.eE'):
+        return float(raw)
+    return int(raw)
+
+
+def _scan_template(source: str, pos: int) -> int:
+    """
+    Posição logo após o template literal que começa em pos
+
+    Substituições ${...} podem conter chaves, strings e outros templates.
+    """
+    i = pos + 1
+    n = len(source)
+    while i < n:
+        c = source[i]
+        if c == '\\':
+            i += 2
+        elif c == '`':
+            return i + 1
+        elif c == '$' and source.startswith('${', i):
+            depth = 1
+            i += 2
+            while depth and i < n:
+                c = source[i]
+                if c == '{':
+                    depth += 1
+                elif c == '}':
+                    depth -= 1
+                elif c == '`':
+                    i = _scan_template(source, i) - 1
+                elif c in '"\'':
+                    match = _TOKEN_RE.match(source, i)
+                    if not match or match.lastgroup != 'string':
+                        raise JSParseError(f"String não terminada na posição {i}")
+                    i = match.end() - 1
+                i += 1
+        else:
+            i += 1
+    raise JSParseError(f"Template literal não terminado na posição {pos}")
+
+
+def tokenize(source: str) -> Iterator[Token]:
+    """Gera (tipo, texto, posição) para cada token do código-fonte"""
+    pos = 0
+    n = len(source)
+    previous: Optional[Token] = None
+    match_token = _TOKEN_RE.match
+
+    while pos < n:
+        if source[pos] == '/' and not source.startswith(('//', '/*'), pos) and (
+            previous is None
+            or (previous[0] == PUNCT and previous[1] in _REGEX_AFTER_PUNCT)
+            or (previous[0] == NAME and previous[1] in _REGEX_AFTER_NAMES)
+        ):
+            match = _REGEX_RE.match(source, pos)
+            if match:
+                previous = (REGEX, match.group(), pos)
+                yield previous
+                pos = match.end()
+                continue
+
+        match = match_token(source, pos)
+        if match is None:
+            raise JSParseError(f"Caractere inesperado {source[pos]!r} na posição {pos}")
+        kind = match.lastgroup
+        if kind == 'skip':
+            pos = match.end()
+            continue
+        if kind == TEMPLATE:
+            end = _scan_template(source, pos)
+            previous = (TEMPLATE, source[pos:end], pos)
+        else:
+            end = match.end()
+            previous = (kind, match.group(), pos)
+        yield previous
+        pos = end
+
+
+class _Parser:
+    """Parser descendente recursivo sobre a lista de tokens"""
+
+    def __init__(self, source: str):
+        self.tokens: List[Token] = list(tokenize(source))
+        self.tokens.append(('eof', '', len(source)))
+        self.index = 0
+        self.bindings: Dict[str, Any] = {}
+
+    def peek(self, offset: int = 0) -> Token:
+        return self.tokens[min(self.index + offset, len(self.tokens) - 1)]
+
+    def next(self) -> Token:
+        token = self.tokens[self.index]
+        if token[0] != 'eof':
+            self.index += 1
+        return token
+
+    def at(self, kind: str, text: Optional[str] = None, offset: int = 0) -> bool:
+        token = self.peek(offset)
+        return token[0] == kind and (text is None or token[1] == text)
+
+    def expect(self, kind: str, text: str) -> Token:
+        token = self.next()
+        if token[0] != kind or token[1] != text:
+            raise JSParseError(f"Esperado {text!r} na posição {token[2]}, encontrado {token[1]!r}")
+        return token
+
+    def skip_balanced(self):
+        """Consome um grupo (), [] ou {} inteiro"""
+        closing = [_OPEN[self.next()[1]]]
+        while closing:
+            kind, text, pos = self.next()
+            if kind == 'eof':
+                raise JSParseError(f"Grupo não fechado antes da posição {pos}")
+            if kind == PUNCT:
+                if text in _OPEN:
+                    closing.append(_OPEN[text])
+                elif text in ')]}':
+                    if text != closing.pop():
+                        raise JSParseError(f"{text!r} inesperado na posição {pos}")
+
+    def skip_expression(self):
+        """Consome uma expressão até ',' ';' ou o fechamento do grupo externo"""
+        while True:
+            kind, text, _ = self.peek()
+            if kind == 'eof':
+                return
+            if kind == PUNCT:
+                if text in _OPEN:
+                    self.skip_balanced()
+                    continue
+                if text in ',;)]}':
+                    return
+            self.next()
+
+    def _at_close(self) -> bool:
+        """
+        Fim de objeto ou array
+
+        As bases têm objetos fechados com ']' e arrays com '}'; aceitar qualquer
+        um dos dois mantém o restante do arquivo legível.
+        """
+        return self.at(PUNCT, '}') or self.at(PUNCT, ']')
+
+    def _at_value_end(self) -> bool:
+        kind, text, _ = self.peek()
+        return kind == 'eof' or (kind == PUNCT and text in ',;)]}')
+
+    def _literal(self):
+        """Valor literal simples no token atual, ou SKIPPED"""
+        kind, text, _ = self.peek()
+        sign = 1
+        if kind == PUNCT and text in '+-' and self.at(NUMBER, offset=1):
+            sign = -1 if text == '-' else 1
+            self.next()
+            kind, text, _ = self.peek()
+        if kind == NUMBER:
+            self.next()
+            return sign * _number_value(text)
+        if kind == STRING:
+            self.next()
+            return _string_value(text)
+        if kind == TEMPLATE and '${' not in text:
+            self.next()
+            return _string_value(text).replace('\r\n', '\n')
+        if kind == NAME and text in _KEYWORD_VALUES:
+            self.next()
+            return _KEYWORD_VALUES[text]
+        if kind == NAME and text in ('Infinity', 'NaN'):
+            self.next()
+            return sign * float(text.lower().replace('infinity', 'inf'))
+        return SKIPPED
+
+    def value(self):
+        """Lê um valor; expressões não literais são consumidas e viram SKIPPED"""
+        if self.at(PUNCT, '{'):
+            result = self.object()
+        elif self.at(PUNCT, '['):
+            result = self.array()
+        else:
+            result = self._literal()
+        if result is SKIPPED or not self._at_value_end():
+            # Função, chamada, operação aritmética, `as const` etc.
+            self.skip_expression()
+            return SKIPPED
+        return result
+
+    def object(self) -> Dict[Any, Any]:
+        self.expect(PUNCT, '{')
+        result: Dict[Any, Any] = {}
+        while not self._at_close():
+            kind, text, pos = self.peek()
+            if kind == 'eof':
+                raise JSParseError(f"Objeto não fechado (aberto antes da posição {pos})")
+
+            if kind == PUNCT and text == '...':
+                # Espalhamento: incorpora apenas bindings já conhecidos
+                self.next()
+                if self.at(NAME) and self.peek(1)[1] in ',}' and isinstance(self.bindings.get(self.peek()[1]), dict):
+                    result.update(self.bindings[self.next()[1]])
+                else:
+                    self.skip_expression()
+            elif kind == PUNCT and text == '[':
+                # Chave computada
+                self.skip_balanced()
+                self.skip_expression()
+            elif kind in (NAME, STRING, NUMBER):
+                self.next()
+                key = _string_value(text) if kind == STRING else _number_value(text) if kind == NUMBER else text
+                if kind == NAME and text in ('get', 'set', 'async', 'static') and (self.at(NAME) or self.at(PUNCT, '[')):
+                    # Acessor ou método assíncrono
+                    self.next()
+                    self.skip_expression()
+                elif self.at(PUNCT, ':'):
+                    self.next()
+                    value = self.value()
+                    if value is not SKIPPED:
+                        result[key] = value
+                elif self.at(PUNCT, '('):
+                    # Método abreviado
+                    self.skip_expression()
+                elif kind == NAME and self.peek()[1] in (',', '}') and self.peek()[0] == PUNCT:
+                    # Propriedade abreviada
+                    if text in self.bindings:
+                        result[text] = self.bindings[text]
+                else:
+                    self.skip_expression()
+            elif kind == PUNCT and text == '*':
+                # Método gerador
+                self.next()
+                self.next()
+                self.skip_expression()
+            else:
+                raise JSParseError(f"Chave de objeto inesperada {text!r} na posição {pos}")
+
+            if not self._at_close():
+                self.expect(PUNCT, ',')
+        self.next()
+        return result
+
+    def array(self) -> List[Any]:
+        self.expect(PUNCT, '[')
+        result: List[Any] = []
+        # Pares 'chave: valor' escritos por engano dentro de colchetes
+        pairs: Dict[Any, Any] = {}
+        while not self._at_close():
+            if self.at('eof'):
+                raise JSParseError("Array não fechado")
+            if self.peek()[0] in (NAME, STRING, NUMBER) and self.at(PUNCT, ':', 1):
+                kind, text, _ = self.next()
+                self.next()
+                key = _string_value(text) if kind == STRING else _number_value(text) if kind == NUMBER else text
+                value = self.value()
+                if value is not SKIPPED:
+                    pairs[key] = value
+            elif self.at(PUNCT, ','):
+                # Elemento vazio
+                self.next()
+                result.append(None)
+                continue
+            elif self.at(PUNCT, '...'):
+                self.next()
+                if self.at(NAME) and isinstance(self.bindings.get(self.peek()[1]), list) and self.peek(1)[1] in ',]':
+                    result.extend(self.bindings[self.next()[1]])
+                else:
+                    self.skip_expression()
+            else:
+                value = self.value()
+                if value is not SKIPPED:
+                    result.append(value)
+            if not self._at_close():
+                self.expect(PUNCT, ',')
+        self.next()
+        if pairs:
+            return result + [pairs] if result else pairs
+        return result
+
+    def declarations(self):
+        """Lê a lista de declarações após const/let/var"""
+        while self.at(NAME):
+            name = self.next()[1]
+            if self.at(PUNCT, ':'):
+                # Anotação de tipo TypeScript (genéricos podem conter vírgulas)
+                angles = 0
+                while not self.at('eof') and not (angles == 0 and (self.at(PUNCT, '=') or self._at_value_end())):
+                    kind, text, _ = self.peek()
+                    if kind == PUNCT and text in _OPEN:
+                        self.skip_balanced()
+                        continue
+                    if kind == PUNCT and text in ('<', '>', '>='):
+                        angles += 1 if text == '<' else -1
+                        if text == '>=':
+                            # '>=' fecha o genérico e inicia a atribuição
+                            break
+                    self.next()
+            if self.at(PUNCT, '='):
+                self.next()
+                value = self.value()
+                if value is not SKIPPED:
+                    self.bindings[name] = value
+            if not self.at(PUNCT, ','):
+                return
+            self.next()
+
+    def program(self) -> Dict[str, Any]:
+        depth = 0
+        while not self.at('eof'):
+            kind, text, _ = self.peek()
+            if depth == 0 and kind == NAME:
+                if text == 'export' and self.at(NAME, 'default', 1) and self.at(PUNCT, '{', 2):
+                    self.next()
+                    self.next()
+                    value = self.value()
+                    if value is not SKIPPED:
+                        self.bindings['default'] = value
+                    continue
+                if text in ('const', 'let', 'var') and self.at(NAME, offset=1):
+                    self.next()
+                    self.declarations()
+                    continue
+            if kind == PUNCT and text in _OPEN:
+                depth += 1
+            elif kind == PUNCT and text in ')]}':
+                depth -= 1
+            self.next()
+        return self.bindings
+
+
+def parse_js(source: str) -> Dict[str, Any]:
+    """
+    Extrai as declarações de nível superior com valor literal
+
+    Returns:
+        Dict nome -> valor (dicts, listas, strings, números, bool, None);
+        `export default {...}` aparece como 'default'.
+    """
+    if source.startswith('\ufeff'):
+        source = source[1:]
+    return _Parser(source).program()
+
+
+def snapshot_path(source_path: Path, snapshot_dir: Optional[Path] = None) -> Path:
+    """Caminho do snapshot de uma base (padrão: .snapshots/ ao lado da origem)"""
+    source_path = Path(source_path)
+    directory = Path(snapshot_dir) if snapshot_dir else source_path.parent / SNAPSHOT_DIRNAME
+    return directory / f"{source_path.name}{SNAPSHOT_SUFFIX}"
+
+
+def _read_snapshot(path: Path, source_path: Path) -> Optional[Dict[str, Any]]:
+    """Dados do snapshot se ele corresponder à origem atual; None caso contrário"""
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(SNAPSHOT_HEADER.size)
+            if len(header) != SNAPSHOT_HEADER.size:
+                return None
+            magic, parser_version, version, size, mtime_ns, checksum = SNAPSHOT_HEADER.unpack(header)
+            if magic != SNAPSHOT_MAGIC or parser_version != PARSER_VERSION or version > marshal.version:
+                return None
+            stat = source_path.stat()
+            stale = (size, mtime_ns) != (stat.st_size, stat.st_mtime_ns)
+            if stale:
+                # Metadados diferentes (ex.: checkout novo): confere o conteúdo
+                if hashlib.sha256(source_path.read_bytes()).digest() != checksum:
+                    return None
+            data = marshal.load(f)
+    except Exception:
+        # Snapshot truncado ou corrompido: é reconstruído a partir da origem
+        return None
+    if not isinstance(data, dict):
+        return None
+    if stale:
+        refresh_stamps(path, STAMP_OFFSET, source_stamp(stat))
+    return data
+
+
+def compile_js_file(source_path: Path, snapshot_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """Lê uma base JavaScript e grava seu snapshot (escrita atômica)"""
+    source_path = Path(source_path)
+    raw = source_path.read_bytes()
+    stat = source_path.stat()
+    data = parse_js(raw.decode('utf-8'))
+
+    target = snapshot_path(source_path, snapshot_dir)
+    header = SNAPSHOT_HEADER.pack(
+        SNAPSHOT_MAGIC, PARSER_VERSION, marshal.version,
+        stat.st_size, stat.st_mtime_ns, hashlib.sha256(raw).digest()
+    )
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(header)
+            marshal.dump(data, f, marshal.version)
+        os.replace(tmp_path, target)
+    except OSError:
+        # Diretório somente leitura: segue sem snapshot
+        pass
+    return data
+
+
+def load_js_file(source_path: Path, snapshot_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """Carrega uma base JavaScript pelo snapshot, recompilando se estiver desatualizado"""
+    source_path = Path(source_path)
+    data = _read_snapshot(snapshot_path(source_path, snapshot_dir), source_path)
+    if data is None:
+        data = compile_js_file(source_path, snapshot_dir)
+    return data
+
+
+def compile_all(data_dir: Path, snapshot_dir: Optional[Path] = None) -> List[Path]:
+    """Gera os snapshots de todas as bases .js/.ts de um diretório"""
+    compiled = []
+    for pattern in SOURCE_PATTERNS:
+        for source_path in sorted(Path(data_dir).glob(pattern)):
+            compile_js_file(source_path, snapshot_dir)
+            compiled.append(snapshot_path(source_path, snapshot_dir))
+    return compiled
+
+
+def main():
+    """Gera os snapshots das bases de dados JavaScript"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Snapshots das bases JavaScript Aurora Sagrada')
+    parser.add_argument('command', choices=['compile'], help='Ação a executar')
+    parser.add_argument('--data-dir', type=str, help='Diretório das bases de dados')
+    parser.add_argument('--snapshot-dir', type=str, help='Diretório dos snapshots')
+
+    args = parser.parse_args()
+
+    data_dir = Path(args.data_dir) if args.data_dir else Path(__file__).resolve().parent.parent.parent / 'data'
+    snapshot_dir = Path(args.snapshot_dir) if args.snapshot_dir else None
+    for path in compile_all(data_dir, snapshot_dir):
+        print(f"Snapshot gerado: {path}")
+
+
+if __name__ == '__main__':
+    main()
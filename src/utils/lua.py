@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AURORA SAGRADA - TEORIA LUNAR
+Longitude, latitude, distância e velocidade geocêntricas da Lua pelos
+termos periódicos de Meeus (Astronomical Algorithms, cap. 47), vetorizadas
+com NumPy: os argumentos de todos os termos saem de um produto de matrizes
+(instantes × termos) e lotes grandes são avaliados em blocos de tamanho
+fixo, sem laços em Python por instante.
+
+    python src/utils/lua.py --from 2025-01-01 --to 2025-01-02 --step 0.25
+"""
+
+from typing import Dict
+
+import numpy as np
+
+from astro_lib import julian_centuries, normalize_degrees
+
+# Tabela 47.A: múltiplos de D, M, M', F e coeficientes de Σl (1e-6 grau) e Σr (1e-3 km)
+LUNAR_TERMS = np.array([
+    [0, 0, 1, 0, 6288774, -20905355], [2, 0, -1, 0, 1274027, -3699111], [2, 0, 0, 0, 658314, -2955968],
+    [0, 0, 2, 0, 213618, -569925], [0, 1, 0, 0, -185116, 48888], [0, 0, 0, 2, -114332, -3149],
+    [2, 0, -2, 0, 58793, 246158], [2, -1, -1, 0, 57066, -152138], [2, 0, 1, 0, 53322, -170733],
+    [2, -1, 0, 0, 45758, -204586], [0, 1, -1, 0, -40923, -129620], [1, 0, 0, 0, -34720, 108743],
+    [0, 1, 1, 0, -30383, 104755], [2, 0, 0, -2, 15327, 10321], [0, 0, 1, 2, -12528, 0],
+    [0, 0, 1, -2, 10980, 79661], [4, 0, -1, 0, 10675, -34782], [0, 0, 3, 0, 10034, -23210],
+    [4, 0, -2, 0, 8548, -21636], [2, 1, -1, 0, -7888, 24208], [2, 1, 0, 0, -6766, 30824],
+    [1, 0, -1, 0, -5163, -8379], [1, 1, 0, 0, 4987, -16675], [2, -1, 1, 0, 4036, -12831],
+    [2, 0, 2, 0, 3994, -10445], [4, 0, 0, 0, 3861, -11650], [2, 0, -3, 0, 3665, 14403],
+    [0, 1, -2, 0, -2689, -7003], [2, 0, -1, 2, -2602, 0], [2, -1, -2, 0, 2390, 10056],
+    [1, 0, 1, 0, -2348, 6322], [2, -2, 0, 0, 2236, -9884], [0, 1, 2, 0, -2120, 5751],
+    [0, 2, 0, 0, -2069, 0], [2, -2, -1, 0, 2048, -4950], [2, 0, 1, -2, -1773, 4130],
+    [2, 0, 0, 2, -1595, 0], [4, -1, -1, 0, 1215, -3958], [0, 0, 2, 2, -1110, 0],
+    [3, 0, -1, 0, -892, 3258], [2, 1, 1, 0, -810, 2616], [4, -1, -2, 0, 759, -1897],
+    [0, 2, -1, 0, -713, -2117], [2, 2, -1, 0, -700, 2354], [2, 1, -2, 0, 691, 0],
+    [2, -1, 0, -2, 596, 0], [4, 0, 1, 0, 549, -1423], [0, 0, 4, 0, 537, -1117],
+    [4, -1, 0, 0, 520, -1571], [1, 0, -2, 0, -487, -1739], [2, 1, 0, -2, -399, 0],
+    [0, 0, 2, -2, -381, -4421], [1, 1, 1, 0, 351, 0], [3, 0, -2, 0, -340, 0],
+    [4, 0, -3, 0, 330, 0], [2, -1, 2, 0, 327, 0], [0, 2, 1, 0, -323, 1165],
+    [1, 1, -1, 0, 299, 0], [2, 0, 3, 0, 294, 0], [2, 0, -1, -2, 0, 8752],
+], dtype=np.float64)
+
+# Tabela 47.B: múltiplos de D, M, M', F e coeficiente de Σb (1e-6 grau)
+LATITUDE_TERMS = np.array([
+    [0, 0, 0, 1, 5128122], [0, 0, 1, 1, 280602], [0, 0, 1, -1, 277693],
+    [2, 0, 0, -1, 173237], [2, 0, -1, 1, 55413], [2, 0, -1, -1, 46271],
+    [2, 0, 0, 1, 32573], [0, 0, 2, 1, 17198], [2, 0, 1, -1, 9266],
+    [0, 0, 2, -1, 8822], [2, -1, 0, -1, 8216], [2, 0, -2, -1, 4324],
+    [2, 0, 1, 1, 4200], [2, 1, 0, -1, -3359], [2, -1, -1, 1, 2463],
+    [2, -1, 0, 1, 2211], [2, -1, -1, -1, 2065], [0, 1, -1, -1, -1870],
+    [4, 0, -1, -1, 1828], [0, 1, 0, 1, -1794], [0, 0, 0, 3, -1749],
+    [0, 1, -1, 1, -1565], [1, 0, 0, 1, -1491], [0, 1, 1, 1, -1475],
+    [0, 1, 1, -1, -1410], [0, 1, 0, -1, -1344], [1, 0, 0, -1, -1335],
+    [0, 0, 3, 1, 1107], [4, 0, 0, -1, 1021], [4, 0, -1, 1, 833],
+    [0, 0, 1, -3, 777], [4, 0, -2, 1, 671], [2, 0, 0, -3, 607],
+    [2, 0, 2, -1, 596], [2, -1, 1, -1, 491], [2, 0, -2, 1, -451],
+    [0, 0, 3, -1, 439], [2, 0, 2, 1, 422], [2, 0, -3, -1, 421],
+    [2, 1, -1, 1, -366], [2, 1, 0, 1, -351], [4, 0, 0, 1, 331],
+    [2, -1, 1, 1, 315], [2, -2, 0, -1, 302], [0, 0, 1, 3, -283],
+    [2, 1, 1, -1, -229], [1, 1, 0, -1, 223], [1, 1, 0, 1, 223],
+    [0, 1, -2, -1, -220], [2, 1, -1, -1, -220], [1, 0, 1, 1, -185],
+    [2, -1, -2, -1, 181], [0, 1, 2, 1, -177], [4, 0, -2, -1, 176],
+    [4, -1, -1, -1, 166], [1, 0, 1, -1, -164], [4, 0, 1, -1, 132],
+    [1, 0, -1, -1, -119], [4, -1, 0, -1, 115], [2, -2, 0, 1, 107],
+], dtype=np.float64)
+
+# Distância média Terra-Lua dos termos de Meeus (km)
+MEAN_DISTANCE_KM = 385000.56
+
+# Dias por século juliano (velocidades em graus por dia)
+DAYS_PER_CENTURY = 36525.0
+
+# Instantes avaliados de uma vez: as matrizes termos × instantes (~2 MB) cabem no cache
+BLOCK_SIZE = 2048
+
+
+def fundamental_arguments(T: np.ndarray):
+    """
+    Argumentos fundamentais em radianos (Meeus 47.1-47.7)
+
+    Returns:
+        Tupla (L', D, M, M', F, A1, A2, E)
+    """
+    L = 218.3164477 + 481267.88123421 * T - 0.0015786 * T**2 + T**3 / 538841 - T**4 / 65194000
+    D = 297.8501921 + 445267.1114034 * T - 0.0018819 * T**2 + T**3 / 545868 - T**4 / 113065000
+    M = 357.5291092 + 35999.0502909 * T - 0.0001536 * T**2 + T**3 / 24490000
+    Mp = 134.9633964 + 477198.8675055 * T + 0.0087414 * T**2 + T**3 / 69699 - T**4 / 14712000
+    F = 93.2720950 + 483202.0175233 * T - 0.0036539 * T**2 - T**3 / 3526000 + T**4 / 863310000
+    A1 = 119.75 + 131.849 * T
+    A2 = 53.09 + 479264.290 * T
+    E = 1 - 0.002516 * T - 0.0000074 * T**2
+    return tuple(np.radians(normalize_degrees(x)) for x in (L, D, M, Mp, F, A1, A2)) + (E,)
+
+
+def argument_rates(T: np.ndarray):
+    """
+    Derivadas de L', D, M, M' e F em radianos por século
+
+    Returns:
+        Tupla (L', D, M, M', F); A1 e A2 têm taxas constantes
+    """
+    L = 481267.88123421 - 0.0031572 * T + 3 * T**2 / 538841 - 4 * T**3 / 65194000
+    D = 445267.1114034 - 0.0037638 * T + 3 * T**2 / 545868 - 4 * T**3 / 113065000
+    M = 35999.0502909 - 0.0003072 * T + 3 * T**2 / 24490000
+    Mp = 477198.8675055 + 0.0174828 * T + 3 * T**2 / 69699 - 4 * T**3 / 14712000
+    F = 483202.0175233 - 0.0073078 * T - 3 * T**2 / 3526000 + 4 * T**3 / 863310000
+    return tuple(np.radians(x) for x in (L, D, M, Mp, F))
+
+
+def _exponentials(arguments: np.ndarray, multiples: np.ndarray) -> np.ndarray:
+    """
+    exp(i·(dD + mM + m'M' + fF)) de cada termo × instante
+
+    As potências de exp(iX) dos quatro argumentos são calculadas uma vez e
+    combinadas por produto: bem mais barato que seno e cosseno de cada termo.
+    """
+    result = None
+    for column, argument in enumerate(arguments):
+        orders = multiples[:, column].astype(np.int64)
+        top = int(np.abs(orders).max())
+        if top == 0:
+            continue
+        base = np.exp(1j * argument)
+        powers = np.empty((2 * top + 1, len(argument)), dtype=np.complex128)
+        powers[top] = 1.0
+        for k in range(1, top + 1):
+            powers[top + k] = powers[top + k - 1] * base
+        powers[:top] = np.conj(powers[top + 1:][::-1])
+        if result is None:
+            result = powers[orders + top]
+        else:
+            # Só os termos em que o argumento aparece
+            rows = np.nonzero(orders)[0]
+            result[rows] *= powers[orders[rows] + top]
+    return result
+
+
+def _split_by_eccentricity(terms: np.ndarray, coefficients: np.ndarray) -> np.ndarray:
+    """
+    Coeficientes separados pela potência de E (|m| = 0, 1, 2)
+
+    Σ c·E^|m|·f(arg) = Σ_k E^k · (c_k @ f): a excentricidade sai da soma por
+    termo e a soma vira um produto de matrizes.
+    """
+    order = np.abs(terms[:, 1])
+    return np.stack([coefficients * (order == k) for k in range(3)])
+
+
+# Coeficientes por potência de E: Σl, Σr, dΣl/dT (um bloco por argumento D, M, M', F) e Σb
+LONGITUDE_COEFFICIENTS = _split_by_eccentricity(LUNAR_TERMS, LUNAR_TERMS[:, 4])
+DISTANCE_COEFFICIENTS = _split_by_eccentricity(LUNAR_TERMS, LUNAR_TERMS[:, 5])
+RATE_COEFFICIENTS = np.stack([_split_by_eccentricity(LUNAR_TERMS, LUNAR_TERMS[:, 4] * LUNAR_TERMS[:, column])
+                              for column in range(4)])
+LATITUDE_COEFFICIENTS = _split_by_eccentricity(LATITUDE_TERMS, LATITUDE_TERMS[:, 4])
+
+QUANTITIES = ('longitude', 'latitude', 'distance', 'speed')
+
+
+def _block_position(jde: np.ndarray, quantities) -> Dict[str, np.ndarray]:
+    """Grandezas pedidas para um bloco de instantes (TT)"""
+    T = julian_centuries(jde)
+    L, D, M, Mp, F, A1, A2, E = fundamental_arguments(T)
+    powers = np.stack([np.ones_like(E), E, E * E])
+    arguments = np.stack([D, M, Mp, F])
+    result = {}
+
+    if not {'longitude', 'distance', 'speed'}.isdisjoint(quantities):
+        # Tabela 47.A: Σl (seno), Σr e dΣl/dT (cosseno) nos mesmos argumentos
+        terms = _exponentials(arguments, LUNAR_TERMS)
+        if 'longitude' in quantities:
+            sigma_l = np.sum(powers * (LONGITUDE_COEFFICIENTS @ terms.imag), axis=0)
+            sigma_l += 3958 * np.sin(A1) + 1962 * np.sin(L - F) + 318 * np.sin(A2)
+            result['longitude'] = normalize_degrees(np.degrees(L) + sigma_l / 1e6)
+        if 'distance' in quantities:
+            sigma_r = np.sum(powers * (DISTANCE_COEFFICIENTS @ terms.real), axis=0)
+            result['distance'] = MEAN_DISTANCE_KM + sigma_r / 1000.0
+        if 'speed' in quantities:
+            # Regra da cadeia: d(arg)/dT = Σ múltiplo × taxa do argumento (dE/dT é desprezível)
+            rL, rD, rM, rMp, rF = argument_rates(T)
+            rates = np.stack([rD, rM, rMp, rF])
+            sigma_rate = np.sum(rates[:, None, :] * powers[None] * (RATE_COEFFICIENTS @ terms.real), axis=(0, 1))
+            rA1, rA2 = np.radians(131.849), np.radians(479264.290)
+            sigma_rate += 3958 * np.cos(A1) * rA1 + 1962 * np.cos(L - F) * (rL - rF) + 318 * np.cos(A2) * rA2
+            result['speed'] = (np.degrees(rL) + sigma_rate / 1e6) / DAYS_PER_CENTURY
+
+    if 'latitude' in quantities:
+        # Tabela 47.B e termos aditivos (Vênus, Júpiter e achatamento da Terra)
+        A3 = np.radians(normalize_degrees(313.45 + 481266.484 * T))
+        terms = _exponentials(arguments, LATITUDE_TERMS)
+        sigma_b = np.sum(powers * (LATITUDE_COEFFICIENTS @ terms.imag), axis=0)
+        sigma_b += (-2235 * np.sin(L) + 382 * np.sin(A3) + 175 * np.sin(A1 - F)
+                    + 175 * np.sin(A1 + F) + 127 * np.sin(L - Mp) - 115 * np.sin(L + Mp))
+        result['latitude'] = sigma_b / 1e6
+
+    return result
+
+
+def moon_position(jde, quantities=QUANTITIES) -> Dict[str, np.ndarray]:
+    """
+    Posição geocêntrica da Lua (equinócio médio da data)
+
+    Args:
+        jde: Julian Day (TT) escalar ou array, de qualquer tamanho
+        quantities: Grandezas calculadas (padrão: todas)
+
+    Returns:
+        'longitude' e 'latitude' (graus), 'distance' (km) e 'speed'
+        (graus de longitude por dia), com a forma de jde
+    """
+    jde = np.asarray(jde, dtype=np.float64)
+    flat = jde.ravel()
+    blocks = [_block_position(flat[i:i + BLOCK_SIZE], quantities)
+              for i in range(0, max(len(flat), 1), BLOCK_SIZE)]
+    return {key: np.concatenate([block[key] for block in blocks]).reshape(jde.shape)[()]
+            for key in blocks[0]}
+
+
+def moon_longitude(jd) -> np.ndarray:
+    """
+    Longitude geocêntrica da Lua (equinócio médio da data), em graus
+
+    Args:
+        jd: Julian Day escalar ou array
+    """
+    return moon_position(jd, ('longitude',))['longitude']
+
+
+def moon_latitude(jd) -> np.ndarray:
+    """
+    Latitude geocêntrica da Lua, em graus
+
+    Args:
+        jd: Julian Day escalar ou array
+    """
+    return moon_position(jd, ('latitude',))['latitude']
+
+
+def moon_distance(jd) -> np.ndarray:
+    """
+    Distância geocêntrica da Lua, em km
+
+    Args:
+        jd: Julian Day escalar ou array
+    """
+    return moon_position(jd, ('distance',))['distance']
+
+
+def main():
+    """Lista a posição da Lua num intervalo"""
+    import argparse
+    import datetime
+    from astro_lib import from_julian_day, to_julian_day
+
+    parser = argparse.ArgumentParser(description='Teoria lunar Aurora Sagrada')
+    parser.add_argument('--from', dest='start', type=str, help='Data inicial YYYY-MM-DD (padrão: hoje)')
+    parser.add_argument('--to', dest='end', type=str, help='Data final YYYY-MM-DD (padrão: 1 dia)')
+    parser.add_argument('--step', type=float, default=1 / 24, help='Passo em dias')
+
+    args = parser.parse_args()
+
+    start = datetime.datetime.strptime(args.start, '%Y-%m-%d') if args.start else datetime.datetime.utcnow()
+    end = (datetime.datetime.strptime(args.end, '%Y-%m-%d') + datetime.timedelta(days=1)
+           if args.end else start + datetime.timedelta(days=1))
+
+    jd = np.arange(to_julian_day(start), to_julian_day(end), args.step)
+    position = moon_position(jd)
+    for i, value in enumerate(jd):
+        print(f"{from_julian_day(value):%Y-%m-%d %H:%M} TT  λ {position['longitude'][i]:9.5f}°  "
+              f"β {position['latitude'][i]:+8.5f}°  Δ {position['distance'][i]:10.1f} km  "
+              f"{position['speed'][i]:7.4f}°/dia")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AURORA SAGRADA - MANSÕES LUNARES
+Linha do tempo dos ingressos da Lua nas 28 mansões: os instantes em que a
+longitude da Lua cruza cada limite (grausInicio de
+data/mansoes-lunares-expandido.json) são calculados de uma vez para o ano
+inteiro e guardados em arrays ordenados. Mansão num instante, próximo
+ingresso e ingressos num intervalo são buscas binárias.
+
+    python src/utils/lunar_mansions.py --from 2025-01-01 --to 2025-01-08
+"""
+
+import json
+import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+from astro_lib import DateLike, find_angle_crossings, from_julian_day, to_julian_day
+from ephemeris import Ephemeris
+
+MANSION_COUNT = 28
+
+# A Lua avança ~13,2° por dia
+SEARCH_STEP = 1.0
+
+# Margem antes do início do ano para achar a mansão em que a Lua está em 1º de janeiro
+YEAR_MARGIN_DAYS = 3.0
+
+
+def mansion_boundaries(mansions: Dict[str, Any]) -> np.ndarray:
+    """
+    Longitude inicial de cada mansão (índice 0 = mansão 1)
+
+    Usa grausInicio das mansões descritas na base; as demais seguem a
+    divisão igual de 360/28 graus.
+    """
+    starts = np.arange(MANSION_COUNT) * (360.0 / MANSION_COUNT)
+    for key, mansion in mansions.items():
+        number = int(mansion.get('numero', key))
+        if 1 <= number <= MANSION_COUNT and 'grausInicio' in mansion:
+            starts[number - 1] = float(mansion['grausInicio'])
+    return starts
+
+
+class LunarMansionTimeline:
+    """Ingressos da Lua nas mansões, indexados por ano"""
+
+    def __init__(self, ephemeris: Ephemeris, data_dir: Path):
+        """
+        Args:
+            ephemeris: Fonte da longitude da Lua
+            data_dir: Diretório das bases (mansoes-lunares-expandido.json)
+        """
+        self.ephemeris = ephemeris
+        path = Path(data_dir) / 'mansoes-lunares-expandido.json'
+        mansions = {}
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                mansions = json.load(f).get('mansoes', {})
+        self.names = {int(mansion.get('numero', key)): mansion.get('nome') for key, mansion in mansions.items()}
+        self.boundaries = mansion_boundaries(mansions)
+        self._years: Dict[int, Dict[str, Any]] = {}
+
+    def moon_longitude(self, jd) -> np.ndarray:
+        """Longitude eclíptica da Lua em graus"""
+        return self.ephemeris.longitudes(jd, ['Lua'])['Lua']
+
+    def year(self, year: int) -> Dict[str, Any]:
+        """
+        Ingressos de um ano UTC (calculados uma vez)
+
+        Returns:
+            Dict com 'times' (Julian Days ordenados), 'mansions' (mansão em
+            que a Lua entra em cada instante) e 'initial' (mansão no início do ano)
+        """
+        if year not in self._years:
+            start = to_julian_day(datetime.datetime(year, 1, 1))
+            end = to_julian_day(datetime.datetime(year + 1, 1, 1))
+            times, kinds = find_angle_crossings(self.moon_longitude, start - YEAR_MARGIN_DAYS, end,
+                                                self.boundaries, SEARCH_STEP)
+            first = int(np.searchsorted(times, start))
+            mansions = (kinds + 1).astype(np.int8)
+            self._years[year] = {
+                'times': times[first:],
+                'mansions': mansions[first:],
+                'initial': int(mansions[first - 1]),
+            }
+        return self._years[year]
+
+    def _span(self, first_year: int, last_year: int) -> Dict[str, Any]:
+        """Linhas do tempo de vários anos concatenadas"""
+        years = [self.year(year) for year in range(first_year, last_year + 1)]
+        return {
+            'times': np.concatenate([year['times'] for year in years]),
+            'mansions': np.concatenate([year['mansions'] for year in years]),
+            'initial': years[0]['initial'],
+        }
+
+    def _ingress(self, jd: float, mansion: int) -> Dict[str, Any]:
+        return {
+            'instant': from_julian_day(jd),
+            'jd': float(jd),
+            'mansion': int(mansion),
+            'name': self.names.get(int(mansion)),
+        }
+
+    def mansions_at(self, jd) -> np.ndarray:
+        """Mansão (1-28) da Lua para um array de Julian Days (UT)"""
+        jd = np.asarray(jd, dtype=np.float64)
+        years = [from_julian_day(value).year for value in (jd.min(), jd.max())]
+        span = self._span(*years)
+        i = np.searchsorted(span['times'], jd, side='right') - 1
+        return np.where(i < 0, span['initial'], span['mansions'][np.maximum(i, 0)]).astype(np.int64)
+
+    def mansion_at(self, moment: DateLike) -> int:
+        """Mansão (1-28) da Lua em um instante ou data (12:00 UTC)"""
+        return int(self.mansions_at(to_julian_day(moment)))
+
+    def next_ingress(self, moment: DateLike) -> Dict[str, Any]:
+        """Primeiro ingresso depois de moment"""
+        jd = to_julian_day(moment)
+        span = self._span(moment.year, moment.year + 1)
+        i = int(np.searchsorted(span['times'], jd, side='right'))
+        return self._ingress(span['times'][i], span['mansions'][i])
+
+    def ingresses_between(self, start: DateLike, end: DateLike) -> List[Dict[str, Any]]:
+        """Ingressos em [start, end)"""
+        span = self._span(start.year, end.year)
+        lo, hi = np.searchsorted(span['times'], [to_julian_day(start), to_julian_day(end)])
+        return [self._ingress(span['times'][i], span['mansions'][i]) for i in range(lo, hi)]
+
+    def release(self, before_year: int):
+        """Descarta os anos anteriores a before_year (percursos longos em ordem)"""
+        for year in [year for year in self._years if year < before_year]:
+            del self._years[year]
+
+
+def main():
+    """Lista os ingressos da Lua nas mansões num intervalo"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Mansões lunares Aurora Sagrada')
+    parser.add_argument('--from', dest='start', type=str, help='Data inicial YYYY-MM-DD (padrão: hoje)')
+    parser.add_argument('--to', dest='end', type=str, help='Data final YYYY-MM-DD (padrão: 7 dias)')
+    parser.add_argument('--data-dir', type=str, help='Diretório das bases de dados')
+
+    args = parser.parse_args()
+
+    data_dir = Path(args.data_dir) if args.data_dir else Path(__file__).resolve().parent.parent.parent / 'data'
+    timeline = LunarMansionTimeline(Ephemeris(data_dir), data_dir)
+
+    start = datetime.datetime.strptime(args.start, '%Y-%m-%d') if args.start else datetime.datetime.utcnow()
+    end = (datetime.datetime.strptime(args.end, '%Y-%m-%d') + datetime.timedelta(days=1)
+           if args.end else start + datetime.timedelta(days=7))
+
+    print(f"{start:%Y-%m-%d %H:%M} UTC  mansão {timeline.mansion_at(start)}")
+    for ingress in timeline.ingresses_between(start, end):
+        print(f"{ingress['instant']:%Y-%m-%d %H:%M} UTC  → {ingress['mansion']:>2} {ingress['name'] or ''}")
+
+
+if __name__ == '__main__':
+    main()
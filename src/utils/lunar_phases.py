@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AURORA SAGRADA - FASES LUNARES EXATAS
+Instantes exatos das fases principais (nova, quarto crescente, cheia, quarto
+minguante) e de qualquer fração de iluminação, pela elongação Lua-Sol com
+localização vetorizada e refinamento por secante. Os eventos de cada ano
+ficam num índice ordenado: a fase de qualquer instante e as luas especiais
+de src/astro/fases-lunares.ts (superlua, blue moon, black moon) são buscas
+binárias nesse índice.
+
+    python src/utils/lunar_phases.py 2025
+"""
+
+import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from astro_lib import find_angle_crossings, from_julian_day, to_julian_day
+from ephemeris import Ephemeris, terrestrial_time
+from lua import moon_distance
+
+# Fases principais, na ordem das elongações 0°, 90°, 180° e 270°
+NEW_MOON, FIRST_QUARTER, FULL_MOON, LAST_QUARTER = range(4)
+PHASE_EVENTS = ['Lua Nova', 'Quarto Crescente', 'Lua Cheia', 'Quarto Minguante']
+PHASE_ELONGATIONS = [0.0, 90.0, 180.0, 270.0]
+
+# Limites dos octantes de lunar_phase_name e a fase que começa em cada um
+PHASE_NAMES = ['Nova', 'Crescente', 'Cheia', 'Minguante']
+BOUNDARY_ELONGATIONS = [45.0, 135.0, 225.0, 315.0]
+BOUNDARY_PHASES = [1, 2, 3, 0]
+
+# Superlua: Lua Cheia ou Nova a menos de 360.000 km (fases-lunares.ts)
+SUPERMOON_DISTANCE_KM = 360000.0
+
+# A elongação avança ~12,2° por dia
+SEARCH_STEP = 1.0
+
+
+class LunarPhaseIndex:
+    """Índice ordenado, por ano, dos eventos de fase lunar"""
+
+    def __init__(self, ephemeris: Ephemeris):
+        """
+        Args:
+            ephemeris: Fonte das longitudes do Sol e da Lua
+        """
+        self.ephemeris = ephemeris
+        self._years: Dict[int, Dict[str, np.ndarray]] = {}
+
+    def elongation(self, jd) -> np.ndarray:
+        """Elongação Lua-Sol em graus (0-360)"""
+        longitudes = self.ephemeris.longitudes(jd, ['Sol', 'Lua'])
+        return np.mod(longitudes['Lua'] - longitudes['Sol'], 360.0)
+
+    def year(self, year: int) -> Dict[str, np.ndarray]:
+        """
+        Eventos de um ano UTC (calculados uma vez)
+
+        Returns:
+            Dict com 'times'/'kinds'/'distances' das fases principais e
+            'boundaries'/'phases' dos limites de octante
+        """
+        if year not in self._years:
+            start = to_julian_day(datetime.datetime(year, 1, 1))
+            end = to_julian_day(datetime.datetime(year + 1, 1, 1))
+            times, kinds = find_angle_crossings(self.elongation, start, end,
+                                                PHASE_ELONGATIONS + BOUNDARY_ELONGATIONS, SEARCH_STEP)
+            principal = kinds < len(PHASE_ELONGATIONS)
+            self._years[year] = {
+                'times': times[principal],
+                'kinds': kinds[principal],
+                'distances': moon_distance(terrestrial_time(times[principal])),
+                'boundaries': times[~principal],
+                'phases': np.array(BOUNDARY_PHASES)[kinds[~principal] - len(PHASE_ELONGATIONS)],
+            }
+        return self._years[year]
+
+    def _span(self, first_year: int, last_year: int) -> Dict[str, np.ndarray]:
+        """Índices de vários anos concatenados"""
+        years = [self.year(year) for year in range(first_year, last_year + 1)]
+        return {field: np.concatenate([year[field] for year in years]) for field in years[0]}
+
+    @staticmethod
+    def _event(jd: float, kind: int, distance: float) -> Dict[str, Any]:
+        return {
+            'instant': from_julian_day(jd),
+            'jd': float(jd),
+            'kind': int(kind),
+            'name': PHASE_EVENTS[kind],
+            'distance_km': float(distance),
+            'supermoon': kind in (NEW_MOON, FULL_MOON) and distance < SUPERMOON_DISTANCE_KM,
+        }
+
+    def events_between(self, start: datetime.datetime, end: datetime.datetime,
+                       kinds: Optional[Sequence[int]] = None) -> List[Dict[str, Any]]:
+        """Fases principais em [start, end), opcionalmente só dos tipos em kinds"""
+        start_jd, end_jd = to_julian_day(start), to_julian_day(end)
+        index = self._span(start.year, end.year)
+        lo, hi = np.searchsorted(index['times'], [start_jd, end_jd])
+        selected = range(lo, hi)
+        if kinds is not None:
+            selected = [i for i in selected if index['kinds'][i] in kinds]
+        return [self._event(index['times'][i], index['kinds'][i], index['distances'][i]) for i in selected]
+
+    def next_event(self, moment: datetime.datetime, kind: Optional[int] = None) -> Dict[str, Any]:
+        """Primeira fase principal (do tipo kind, se dado) a partir de moment"""
+        jd = to_julian_day(moment)
+        index = self._span(moment.year, moment.year + 1)
+        times, kinds = index['times'], index['kinds']
+        if kind is not None:
+            times, kinds = times[kinds == kind], kinds[kinds == kind]
+        i = int(np.searchsorted(times, jd))
+        distance = index['distances'][int(np.searchsorted(index['times'], times[i]))]
+        return self._event(times[i], kinds[i], distance)
+
+    def previous_event(self, moment: datetime.datetime, kind: Optional[int] = None) -> Dict[str, Any]:
+        """Última fase principal (do tipo kind, se dado) antes de moment"""
+        jd = to_julian_day(moment)
+        index = self._span(moment.year - 1, moment.year)
+        times, kinds = index['times'], index['kinds']
+        if kind is not None:
+            times, kinds = times[kinds == kind], kinds[kinds == kind]
+        i = int(np.searchsorted(times, jd)) - 1
+        distance = index['distances'][int(np.searchsorted(index['times'], times[i]))]
+        return self._event(times[i], kinds[i], distance)
+
+    def phase_at(self, moment) -> str:
+        """Fase (Nova/Crescente/Cheia/Minguante) em um instante ou data (12:00 UTC)"""
+        jd = to_julian_day(moment)
+        index = self._span(moment.year - 1, moment.year)
+        i = int(np.searchsorted(index['boundaries'], jd, side='right')) - 1
+        return PHASE_NAMES[int(index['phases'][i])]
+
+    def phases_at(self, jd) -> np.ndarray:
+        """Fase (índice em PHASE_NAMES) para um array de Julian Days (UT)"""
+        jd = np.asarray(jd, dtype=np.float64)
+        first, last = (from_julian_day(value).year for value in (jd.min(), jd.max()))
+        index = self._span(first - 1, last)
+        i = np.searchsorted(index['boundaries'], jd, side='right') - 1
+        return index['phases'][i].astype(np.int64)
+
+    def release(self, before_year: int):
+        """Descarta os anos anteriores a before_year (percursos longos em ordem)"""
+        for year in [year for year in self._years if year < before_year]:
+            del self._years[year]
+
+    def illumination_crossings(self, start: datetime.datetime, end: datetime.datetime,
+                               fraction: float) -> List[Dict[str, Any]]:
+        """
+        Instantes em que a fração iluminada atinge fraction, em [start, end)
+
+        A fração iluminada é (1 - cos D) / 2 pela elongação D; cada ciclo
+        tem um cruzamento crescente e outro minguante.
+        """
+        elongation = float(np.degrees(np.arccos(1.0 - 2.0 * np.clip(fraction, 0.0, 1.0))))
+        times, kinds = find_angle_crossings(self.elongation, to_julian_day(start), to_julian_day(end),
+                                            [elongation, 360.0 - elongation], SEARCH_STEP)
+        return [{'instant': from_julian_day(jd), 'jd': float(jd), 'waxing': bool(kind == 0)}
+                for jd, kind in zip(times, kinds)]
+
+    def _month_repeats(self, year: int, kind: int) -> List[Dict[str, Any]]:
+        """Segundos eventos do tipo kind num mesmo mês civil (UTC)"""
+        index = self.year(year)
+        selected = index['kinds'] == kind
+        times, distances = index['times'][selected], index['distances'][selected]
+        months = [from_julian_day(jd).month for jd in times]
+        return [self._event(times[i], kind, distances[i])
+                for i in range(1, len(times)) if months[i] == months[i - 1]]
+
+    def blue_moons(self, year: int) -> List[Dict[str, Any]]:
+        """Blue moons do ano (segunda Lua Cheia num mês)"""
+        return self._month_repeats(year, FULL_MOON)
+
+    def black_moons(self, year: int) -> List[Dict[str, Any]]:
+        """Black moons do ano (segunda Lua Nova num mês)"""
+        return self._month_repeats(year, NEW_MOON)
+
+    def supermoons(self, year: int) -> List[Dict[str, Any]]:
+        """Luas Novas e Cheias do ano a menos de SUPERMOON_DISTANCE_KM"""
+        index = self.year(year)
+        return [self._event(jd, kind, distance)
+                for jd, kind, distance in zip(index['times'], index['kinds'], index['distances'])
+                if kind in (NEW_MOON, FULL_MOON) and distance < SUPERMOON_DISTANCE_KM]
+
+    @staticmethod
+    def _on_date(events: List[Dict[str, Any]], date: datetime.date) -> bool:
+        return any(event['instant'].date() == date for event in events)
+
+    def is_supermoon(self, date: datetime.date) -> bool:
+        """Se há uma superlua na data (UTC)"""
+        return self._on_date(self.supermoons(date.year), date)
+
+    def is_blue_moon(self, date: datetime.date) -> bool:
+        """Se há uma blue moon na data (UTC)"""
+        return self._on_date(self.blue_moons(date.year), date)
+
+    def is_black_moon(self, date: datetime.date) -> bool:
+        """Se há uma black moon na data (UTC)"""
+        return self._on_date(self.black_moons(date.year), date)
+
+
+def main():
+    """Lista as fases principais e as luas especiais de um ano"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Fases lunares Aurora Sagrada')
+    parser.add_argument('year', type=int, help='Ano')
+    parser.add_argument('--data-dir', type=str, help='Diretório das bases de dados')
+
+    args = parser.parse_args()
+
+    data_dir = Path(args.data_dir) if args.data_dir else Path(__file__).resolve().parent.parent.parent / 'data'
+    index = LunarPhaseIndex(Ephemeris(data_dir))
+
+    start = datetime.datetime(args.year, 1, 1)
+    for event in index.events_between(start, datetime.datetime(args.year + 1, 1, 1)):
+        mark = '  superlua' if event['supermoon'] else ''
+        print(f"{event['instant']:%Y-%m-%d %H:%M} UTC  {event['name']:<17} {event['distance_km']:>9.0f} km{mark}")
+    for label, events in (('Blue moon', index.blue_moons(args.year)),
+                          ('Black moon', index.black_moons(args.year))):
+        for event in events:
+            print(f"{label}: {event['instant']:%Y-%m-%d %H:%M} UTC")
+
+
+if __name__ == '__main__':
+    main()
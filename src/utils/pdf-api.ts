@@ -5,7 +5,7 @@
 
 export interface PDFGenerationRequest {
   date: string; // YYYY-MM-DD format
-  format: 'daily-report' | 'weekly-summary' | 'monthly-overview';
+  format: 'daily-report' | 'weekly-summary' | 'monthly-overview' | 'annual-almanac';
   options?: {
     includeHymns?: boolean;
     includeMansions?: boolean;
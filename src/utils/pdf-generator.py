@@ -9,197 +9,335 @@ Conecta-se às bases de dados JavaScript para extrair conteúdo
 import os
 import sys
 import json
-import re
+import math
+import shutil
+import tempfile
 import datetime
+import hashlib
+import zoneinfo
+import contextlib
+from collections.abc import Mapping
+from io import BytesIO
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-
-# ReportLab imports
-from reportlab.lib.pagesizes import A4, letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.colors import Color, HexColor
-from reportlab.lib.units import inch, cm
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle,
-    Image, KeepTogether, Frame, PageTemplate
-)
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
-from reportlab.pdfgen import canvas
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, BinaryIO, Callable, Iterator, Tuple
 
-class AuroraReportGenerator:
-    """Gerador de relatórios astrológicos Aurora Sagrada"""
+# ReportLab, pypdf e os módulos astronômicos (numpy) são importados só
+# quando um documento é montado (ver report_layout.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from instrumentation import Instrumentation, json_log_hook
+from report_cache import DEFAULT_MAX_BYTES, ReportCache
+
+if TYPE_CHECKING:
+    from aspects import AspectEngine, AspectTimeline
+    from elections import ElectionsEngine
+    from ephemeris import Ephemeris
+    from fixed_stars import FixedStarIndex
+    from goddess_store import GoddessStore
+    from lunar_mansions import LunarMansionTimeline
+    from lunar_phases import LunarPhaseIndex
+    from planetary_hours import PlanetaryHoursCalculator
+    from void_of_course import VoidOfCourseTimeline
+
+# Formatos de documento (PDFGenerationRequest.format em pdf-api.ts)
+DOCUMENT_TITLES = {
+    'daily-report': 'Relatório Diário',
+    'weekly-summary': 'Resumo Semanal',
+    'monthly-overview': 'Panorama Mensal',
+    'annual-almanac': 'Almanaque Anual'
+}
+
+# Tamanho dos blocos ao copiar/transmitir PDFs
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# PDFGenerationRequest.options (pdf-api.ts) e os padrões de generateDailyReport
+DEFAULT_OPTIONS = {
+    'includeHymns': True,
+    'includeMansions': True,
+    'includeCorrespondences': True,
+    'language': 'pt-BR',
+    'hemisphere': 'south',
+}
+LANGUAGES = ('pt-BR', 'en-US')
+HEMISPHERES = ('south', 'north')
+
+# Idiomas com textos próprios nos relatórios; os demais saem em pt-BR
+REPORT_LANGUAGES = ('pt-BR',)
+
+# Favorabilidade em múltiplos do score mínimo das janelas eletivas (elections.minScore)
+FAVORABILITY_LEVELS = ((2.0, "Excelente"), (1.0, "Favorável"), (0.5, "Neutro"))
+# Score mínimo de referência quando config.json não define minScore
+DEFAULT_FAVORABILITY_REFERENCE = 0.3
+
+
+def normalize_options(options: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Opções completas (com os padrões de pdf-api.ts) e validadas
     
-    # Paleta de cores Aurora Sagrada
-    COLORS = {
-        'vinho': HexColor('#661D48'),
-        'azul_noite': HexColor('#0B1836'),
-        'dourado': HexColor('#DAA520'),
-        'pergaminho': HexColor('#F2EAFF'),
-        'salvia': HexColor('#B2D1B1'),
-        'preto': HexColor('#000000'),
-        'branco': HexColor('#FFFFFF')
+    Raises:
+        ValueError: Opção desconhecida ou valor inválido
+    """
+    options = options or {}
+    if not isinstance(options, dict):
+        raise ValueError("options deve ser um objeto")
+    unknown = sorted(set(options) - set(DEFAULT_OPTIONS))
+    if unknown:
+        raise ValueError(f"Opções desconhecidas: {', '.join(unknown)}")
+    
+    normalized = {**DEFAULT_OPTIONS, **options}
+    for name, default in DEFAULT_OPTIONS.items():
+        if isinstance(default, bool) and not isinstance(normalized[name], bool):
+            raise ValueError(f"{name} deve ser true ou false")
+    if normalized['language'] not in LANGUAGES:
+        raise ValueError(f"Idioma desconhecido: {normalized['language']}")
+    if normalized['hemisphere'] not in HEMISPHERES:
+        raise ValueError(f"Hemisfério desconhecido: {normalized['hemisphere']}")
+    return normalized
+
+
+def variant_options(options: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Só as opções que alteram o PDF, com o idioma efetivo
+    
+    Pedidos com a mesma variante recebem PDFs idênticos: includeHymns fica
+    de fora (não há seção de hinos) e idiomas sem textos próprios contam
+    como pt-BR.
+    """
+    normalized = normalize_options(options)
+    language = normalized['language']
+    return {
+        'hemisphere': normalized['hemisphere'],
+        'language': language if language in REPORT_LANGUAGES else REPORT_LANGUAGES[0],
+        'includeMansions': normalized['includeMansions'],
+        'includeCorrespondences': normalized['includeCorrespondences'],
     }
+
+
+def variant_id(variant: Dict[str, Any]) -> str:
+    """Identificador curto e estável de uma variante (nome de arquivo)"""
+    return hashlib.sha256(json.dumps(variant, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+
+
+# Bases de dados de data/ usadas pelas seções do relatório
+BASE_FILES = [
+    'efemerides-completas-integrais.js',
+    'mansoes-lunares-expandido.json',
+    'hinos-orficos.json',
+    'esbats.json',
+    'correspondencias-expandido.json'
+]
+
+
+class DataBases(Mapping):
+    """
+    Bases de dados carregadas no primeiro acesso a cada uma
+
+    Uma seção que só consulta esbats.json não paga a leitura das demais;
+    bases ausentes ou inválidas ficam de fora do mapeamento.
+    """
+
+    def __init__(self, loader: Callable[[str], Any], filenames: List[str]):
+        self._loader = loader
+        self._filenames = filenames
+        self._loaded: Dict[str, Any] = {}
+
+    def load(self, filename: str) -> Any:
+        """Lê (ou relê) uma base"""
+        self._loaded[filename] = self._loader(filename)
+        return self._loaded[filename]
+
+    def __getitem__(self, filename: str) -> Any:
+        value = self._loaded[filename] if filename in self._loaded else self.load(filename)
+        if value is None:
+            raise KeyError(filename)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return (filename for filename in self._filenames if filename in self)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class AuroraReportGenerator:
+    """Gerador de relatórios astrológicos Aurora Sagrada"""
     
-    def __init__(self, data_dir: str = None):
+    def __init__(self, data_dir: str = None, cache_dir: str = None,
+                 cache_max_bytes: int = DEFAULT_MAX_BYTES,
+                 location: Optional[Dict[str, Any]] = None,
+                 instrumentation: Optional[Instrumentation] = None,
+                 options: Optional[Dict[str, Any]] = None):
         """
         Inicializa o gerador de relatórios
         
         Args:
             data_dir: Diretório contendo as bases de dados JavaScript
+            cache_dir: Diretório do cache de relatórios renderizados (opcional)
+            cache_max_bytes: Tamanho máximo do cache
+            location: Local das horas planetárias {nome, latitude, longitude,
+                timezone} (padrão: São Paulo)
+            instrumentation: Spans e contadores das etapas (padrão: desligada)
+            options: PDFGenerationRequest.options (hemisfério, idioma, seções)
         """
+        self.instrumentation = instrumentation or Instrumentation()
         self.data_dir = Path(data_dir) if data_dir else Path(__file__).parent.parent.parent / 'data'
-        self.bases_data = {}
-        self.styles = self._create_styles()
-        
-        # Carregar bases de dados
-        self._load_bases()
+        # Bases, estilos e motores astronômicos são carregados no primeiro uso
+        self.bases_data = DataBases(self._load_base, BASE_FILES)
+        self._styles: Optional[Dict[str, Any]] = None
+        self._transits: Dict[Tuple[int, int], 'AspectTimeline'] = {}
+        from planetary_hours import DEFAULT_LOCATION
+        self.location = {**DEFAULT_LOCATION, **(location or {})}
+        self.options = variant_options(options)
+        self.cache = ReportCache(cache_dir, self.data_dir, cache_max_bytes) if cache_dir else None
+        self._fragments: Dict[Any, Tuple[Any, ...]] = {}
     
-    def _create_styles(self) -> Dict[str, ParagraphStyle]:
-        """Cria estilos personalizados Aurora Sagrada"""
-        styles = getSampleStyleSheet()
-        
-        custom_styles = {
-            'AuroraTitle': ParagraphStyle(
-                'AuroraTitle',
-                parent=styles['Title'],
-                fontName='Helvetica-Bold',
-                fontSize=24,
-                textColor=self.COLORS['dourado'],
-                alignment=TA_CENTER,
-                spaceAfter=20
-            ),
-            'AuroraHeading1': ParagraphStyle(
-                'AuroraHeading1',
-                parent=styles['Heading1'],
-                fontName='Helvetica-Bold',
-                fontSize=18,
-                textColor=self.COLORS['vinho'],
-                spaceBefore=20,
-                spaceAfter=12
-            ),
-            'AuroraHeading2': ParagraphStyle(
-                'AuroraHeading2',
-                parent=styles['Heading2'],
-                fontName='Helvetica-Bold',
-                fontSize=14,
-                textColor=self.COLORS['azul_noite'],
-                spaceBefore=15,
-                spaceAfter=8
-            ),
-            'AuroraBody': ParagraphStyle(
-                'AuroraBody',
-                parent=styles['Normal'],
-                fontName='Helvetica',
-                fontSize=11,
-                textColor=self.COLORS['azul_noite'],
-                alignment=TA_JUSTIFY,
-                spaceAfter=8,
-                leading=14
-            ),
-            'AuroraQuote': ParagraphStyle(
-                'AuroraQuote',
-                parent=styles['Normal'],
-                fontName='Helvetica-Oblique',
-                fontSize=10,
-                textColor=self.COLORS['vinho'],
-                alignment=TA_CENTER,
-                leftIndent=20,
-                rightIndent=20,
-                spaceAfter=12,
-                leading=13
-            ),
-            'AuroraCaption': ParagraphStyle(
-                'AuroraCaption',
-                parent=styles['Normal'],
-                fontName='Helvetica',
-                fontSize=9,
-                textColor=self.COLORS['salvia'],
-                alignment=TA_CENTER,
-                spaceAfter=6
-            )
-        }
-        
-        return custom_styles
+    @contextlib.contextmanager
+    def using_options(self, options: Optional[Dict[str, Any]]):
+        """Renderiza o bloco com outras opções (validadas), restaurando as anteriores ao sair"""
+        previous = self.options
+        self.options = variant_options(options)
+        try:
+            yield self.options
+        finally:
+            self.options = previous
+    
+    @property
+    def styles(self) -> Dict[str, Any]:
+        """Estilos de parágrafo (compartilhados por todos os geradores do processo)"""
+        if self._styles is None:
+            with self.instrumentation.span('create_styles'):
+                self._styles = self._create_styles()
+        return self._styles
+    
+    def _create_styles(self) -> Dict[str, Any]:
+        """Estilos personalizados Aurora Sagrada (criados uma vez em report_layout)"""
+        from report_layout import STYLES
+        return STYLES
+    
+    @cached_property
+    def ephemeris(self) -> 'Ephemeris':
+        from ephemeris import Ephemeris
+        return Ephemeris(self.data_dir)
+    
+    @cached_property
+    def elections(self) -> 'ElectionsEngine':
+        from elections import ElectionsEngine
+        return ElectionsEngine(self.ephemeris, self.data_dir)
+    
+    @cached_property
+    def lunar_phases(self) -> 'LunarPhaseIndex':
+        from lunar_phases import LunarPhaseIndex
+        return LunarPhaseIndex(self.ephemeris)
+    
+    @cached_property
+    def lunar_mansions(self) -> 'LunarMansionTimeline':
+        from lunar_mansions import LunarMansionTimeline
+        return LunarMansionTimeline(self.ephemeris, self.data_dir)
+    
+    @cached_property
+    def planetary_hours(self) -> 'PlanetaryHoursCalculator':
+        from planetary_hours import PlanetaryHoursCalculator
+        return PlanetaryHoursCalculator(self.ephemeris)
+    
+    @cached_property
+    def aspects(self) -> 'AspectEngine':
+        from aspects import AspectEngine
+        return AspectEngine(self.ephemeris, self.data_dir)
+    
+    @cached_property
+    def void_of_course(self) -> 'VoidOfCourseTimeline':
+        from void_of_course import VoidOfCourseTimeline
+        return VoidOfCourseTimeline(self.ephemeris)
+    
+    @cached_property
+    def fixed_stars(self) -> 'FixedStarIndex':
+        from fixed_stars import FixedStarIndex
+        return FixedStarIndex(self.data_dir)
+    
+    @cached_property
+    def goddesses(self) -> Optional['GoddessStore']:
+        from goddess_store import GoddessStore
+        return GoddessStore.open(self.data_dir)
+    
+    def warm_up(self):
+        """
+        Carrega de uma vez o que ficaria para o primeiro relatório (ReportLab
+        e estilos, bases e motores astronômicos), para processos de longa duração
+        """
+        self._load_bases()
+        for name in ('styles', 'elections', 'lunar_phases', 'lunar_mansions', 'planetary_hours', 'aspects',
+                     'void_of_course', 'fixed_stars', 'goddesses'):
+            getattr(self, name)
     
     def _load_bases(self):
-        """Carrega as bases de dados JavaScript"""
-        base_files = [
-            'efemerides-completas-integrais.js',
-            'BasedeDadosdoguiaLunar.js',
-            'mansoes-lunares-expandido.json',
-            'hinos-orficos.json',
-            'esbats.json',
-            'correspondencias-expandido.json'
-        ]
-        
-        for filename in base_files:
-            filepath = self.data_dir / filename
-            if filepath.exists():
-                try:
-                    if filename.endswith('.js'):
-                        self.bases_data[filename] = self._parse_js_file(filepath)
-                    else:
-                        with open(filepath, 'r', encoding='utf-8') as f:
-                            self.bases_data[filename] = json.load(f)
-                except Exception as e:
-                    print(f"Erro ao carregar {filename}: {e}")
+        """Carrega (ou recarrega) de uma vez todas as bases de dados"""
+        for filename in BASE_FILES:
+            self.bases_data.load(filename)
+    
+    def _load_base(self, filename: str) -> Any:
+        """Lê uma base de data/ (None se ausente ou inválida)"""
+        filepath = self.data_dir / filename
+        if not filepath.exists():
+            return None
+        try:
+            with self.instrumentation.span('load_base', file=filename):
+                if filename.endswith('.js'):
+                    return self._parse_js_file(filepath)
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            self.instrumentation.count('load_errors', file=filename)
+            print(f"Erro ao carregar {filename}: {e}")
+            return None
     
     def _parse_js_file(self, filepath: Path) -> Dict[str, Any]:
-        """Parse básico de arquivos JavaScript para extrair dados"""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Extrair objetos JavaScript usando regex simples
-        data = {}
-        
-        # Padrão para objetos const
-        const_pattern = r'const\s+(\w+)\s*=\s*\{(.*?)\};'
-        matches = re.findall(const_pattern, content, re.DOTALL)
-        
-        for name, obj_content in matches:
-            # Simplificação: apenas armazenar o conteúdo bruto
-            data[name] = obj_content.strip()
+        """Declarações literais de um arquivo JavaScript (via snapshot em data/.snapshots)"""
+        from js_data import load_js_file
+        return load_js_file(filepath)
+    
+    def calculate_body_longitudes(self, date: datetime.date,
+                                  bodies: Optional[List[str]] = None) -> Dict[str, float]:
+        """
+        Calcula longitudes geocêntricas do Sol, da Lua e dos planetas
         
-        return data
+        Usa a tabela Chebyshev pré-calculada quando ela cobre a data;
+        caso contrário avalia as séries (VSOP87A e Meeus) diretamente.
+        """
+        from astro_lib import to_julian_day
+        longitudes = self.ephemeris.longitudes(to_julian_day(date), bodies)
+        return {body: float(longitude) for body, longitude in longitudes.items()}
     
     def calculate_lunar_mansion(self, date: datetime.date) -> int:
-        """Calcula a mansão lunar para uma data específica"""
-        # Cálculo simplificado baseado no dia do ano
-        day_of_year = date.timetuple().tm_yday
-        mansion = ((day_of_year - 1) % 28) + 1
-        return mansion
+        """Calcula a mansão lunar para uma data específica (busca na linha do tempo de ingressos)"""
+        return self.lunar_mansions.mansion_at(date)
     
     def calculate_lunar_phase(self, date: datetime.date) -> str:
-        """Calcula a fase lunar para uma data específica"""
-        # Cálculo simplificado baseado no dia do mês
-        day = date.day
-        if day <= 7:
-            return "Nova"
-        elif day <= 14:
-            return "Crescente"
-        elif day <= 21:
-            return "Cheia"
-        else:
-            return "Minguante"
+        """Calcula a fase lunar para uma data específica (busca no índice de fases)"""
+        return self.lunar_phases.phase_at(date)
+    
+    def calculate_void_of_course(self, date: datetime.date) -> List[Dict[str, Any]]:
+        """Períodos de Lua fora de curso que tocam o dia civil (UTC)"""
+        start = datetime.datetime.combine(date, datetime.time())
+        return self.void_of_course.periods_between(start, start + datetime.timedelta(days=1))
+    
+    def calculate_fixed_star_contacts(self, date: datetime.date) -> List[Dict[str, Any]]:
+        """Passagens dos astros pelo orbe das estrelas fixas no dia civil (UTC), numa consulta em lote"""
+        start = datetime.datetime.combine(date, datetime.time())
+        return self.fixed_stars.contacts_between(self.ephemeris, start, start + datetime.timedelta(days=1))
+    
+    def calculate_planet_positions(self, date: datetime.date) -> Dict[str, float]:
+        """Calcula as longitudes geocêntricas do Sol, da Lua e dos planetas"""
+        return self.calculate_body_longitudes(date)
     
     def get_goddess_of_day(self, date: datetime.date) -> Dict[str, Any]:
-        """Obtém a deusa do dia"""
-        day_of_year = date.timetuple().tm_yday
-        
-        # Dados simulados baseados nas bases
-        goddesses = {
-            1: {"nome": "Brigid", "elemento": "Fogo", "dominio": "Forja, Poesia, Cura"},
-            2: {"nome": "Ísis", "elemento": "Água", "dominio": "Magia, Mistérios, Proteção"},
-            # Adicionar mais conforme necessário
-        }
-        
-        return goddesses.get(day_of_year, {
-            "nome": "Deusa Universal",
-            "elemento": "Todos",
-            "dominio": "Harmonia e Equilíbrio"
-        })
+        """Obtém a deusa do dia (só o registro do dia é decodificado, ver goddess_store.py)"""
+        if self.goddesses is None:
+            return {
+                "nome": "Deusa Universal",
+                "elemento": "Todos",
+                "dominio": "Harmonia e Equilíbrio"
+            }
+        return self.goddesses.for_date(date)
     
     def get_lunar_mansion_data(self, mansion_number: int) -> Dict[str, Any]:
         """Obtém dados da mansão lunar"""
@@ -237,73 +375,326 @@ class AuroraReportGenerator:
         if not output_path:
             output_path = f"aurora_sagrada_{date.strftime('%Y%m%d')}.pdf"
         
+        # Escrita atômica: uma renderização que falha não deixa PDF vazio
+        tmp_path = f"{output_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                self.render_daily_report(date, f)
+            os.replace(tmp_path, output_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        return output_path
+    
+    def render_daily_report(self, date: datetime.date, stream: BinaryIO) -> BinaryIO:
+        """
+        Renderiza o relatório diário num stream binário (arquivo aberto, BytesIO, socket...)
+        
+        Returns:
+            O próprio stream, após a escrita do PDF completo
+        """
+        with self.instrumentation.span('daily_report'):
+            key = self._daily_report_key(date)
+            cached = self._open_cached_daily_report(key)
+            if cached is not None:
+                with cached:
+                    shutil.copyfileobj(cached, stream, STREAM_CHUNK_SIZE)
+            else:
+                stream.write(self._build_daily_report(date, key))
+        return stream
+    
+    def generate_fanout(self, date: datetime.date, subscribers: Dict[str, Optional[Dict[str, Any]]],
+                        output_dir: str = '.') -> Dict[str, Dict[str, Any]]:
+        """
+        Gera o relatório diário de muitos assinantes, uma vez por variante
+        
+        Assinantes cujas opções produzem o mesmo PDF (ver variant_options)
+        recebem o mesmo arquivo.
+        
+        Args:
+            date: Data dos relatórios
+            subscribers: {assinante: PDFGenerationRequest.options}
+            output_dir: Diretório de saída dos PDFs
+            
+        Returns:
+            {assinante: {success, variant, filename | error}}
+        """
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        groups, results = group_subscribers(subscribers)
+        for key, group in groups.items():
+            output_path = str(Path(output_dir) / fanout_filename(date, key))
+            try:
+                with self.using_options(group['options']):
+                    self.generate_daily_report(date, output_path)
+                result = {"success": True, "variant": key, "filename": output_path}
+            except Exception as e:
+                result = {"success": False, "variant": key, "error": f"{type(e).__name__}: {e}"}
+            results.update((subscriber, result) for subscriber in group['subscribers'])
+        return {subscriber: results[subscriber] for subscriber in subscribers}
+    
+    def daily_report_bytes(self, date: datetime.date) -> bytes:
+        """Relatório diário como bytes, sem passar pelo sistema de arquivos"""
+        return self.render_daily_report(date, BytesIO()).getvalue()
+    
+    def iter_daily_report(self, date: datetime.date,
+                          chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Gera o relatório diário em blocos, para respostas HTTP em streaming
+        
+        O ReportLab serializa o documento de uma vez ao final do build; os
+        blocos saem assim que ele termina (ou direto do arquivo em cache).
+        """
+        key = self._daily_report_key(date)
+        cached = self._open_cached_daily_report(key)
+        if cached is not None:
+            with cached:
+                yield from iter(lambda: cached.read(chunk_size), b'')
+            return
+        
+        data = memoryview(self._build_daily_report(date, key))
+        for offset in range(0, len(data), chunk_size):
+            yield bytes(data[offset:offset + chunk_size])
+    
+    def _daily_report_key(self, date: datetime.date) -> Optional[str]:
+        """Chave do relatório no cache (None sem cache); data/ e o código são varridos uma vez"""
+        if self.cache is None:
+            return None
+        return self.cache.key('daily-report', date, self._report_options(), self.cache.inputs_fingerprint())
+    
+    def _open_cached_daily_report(self, key: Optional[str]) -> Optional[BinaryIO]:
+        """Relatório já renderizado com as mesmas entradas, aberto para leitura, se houver"""
+        if key is None:
+            return None
+        cached = self.cache.open(key)
+        self.instrumentation.count('cache_lookups', result='miss' if cached is None else 'hit')
+        return cached
+    
+    def _report_options(self) -> Dict[str, Any]:
+        """Opções do gerador que alteram o PDF (parte da chave do cache)"""
+        return {'location': self.location, 'options': self.options}
+    
+    def _build_daily_report(self, date: datetime.date, key: Optional[str] = None) -> bytes:
+        """Renderiza o relatório diário em memória (e o registra no cache sob key)"""
+        from report_layout import report_document
+        buffer = BytesIO()
+        
         # Criar documento PDF
-        doc = SimpleDocTemplate(
-            output_path,
-            pagesize=A4,
-            rightMargin=2*cm,
-            leftMargin=2*cm,
-            topMargin=2*cm,
-            bottomMargin=2*cm
-        )
+        doc = report_document(buffer)
         
         # Construir conteúdo
+        with self.instrumentation.span('build_story'):
+            story = []
+
+            # Cabeçalho
+            story.extend(self._build_header(date))
+
+            # Seções do dia
+            story.extend(self._build_day_sections(date))
+
+            # Rodapé
+            story.extend(self._build_footer())
+
+        # Gerar PDF
+        with self.instrumentation.span('doc_build'):
+            doc.build(story)
+        data = buffer.getvalue()
+        self._count_document(story, doc, data)
+
+        if key is not None:
+            self.cache.write(key, data)
+        
+        return data
+    
+    def generate_almanac(self, start: datetime.date, end: datetime.date,
+                         output_path: str = None, title: str = 'Almanaque') -> str:
+        """
+        Gera documento de vários dias (semana, mês ou ano) em um único processo
+        
+        Args:
+            start: Primeiro dia
+            end: Último dia (inclusive)
+            output_path: Caminho de saída do PDF
+            title: Título do documento
+            
+        Returns:
+            Caminho do arquivo PDF gerado
+        """
+        if not output_path:
+            output_path = f"aurora_sagrada_{start.strftime('%Y%m%d')}_{end.strftime('%Y%m%d')}.pdf"
+        
+        self._render_almanac(output_path, date_range(start, end), start, end, title,
+                             include_cover=True, include_footer=True, standalone=True)
+        return output_path
+    
+    def _render_almanac(self, output_path: str, dates: List[datetime.date],
+                        period_start: datetime.date, period_end: datetime.date, title: str,
+                        include_cover: bool, include_footer: bool,
+                        standalone: bool) -> List[Any]:
+        """
+        Renderiza um almanaque inteiro ou um bloco de dias dele
+        
+        Em modo standalone, numeração de páginas e sumário são gravados pelo
+        ReportLab; nos blocos, são aplicados depois na mesclagem.
+        
+        Returns:
+            Entradas do sumário (título, nível, página relativa ao bloco)
+        """
+        from report_layout import Paragraph, PageBreak, report_document, AlmanacDocTemplate, draw_page_number
+        doc = report_document(output_path, AlmanacDocTemplate, native_outline=standalone)
+        
         story = []
+        multi_month = (period_start.year, period_start.month) != (period_end.year, period_end.month)
+        
+        if include_cover:
+            story.extend(self._build_almanac_cover(period_start, period_end, title))
+        
+        # Horas planetárias de todos os dias num único lote
+        self.planetary_hours.table(dates, [(self.location['latitude'], self.location['longitude'])])
+        
+        for date in dates:
+            if story:
+                story.append(PageBreak())
+            
+            if multi_month and (date.day == 1 or date == period_start):
+                month_heading = Paragraph(date.strftime('%B de %Y').upper(), self.styles['AuroraTitle'])
+                month_heading.outline_entry = (date.strftime('%B de %Y'), 0)
+                story.append(month_heading)
+            
+            day_heading = Paragraph(date.strftime('%A, %d de %B de %Y'), self.styles['AuroraHeading1'])
+            day_heading.outline_entry = (date.strftime('%d/%m/%Y'), 1 if multi_month else 0)
+            story.append(day_heading)
+            story.extend(self._build_day_sections(date))
+        
+        if include_footer:
+            story.extend(self._build_footer())
+        
+        with self.instrumentation.span('doc_build', document='almanac'):
+            if standalone:
+                def on_page(canv, doc):
+                    canv.showOutline()
+                    draw_page_number(canv, canv.getPageNumber())
+                doc.build(story, onFirstPage=on_page, onLaterPages=on_page)
+            else:
+                doc.build(story)
+        self._count_document(story, doc, document='almanac')
+        
+        return doc.outline_entries
+    
+    def _section(self, build: Callable[[datetime.date], List[Any]], date: datetime.date) -> List[Any]:
+        """Executa o construtor de uma seção dentro de um span com o nome dela"""
+        if not self.instrumentation.enabled:
+            return build(date)
+        with self.instrumentation.span('build_section', section=build.__name__[len('_build_'):]):
+            return build(date)
+    
+    def _count_document(self, story: List[Any], doc: Any, data: Optional[bytes] = None,
+                        document: str = 'daily'):
+        """Contadores de um documento renderizado (páginas, flowables e bytes)"""
+        self.instrumentation.count('documents', document=document)
+        self.instrumentation.count('pages', doc.page, document=document)
+        self.instrumentation.count('flowables', len(story), document=document)
+        if data is not None:
+            self.instrumentation.count('output_bytes', len(data), document=document)
+    
+    def _fragment(self, name: str, key: Any, build: Callable[[Any], List[Any]]) -> List[Any]:
+        """
+        Trecho de documento que depende só de uma chave pequena (mansão, fase...)
         
-        # Cabeçalho
-        story.extend(self._build_header(date))
+        É construído uma vez por gerador e reutilizado em todos os relatórios
+        do processo; os flowables são compartilhados, então não devem ser
+        alterados depois de criados.
+        """
+        fragment = self._fragments.get((name, key))
+        if fragment is None:
+            fragment = self._fragments[(name, key)] = tuple(build(key))
+        return list(fragment)
+    
+    def _section_heading(self, text: str) -> Any:
+        """Título de seção (AuroraHeading1) compartilhado entre relatórios"""
+        from report_layout import CachedParagraph
+        return self._fragment('heading', text, lambda t: [CachedParagraph(t, self.styles['AuroraHeading1'])])[0]
+    
+    def _build_day_sections(self, date: datetime.date) -> List[Any]:
+        """Constrói as seções de conteúdo de um dia"""
+        story = []
         
         # Seção: Informações Gerais
-        story.extend(self._build_general_info(date))
+        story.extend(self._section(self._build_general_info, date))
+        
+        # Seção: Posições Planetárias
+        story.extend(self._section(self._build_planetary_positions_section, date))
         
         # Seção: Mansão Lunar
-        story.extend(self._build_lunar_mansion_section(date))
+        if self.options['includeMansions']:
+            story.extend(self._section(self._build_lunar_mansion_section, date))
         
         # Seção: Deusa do Dia
-        story.extend(self._build_goddess_section(date))
+        story.extend(self._section(self._build_goddess_section, date))
         
         # Seção: Fase Lunar
-        story.extend(self._build_lunar_phase_section(date))
+        story.extend(self._section(self._build_lunar_phase_section, date))
+        
+        # Seção: Trânsitos
+        story.extend(self._section(self._build_transits_section, date))
+        
+        # Seção: Estrelas Fixas
+        story.extend(self._section(self._build_fixed_stars_section, date))
         
         # Seção: Eleições Mágicas
-        story.extend(self._build_magical_elections_section(date))
+        story.extend(self._section(self._build_magical_elections_section, date))
         
         # Seção: Correspondências
-        story.extend(self._build_correspondences_section(date))
+        if self.options['includeCorrespondences']:
+            story.extend(self._section(self._build_correspondences_section, date))
         
-        # Rodapé
-        story.extend(self._build_footer())
+        # Seção: Horas Planetárias
+        story.extend(self._section(self._build_planetary_hours_section, date))
         
-        # Gerar PDF
-        doc.build(story)
+        return story
+    
+    def _build_almanac_cover(self, start: datetime.date, end: datetime.date, title: str) -> List[Any]:
+        """Constrói a capa de um documento de vários dias"""
+        from report_layout import Paragraph
+        elements = self._fragment('title', None, self._build_title_fragment)
         
-        return output_path
+        subtitle = f"{title} • {start.strftime('%d/%m/%Y')} – {end.strftime('%d/%m/%Y')}"
+        elements.append(Paragraph(subtitle, self.styles['AuroraCaption']))
+        elements.extend(self._fragment('header-rule', None, self._build_header_rule_fragment))
+        
+        return elements
     
     def _build_header(self, date: datetime.date) -> List[Any]:
         """Constrói o cabeçalho do relatório"""
-        elements = []
-        
+        from report_layout import Paragraph
         # Título principal
-        title = f"AURORA SAGRADA"
-        elements.append(Paragraph(title, self.styles['AuroraTitle']))
+        elements = self._fragment('title', None, self._build_title_fragment)
         
         # Subtítulo com data
         subtitle = f"Guia Astromágicko • {date.strftime('%d de %B de %Y')}"
         elements.append(Paragraph(subtitle, self.styles['AuroraCaption']))
         
-        elements.append(Spacer(1, 20))
-        
         # Linha decorativa
-        elements.append(self._create_decorative_line())
-        elements.append(Spacer(1, 15))
+        elements.extend(self._fragment('header-rule', None, self._build_header_rule_fragment))
         
         return elements
     
+    def _build_title_fragment(self, _key: None) -> List[Any]:
+        """Título principal (estático)"""
+        from report_layout import CachedParagraph
+        return [CachedParagraph("AURORA SAGRADA", self.styles['AuroraTitle'])]
+    
+    def _build_header_rule_fragment(self, _key: None) -> List[Any]:
+        """Espaçamento e linha decorativa sob o cabeçalho (estáticos)"""
+        from report_layout import Spacer
+        return [Spacer(1, 20), self._create_decorative_line(), Spacer(1, 15)]
+    
     def _build_general_info(self, date: datetime.date) -> List[Any]:
         """Constrói seção de informações gerais"""
+        from report_layout import cm, Spacer, Table, TableStyle, COLORS, FONTS
         elements = []
         
-        elements.append(Paragraph("INFORMAÇÕES ASTROLÓGICAS", self.styles['AuroraHeading1']))
+        elements.append(self._section_heading("INFORMAÇÕES ASTROLÓGICAS"))
         
         # Calcular dados
         lunar_mansion = self.calculate_lunar_mansion(date)
@@ -320,10 +711,10 @@ class AuroraReportGenerator:
         
         table = Table(data, colWidths=[4*cm, 10*cm])
         table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+            ('FONTNAME', (0, 0), (-1, -1), FONTS['regular']),
             ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('TEXTCOLOR', (0, 0), (0, -1), self.COLORS['vinho']),
-            ('TEXTCOLOR', (1, 0), (1, -1), self.COLORS['azul_noite']),
+            ('TEXTCOLOR', (0, 0), (0, -1), COLORS['vinho']),
+            ('TEXTCOLOR', (1, 0), (1, -1), COLORS['azul_noite']),
             ('VALIGN', (0, 0), (-1, -1), 'TOP'),
             ('LEFTPADDING', (0, 0), (-1, -1), 0),
             ('RIGHTPADDING', (0, 0), (-1, -1), 0),
@@ -336,84 +727,209 @@ class AuroraReportGenerator:
         
         return elements
     
+    def _build_planetary_positions_section(self, date: datetime.date) -> List[Any]:
+        """Constrói seção de posições planetárias"""
+        from report_layout import cm, Spacer, Table, TableStyle, COLORS, FONTS
+        from astro_lib import format_longitude
+        elements = []
+        
+        elements.append(self._section_heading("POSIÇÕES PLANETÁRIAS"))
+        
+        positions = self.calculate_planet_positions(date)
+        
+        data = [["Astro", "Posição"]]
+        for planet, longitude in positions.items():
+            data.append([planet, format_longitude(longitude)])
+        
+        table = Table(data, colWidths=[4*cm, 6*cm])
+        table.setStyle(TableStyle([
+            ('FONTNAME', (0, 0), (-1, 0), FONTS['bold']),
+            ('FONTNAME', (0, 1), (-1, -1), FONTS['regular']),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('TEXTCOLOR', (0, 0), (-1, 0), COLORS['dourado']),
+            ('TEXTCOLOR', (0, 1), (0, -1), COLORS['vinho']),
+            ('TEXTCOLOR', (1, 1), (1, -1), COLORS['azul_noite']),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('GRID', (0, 0), (-1, -1), 0.5, COLORS['salvia']),
+            ('BACKGROUND', (0, 0), (-1, 0), COLORS['pergaminho']),
+        ]))
+        
+        elements.append(table)
+        elements.append(Spacer(1, 20))
+        
+        return elements
+    
     def _build_lunar_mansion_section(self, date: datetime.date) -> List[Any]:
         """Constrói seção da mansão lunar"""
+        from report_layout import Paragraph, Spacer
+        elements = self._fragment('mansion', self.calculate_lunar_mansion(date), self._build_lunar_mansion_fragment)
+        
+        # Ingressos do dia civil (UTC)
+        start = datetime.datetime.combine(date, datetime.time())
+        ingresses = self.lunar_mansions.ingresses_between(start, start + datetime.timedelta(days=1))
+        for ingress in ingresses:
+            elements.append(Paragraph(
+                f"Ingresso na {self._mansion_label(ingress)} às {ingress['instant']:%H:%M} UTC",
+                self.styles['AuroraBody']))
+        if not ingresses:
+            ingress = self.lunar_mansions.next_ingress(start)
+            elements.append(Paragraph(
+                f"Próximo ingresso: {self._mansion_label(ingress)} em {ingress['instant']:%d/%m %H:%M} UTC",
+                self.styles['AuroraBody']))
+        
+        elements.append(Spacer(1, 20))
+        
+        return elements
+    
+    @staticmethod
+    def _mansion_label(ingress: Dict[str, Any]) -> str:
+        """'mansão 1 (Al-Sharatain)', ou só o número se a base não tiver o nome"""
+        label = f"mansão {ingress['mansion']}"
+        return f"{label} ({ingress['name']})" if ingress['name'] else label
+    
+    def _build_lunar_mansion_fragment(self, mansion_number: int) -> List[Any]:
+        """Conteúdo da seção para uma das 28 mansões"""
+        from report_layout import CachedParagraph
         elements = []
         
-        mansion_number = self.calculate_lunar_mansion(date)
         mansion_data = self.get_lunar_mansion_data(mansion_number)
         
-        elements.append(Paragraph("MANSÃO LUNAR", self.styles['AuroraHeading1']))
+        elements.append(self._section_heading("MANSÃO LUNAR"))
         
-        # Nome e espírito
-        elements.append(Paragraph(f"<b>{mansion_data.get('nome', f'Mansão {mansion_number}')}</b>", self.styles['AuroraHeading2']))
+        # Nome (e o original árabe) e espírito
+        name = f"<b>{mansion_data.get('nome', f'Mansão {mansion_number}')}</b>"
+        if mansion_data.get('nomeArabico'):
+            name += f" ({mansion_data['nomeArabico']})"
+        elements.append(CachedParagraph(name, self.styles['AuroraHeading2']))
         
         if 'espiritoToscano' in mansion_data:
-            elements.append(Paragraph(f"Espírito Toscano: <i>{mansion_data['espiritoToscano']}</i>", self.styles['AuroraBody']))
+            elements.append(CachedParagraph(f"Espírito Toscano: <i>{mansion_data['espiritoToscano']}</i>", self.styles['AuroraBody']))
         
         # Significado
         if 'significado' in mansion_data:
-            elements.append(Paragraph(mansion_data['significado'], self.styles['AuroraBody']))
+            elements.append(CachedParagraph(mansion_data['significado'], self.styles['AuroraBody']))
         
         # Usos mágicos
         if 'usosMagicos' in mansion_data:
-            elements.append(Paragraph("<b>Usos Mágicos:</b>", self.styles['AuroraHeading2']))
+            elements.append(CachedParagraph("<b>Usos Mágicos:</b>", self.styles['AuroraHeading2']))
             for uso in mansion_data['usosMagicos'][:5]:  # Limitar a 5 itens
-                elements.append(Paragraph(f"• {uso}", self.styles['AuroraBody']))
+                elements.append(CachedParagraph(f"• {uso}", self.styles['AuroraBody']))
         
         # Correspondências
         if 'correspondencias' in mansion_data:
             corr = mansion_data['correspondencias']
-            elements.append(Paragraph("<b>Correspondências:</b>", self.styles['AuroraHeading2']))
+            elements.append(CachedParagraph("<b>Correspondências:</b>", self.styles['AuroraHeading2']))
             
             if 'ervas' in corr:
                 ervas = ', '.join(corr['ervas'][:5])
-                elements.append(Paragraph(f"<b>Ervas:</b> {ervas}", self.styles['AuroraBody']))
+                elements.append(CachedParagraph(f"<b>Ervas:</b> {ervas}", self.styles['AuroraBody']))
             
             if 'pedras' in corr:
                 pedras = ', '.join(corr['pedras'][:5])
-                elements.append(Paragraph(f"<b>Pedras:</b> {pedras}", self.styles['AuroraBody']))
+                elements.append(CachedParagraph(f"<b>Pedras:</b> {pedras}", self.styles['AuroraBody']))
             
             if 'cores' in corr:
                 cores = ', '.join(corr['cores'][:3])
-                elements.append(Paragraph(f"<b>Cores:</b> {cores}", self.styles['AuroraBody']))
+                elements.append(CachedParagraph(f"<b>Cores:</b> {cores}", self.styles['AuroraBody']))
         
         # Invocação
         if 'invocacao' in mansion_data:
-            elements.append(Paragraph("<b>Invocação:</b>", self.styles['AuroraHeading2']))
-            elements.append(Paragraph(f'"{mansion_data["invocacao"]}"', self.styles['AuroraQuote']))
-        
-        elements.append(Spacer(1, 20))
+            elements.append(CachedParagraph("<b>Invocação:</b>", self.styles['AuroraHeading2']))
+            elements.append(CachedParagraph(f'"{mansion_data["invocacao"]}"', self.styles['AuroraQuote']))
         
         return elements
     
     def _build_goddess_section(self, date: datetime.date) -> List[Any]:
         """Constrói seção da deusa do dia"""
+        from report_layout import Paragraph, Spacer
         elements = []
         
         goddess = self.get_goddess_of_day(date)
         
-        elements.append(Paragraph("DEUSA DO DIA", self.styles['AuroraHeading1']))
+        elements.append(self._section_heading("DEUSA DO DIA"))
         
-        elements.append(Paragraph(f"<b>{goddess['nome']}</b>", self.styles['AuroraHeading2']))
-        elements.append(Paragraph(f"Elemento: {goddess['elemento']}", self.styles['AuroraBody']))
-        elements.append(Paragraph(f"Domínio: {goddess['dominio']}", self.styles['AuroraBody']))
+        name = f"<b>{goddess['nome']}</b>"
+        if goddess.get('origem'):
+            name += f" ({goddess['origem']})"
+        elements.append(Paragraph(name, self.styles['AuroraHeading2']))
+        elements.append(Paragraph(f"Elemento: {goddess.get('elemento', '—')}", self.styles['AuroraBody']))
+        elements.append(Paragraph(f"Domínio: {goddess.get('dominio', '—')}", self.styles['AuroraBody']))
+        if 'planeta' in goddess:
+            elements.append(Paragraph(f"Planeta: {goddess['planeta']}", self.styles['AuroraBody']))
         
         if 'historia' in goddess:
             elements.append(Paragraph(goddess['historia'], self.styles['AuroraBody']))
         
+        # Correspondências e oferendas
+        corr = goddess.get('correspondencias', {})
+        labels = [('cores', 'Cores'), ('cristais', 'Cristais'), ('ervas', 'Ervas'),
+                  ('incensos', 'Incensos'), ('simbolos', 'Símbolos'), ('animais', 'Animais')]
+        lines = [f"<b>{label}:</b> {', '.join(corr[key][:5])}" for key, label in labels if corr.get(key)]
+        if corr.get('dia_semana'):
+            lines.append(f"<b>Dia:</b> {corr['dia_semana']}")
+        if lines:
+            elements.append(Paragraph("<b>Correspondências:</b>", self.styles['AuroraHeading2']))
+            elements.extend(Paragraph(line, self.styles['AuroraBody']) for line in lines)
+        
+        if corr.get('oferendas'):
+            elements.append(Paragraph("<b>Oferendas:</b>", self.styles['AuroraHeading2']))
+            elements.append(Paragraph(', '.join(corr['oferendas']), self.styles['AuroraBody']))
+        
+        # Invocação
+        if 'invocacao' in goddess:
+            elements.append(Paragraph("<b>Invocação:</b>", self.styles['AuroraHeading2']))
+            elements.append(Paragraph(f'"{goddess["invocacao"]}"', self.styles['AuroraQuote']))
+        
         elements.append(Spacer(1, 20))
         
         return elements
     
     def _build_lunar_phase_section(self, date: datetime.date) -> List[Any]:
         """Constrói seção da fase lunar"""
-        elements = []
+        from report_layout import Paragraph, Spacer
+        from lunar_phases import FULL_MOON, NEW_MOON
+        elements = self._fragment('phase', self.calculate_lunar_phase(date), self._build_lunar_phase_fragment)
+        
+        # Próximas fases e luas especiais do dia, pelo índice de eventos
+        moment = datetime.datetime.combine(date, datetime.time())
+        upcoming = [self.lunar_phases.next_event(moment, kind) for kind in (NEW_MOON, FULL_MOON)]
+        upcoming.sort(key=lambda event: event['jd'])
+        elements.append(Paragraph(
+            "Próximas fases: " + "; ".join(
+                f"{event['name']} em {event['instant']:%d/%m %H:%M} UTC" for event in upcoming),
+            self.styles['AuroraBody']))
+        
+        for period in self.calculate_void_of_course(date):
+            last = (f"após {period['aspect']} com {period['body']}" if period['body']
+                    else "sem aspectos no signo")
+            elements.append(Paragraph(
+                f"<b>Lua fora de curso:</b> {period['start']:%d/%m %H:%M} – {period['end']:%d/%m %H:%M} UTC "
+                f"({last}; entra em {period['sign']})",
+                self.styles['AuroraBody']))
+        
+        specials = self.bases_data.get('esbats.json', {}).get('especiais', {})
+        checks = [
+            ('superlua', self.lunar_phases.is_supermoon),
+            ('blue_moon', self.lunar_phases.is_blue_moon),
+            ('black_moon', self.lunar_phases.is_black_moon),
+        ]
+        for key, check in checks:
+            if key in specials and check(date):
+                elements.append(Paragraph(
+                    f"<b>{specials[key]['nome']}:</b> {specials[key]['significado']}. {specials[key]['recomendado']}",
+                    self.styles['AuroraBody']))
         
-        phase = self.calculate_lunar_phase(date)
+        elements.append(Spacer(1, 20))
+        
+        return elements
+    
+    def _build_lunar_phase_fragment(self, phase: str) -> List[Any]:
+        """Conteúdo da seção para uma das fases"""
+        from report_layout import CachedParagraph
+        elements = []
         
-        elements.append(Paragraph("FASE LUNAR", self.styles['AuroraHeading1']))
-        elements.append(Paragraph(f"<b>Lua {phase}</b>", self.styles['AuroraHeading2']))
+        elements.append(self._section_heading("FASE LUNAR"))
+        elements.append(CachedParagraph(f"<b>Lua {phase}</b>", self.styles['AuroraHeading2']))
         
         # Descrições das fases
         phase_descriptions = {
@@ -423,26 +939,179 @@ class AuroraReportGenerator:
             "Minguante": "Fase de liberação, limpeza, reflexão e preparação para o novo ciclo."
         }
         
-        elements.append(Paragraph(phase_descriptions.get(phase, "Influência lunar geral."), self.styles['AuroraBody']))
+        elements.append(CachedParagraph(phase_descriptions.get(phase, "Influência lunar geral."), self.styles['AuroraBody']))
+        
+        return elements
+    
+    def transits_for(self, date: datetime.date) -> 'AspectTimeline':
+        """Aspectos do mês da data (uma varredura por mês, reaproveitada)"""
+        month = (date.year, date.month)
+        if month not in self._transits:
+            start = datetime.datetime(date.year, date.month, 1)
+            end = (start + datetime.timedelta(days=32)).replace(day=1)
+            self._transits[month] = self.aspects.sweep(start, end)
+        return self._transits[month]
+    
+    def _build_transits_section(self, date: datetime.date) -> List[Any]:
+        """Constrói seção dos trânsitos: aspectos exatos no dia e aspectos lentos em orbe"""
+        from report_layout import cm, Paragraph, Spacer, Table, TableStyle, COLORS, FONTS
+        from aspects import signed_separation
+        elements = []
+        
+        elements.append(self._section_heading("TRÂNSITOS"))
+        
+        timeline = self.transits_for(date)
+        start = datetime.datetime.combine(date, datetime.time())
+        exact = timeline.exact_between(start, start + datetime.timedelta(days=1))
+        
+        data = [["Aspecto", "Exato (UTC)", "Orbe"]]
+        for moment, interval in exact:
+            a, b = interval['bodies']
+            data.append([f"{a} {interval['name']} {b}", moment.strftime('%H:%M'), "0°"])
+        
+        # Aspectos em orbe ao meio-dia que não passam pelo exato hoje (sem a Lua, que muda a cada hora)
+        exact_today = {id(interval) for _, interval in exact}
+        longitudes = self.calculate_body_longitudes(date)
+        for interval in timeline.active_at(date):
+            a, b = interval['bodies']
+            if id(interval) in exact_today or 'Lua' in (a, b):
+                continue
+            orb = abs(abs(float(signed_separation(longitudes[a], longitudes[b]))) - interval['angle'])
+            data.append([f"{a} {interval['name']} {b}", "—", f"{orb:.1f}°"])
+        
+        if len(data) == 1:
+            elements.append(Paragraph("Nenhum aspecto em orbe.", self.styles['AuroraBody']))
+        else:
+            table = Table(data, colWidths=[7*cm, 3*cm, 2*cm])
+            table.setStyle(TableStyle([
+                ('FONTNAME', (0, 0), (-1, 0), FONTS['bold']),
+                ('FONTNAME', (0, 1), (-1, -1), FONTS['regular']),
+                ('FONTSIZE', (0, 0), (-1, -1), 10),
+                ('TEXTCOLOR', (0, 0), (-1, 0), COLORS['dourado']),
+                ('TEXTCOLOR', (0, 1), (0, -1), COLORS['vinho']),
+                ('TEXTCOLOR', (1, 1), (-1, -1), COLORS['azul_noite']),
+                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                ('GRID', (0, 0), (-1, -1), 0.5, COLORS['salvia']),
+                ('BACKGROUND', (0, 0), (-1, 0), COLORS['pergaminho']),
+            ]))
+            elements.append(table)
+        
+        elements.append(Spacer(1, 20))
+        
+        return elements
+    
+    def _build_fixed_stars_section(self, date: datetime.date) -> List[Any]:
+        """Constrói seção das estrelas fixas: conjunções dos astros no dia"""
+        from report_layout import cm, Paragraph, Spacer, Table, TableStyle, COLORS, FONTS
+        from astro_lib import format_longitude
+        elements = []
+        
+        elements.append(self._section_heading("ESTRELAS FIXAS"))
+        
+        contacts = self.calculate_fixed_star_contacts(date)
+        if not contacts:
+            elements.append(Paragraph("Nenhum astro em conjunção com estrelas fixas.", self.styles['AuroraBody']))
+            elements.append(Spacer(1, 20))
+            return elements
+        
+        data = [["Conjunção", "Estrela em", "Mais próxima (UTC)", "Orbe"]]
+        for contact in contacts:
+            data.append([
+                f"{contact['body']} ☌ {contact['name']}",
+                format_longitude(contact['longitude']),
+                contact['instant'].strftime('%H:%M'),
+                f"{abs(contact['separation']):.1f}°",
+            ])
+        
+        table = Table(data, colWidths=[5.5*cm, 3.5*cm, 3.5*cm, 2*cm])
+        table.setStyle(TableStyle([
+            ('FONTNAME', (0, 0), (-1, 0), FONTS['bold']),
+            ('FONTNAME', (0, 1), (-1, -1), FONTS['regular']),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('TEXTCOLOR', (0, 0), (-1, 0), COLORS['dourado']),
+            ('TEXTCOLOR', (0, 1), (0, -1), COLORS['vinho']),
+            ('TEXTCOLOR', (1, 1), (-1, -1), COLORS['azul_noite']),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('GRID', (0, 0), (-1, -1), 0.5, COLORS['salvia']),
+            ('BACKGROUND', (0, 0), (-1, 0), COLORS['pergaminho']),
+        ]))
+        elements.append(table)
+        
+        # Natureza e significado de cada estrela tocada no dia (uma vez por estrela)
+        for contact in {contact['key']: contact for contact in contacts}.values():
+            nature = f" ({contact['nature']})" if contact['nature'] else ""
+            elements.append(Paragraph(
+                f"<b>{contact['name']}</b>{nature}: {contact['meaning'] or ''}", self.styles['AuroraBody']))
         
         elements.append(Spacer(1, 20))
         
         return elements
     
+    def _local_time(self, moment: datetime.datetime) -> datetime.datetime:
+        """Instante UTC no fuso do local configurado (UTC se o fuso for desconhecido)"""
+        moment = moment.replace(tzinfo=datetime.timezone.utc)
+        try:
+            return moment.astimezone(zoneinfo.ZoneInfo(self.location['timezone']))
+        except (zoneinfo.ZoneInfoNotFoundError, ValueError, KeyError):
+            return moment
+    
+    def _build_planetary_hours_section(self, date: datetime.date) -> List[Any]:
+        """Constrói seção das horas planetárias (dia e noite lado a lado)"""
+        from report_layout import cm, Paragraph, Spacer, Table, TableStyle, COLORS, FONTS
+        elements = []
+        
+        elements.append(self._section_heading("HORAS PLANETÁRIAS"))
+        
+        day = self.planetary_hours.hours_for(date, self.location['latitude'], self.location['longitude'])
+        elements.append(Paragraph(
+            f"Regente do dia: <b>{day['day_ruler']}</b> • {self.location.get('nome', '')}",
+            self.styles['AuroraBody']))
+        
+        if not day['hours']:
+            elements.append(Paragraph("O Sol não nasce ou não se põe nesta data e latitude.", self.styles['AuroraBody']))
+            elements.append(Spacer(1, 20))
+            return elements
+        
+        data = [["Hora", "Início", "Regente", "Hora", "Início", "Regente"]]
+        for diurnal, nocturnal in zip(day['hours'][:12], day['hours'][12:]):
+            data.append([
+                str(diurnal['hour']), self._local_time(diurnal['start']).strftime('%H:%M'), diurnal['planet'],
+                str(nocturnal['hour']), self._local_time(nocturnal['start']).strftime('%H:%M'), nocturnal['planet'],
+            ])
+        
+        table = Table(data, colWidths=[1.5*cm, 2*cm, 3*cm, 1.5*cm, 2*cm, 3*cm])
+        table.setStyle(TableStyle([
+            ('FONTNAME', (0, 0), (-1, 0), FONTS['bold']),
+            ('FONTNAME', (0, 1), (-1, -1), FONTS['regular']),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('TEXTCOLOR', (0, 0), (-1, 0), COLORS['dourado']),
+            ('TEXTCOLOR', (0, 1), (-1, -1), COLORS['azul_noite']),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('GRID', (0, 0), (-1, -1), 0.5, COLORS['salvia']),
+            ('BACKGROUND', (0, 0), (-1, 0), COLORS['pergaminho']),
+        ]))
+        
+        elements.append(table)
+        elements.append(Spacer(1, 20))
+        
+        return elements
+    
     def _build_magical_elections_section(self, date: datetime.date) -> List[Any]:
         """Constrói seção de eleições mágicas"""
+        from report_layout import cm, Spacer, Table, TableStyle, COLORS, FONTS
         elements = []
         
-        elements.append(Paragraph("ELEIÇÕES MÁGICAS", self.styles['AuroraHeading1']))
+        elements.append(self._section_heading("ELEIÇÕES MÁGICAS"))
         
-        # Simular scores baseados na data
+        # Scores pelos pesos de eleicoes-magickas.json
+        scores = self._calculate_theme_scores(date)
         themes = {
-            "Amor": self._calculate_theme_score(date, "amor"),
-            "Trabalho": self._calculate_theme_score(date, "trabalho"),
-            "Beleza": self._calculate_theme_score(date, "beleza"),
-            "Prosperidade": self._calculate_theme_score(date, "prosperidade"),
-            "Justiça": self._calculate_theme_score(date, "justica"),
-            "Contato Espiritual": self._calculate_theme_score(date, "contato")
+            "Amor": scores.get("amor", 0),
+            "Trabalho": scores.get("trabalho", 0),
+            "Beleza": scores.get("beleza", 0),
+            "Prosperidade": scores.get("prosperidade", 0),
+            "Justiça": scores.get("justica", 0),
+            "Contato Espiritual": scores.get("contato", 0)
         }
         
         # Criar tabela de scores
@@ -453,15 +1122,15 @@ class AuroraReportGenerator:
         
         table = Table(data, colWidths=[4*cm, 4*cm, 2*cm])
         table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTNAME', (0, 0), (-1, 0), FONTS['bold']),
+            ('FONTNAME', (0, 1), (-1, -1), FONTS['regular']),
             ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('TEXTCOLOR', (0, 0), (-1, 0), self.COLORS['dourado']),
-            ('TEXTCOLOR', (0, 1), (-1, -1), self.COLORS['azul_noite']),
+            ('TEXTCOLOR', (0, 0), (-1, 0), COLORS['dourado']),
+            ('TEXTCOLOR', (0, 1), (-1, -1), COLORS['azul_noite']),
             ('ALIGN', (2, 0), (2, -1), 'CENTER'),
             ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('GRID', (0, 0), (-1, -1), 0.5, self.COLORS['salvia']),
-            ('BACKGROUND', (0, 0), (-1, 0), self.COLORS['pergaminho']),
+            ('GRID', (0, 0), (-1, -1), 0.5, COLORS['salvia']),
+            ('BACKGROUND', (0, 0), (-1, 0), COLORS['pergaminho']),
         ]))
         
         elements.append(table)
@@ -471,12 +1140,16 @@ class AuroraReportGenerator:
     
     def _build_correspondences_section(self, date: datetime.date) -> List[Any]:
         """Constrói seção de correspondências"""
+        # Correspondências baseadas na fase lunar
+        return self._fragment('correspondences', self.calculate_lunar_phase(date),
+                              self._build_correspondences_fragment)
+    
+    def _build_correspondences_fragment(self, phase: str) -> List[Any]:
+        """Conteúdo da seção para uma das fases"""
+        from report_layout import Spacer, CachedParagraph
         elements = []
         
-        elements.append(Paragraph("CORRESPONDÊNCIAS DO DIA", self.styles['AuroraHeading1']))
-        
-        # Correspondências baseadas na fase lunar e mansão
-        phase = self.calculate_lunar_phase(date)
+        elements.append(self._section_heading("CORRESPONDÊNCIAS DO DIA"))
         
         correspondences = {
             "Nova": {
@@ -503,9 +1176,9 @@ class AuroraReportGenerator:
         
         phase_corr = correspondences.get(phase, correspondences["Nova"])
         
-        elements.append(Paragraph(f"<b>Cores:</b> {', '.join(phase_corr['cores'])}", self.styles['AuroraBody']))
-        elements.append(Paragraph(f"<b>Cristais:</b> {', '.join(phase_corr['cristais'])}", self.styles['AuroraBody']))
-        elements.append(Paragraph(f"<b>Ervas:</b> {', '.join(phase_corr['ervas'])}", self.styles['AuroraBody']))
+        elements.append(CachedParagraph(f"<b>Cores:</b> {', '.join(phase_corr['cores'])}", self.styles['AuroraBody']))
+        elements.append(CachedParagraph(f"<b>Cristais:</b> {', '.join(phase_corr['cristais'])}", self.styles['AuroraBody']))
+        elements.append(CachedParagraph(f"<b>Ervas:</b> {', '.join(phase_corr['ervas'])}", self.styles['AuroraBody']))
         
         elements.append(Spacer(1, 20))
         
@@ -513,77 +1186,375 @@ class AuroraReportGenerator:
     
     def _build_footer(self) -> List[Any]:
         """Constrói rodapé do relatório"""
+        return self._fragment('footer', None, self._build_footer_fragment)
+    
+    def _build_footer_fragment(self, _key: None) -> List[Any]:
+        """Rodapé (estático)"""
+        from report_layout import Spacer, CachedParagraph
         elements = []
         
         elements.append(self._create_decorative_line())
         elements.append(Spacer(1, 10))
         
         footer_text = "Aurora Sagrada • Guia Astromágicko • Gerado automaticamente"
-        elements.append(Paragraph(footer_text, self.styles['AuroraCaption']))
+        elements.append(CachedParagraph(footer_text, self.styles['AuroraCaption']))
         
         return elements
     
     def _create_decorative_line(self) -> Any:
         """Cria linha decorativa"""
-        from reportlab.platypus import HRFlowable
-        return HRFlowable(width="100%", thickness=1, color=self.COLORS['dourado'])
+        from report_layout import decorative_line
+        return decorative_line()
     
     def _get_season(self, date: datetime.date) -> str:
-        """Determina a estação do ano"""
+        """Determina a estação do ano no hemisfério das opções"""
         month = date.month
         day = date.day
         
         if (month == 12 and day >= 21) or month in [1, 2] or (month == 3 and day < 20):
-            return "Verão" # Hemisfério Sul
+            seasons = ("Verão", "Inverno")
         elif (month == 3 and day >= 20) or month in [4, 5] or (month == 6 and day < 21):
-            return "Outono"
+            seasons = ("Outono", "Primavera")
         elif (month == 6 and day >= 21) or month in [7, 8] or (month == 9 and day < 22):
-            return "Inverno"
+            seasons = ("Inverno", "Verão")
         else:
-            return "Primavera"
+            seasons = ("Primavera", "Outono")
+        return seasons[HEMISPHERES.index(self.options['hemisphere'])]
     
     def _calculate_theme_score(self, date: datetime.date, theme: str) -> int:
-        """Calcula score de favorabilidade para um tema"""
-        # Algoritmo simplificado baseado na data e tema
-        base_score = 50
-        
-        # Modificadores baseados no dia da semana
-        weekday_modifiers = {
-            "amor": [0, 10, -5, 5, 15, 20, 0],  # Domingo a Sábado
-            "trabalho": [0, 15, 20, 15, 10, 5, -10],
-            "beleza": [5, 10, 5, 10, 20, 15, 0],
-            "prosperidade": [10, 5, 15, 20, 15, 10, 5],
-            "justica": [15, 10, 20, 15, 10, 5, 0],
-            "contato": [20, 5, 0, 10, 5, 0, 15]
-        }
-        
-        weekday = date.weekday()  # 0 = Monday
-        modifier = weekday_modifiers.get(theme, [0] * 7)[weekday]
-        
-        # Modificador baseado na fase lunar
-        phase = self.calculate_lunar_phase(date)
-        phase_modifiers = {
-            "Nova": {"contato": 20, "trabalho": -10},
-            "Crescente": {"prosperidade": 15, "trabalho": 10},
-            "Cheia": {"amor": 20, "beleza": 15},
-            "Minguante": {"justica": 15, "contato": 10}
-        }
-        
-        phase_mod = phase_modifiers.get(phase, {}).get(theme, 0)
-        
-        final_score = base_score + modifier + phase_mod
-        return max(0, min(100, final_score))
+        """Calcula score de favorabilidade (0-100) para um tema"""
+        return self._calculate_theme_scores(date).get(theme, 0)
+    
+    def _calculate_theme_scores(self, date: datetime.date) -> Dict[str, int]:
+        """Scores (0-100) de todos os temas de eleicoes-magickas.json, com o céu calculado uma vez"""
+        from astro_lib import to_julian_day
+        scores = self.elections.scores(to_julian_day(date))
+        return {theme: int(round(float(score[0]) * 100)) for theme, score in scores.items()}
     
     def _get_favorability_text(self, score: int) -> str:
-        """Converte score em texto de favorabilidade"""
-        if score >= 80:
-            return "Excelente"
-        elif score >= 60:
-            return "Favorável"
-        elif score >= 40:
-            return "Neutro"
+        """
+        Converte score (0-100) em texto de favorabilidade
+
+        A escala é a do motor de eleições: o score mínimo das janelas
+        (minScore) já é favorável e o dobro dele, excelente; os scores raramente
+        passam de 0,7, então limites fixos em 80/60/40 deixariam quase todos
+        os dias desfavoráveis.
+        """
+        reference = self.elections.min_score or DEFAULT_FAVORABILITY_REFERENCE
+        for factor, text in FAVORABILITY_LEVELS:
+            if score / 100.0 >= factor * reference:
+                return text
+        return "Desfavorável"
+
+# Gerador reutilizado por cada processo do pool de geração em lote
+_worker_generator: Optional[AuroraReportGenerator] = None
+
+
+def _init_batch_worker(data_dir: Optional[str], cache_dir: Optional[str] = None,
+                       location: Optional[Dict[str, Any]] = None, instrumented: bool = False,
+                       options: Optional[Dict[str, Any]] = None, record_events: bool = False):
+    """
+    Inicializa o gerador do processo (estilos e bases carregados uma única vez)
+    
+    Com record_events, os eventos das métricas vão nos snapshots e chegam aos
+    ganchos (ex.: logs JSON) do processo principal.
+    """
+    global _worker_generator
+    instrumentation = Instrumentation(enabled=instrumented, record_events=record_events)
+    _worker_generator = AuroraReportGenerator(data_dir=data_dir, cache_dir=cache_dir, location=location,
+                                              instrumentation=instrumentation, options=options)
+
+
+def _generate_batch_item(date: datetime.date, output_dir: str) -> Dict[str, Any]:
+    """Gera um relatório dentro do pool, devolvendo a falha em vez de propagá-la"""
+    output_path = str(Path(output_dir) / f"aurora_sagrada_{date.strftime('%Y%m%d')}.pdf")
+    try:
+        _worker_generator.generate_daily_report(date, output_path)
+        result = {"date": date.isoformat(), "success": True, "filename": output_path}
+    except Exception as e:
+        result = {"date": date.isoformat(), "success": False, "error": f"{type(e).__name__}: {e}"}
+    instrumentation = _worker_generator.instrumentation
+    if instrumentation.enabled:
+        # Métricas desta data, somadas no processo principal
+        result['metrics'] = instrumentation.snapshot(reset=True)
+    return result
+
+
+def generate_batch_reports(dates: List[datetime.date], output_dir: str = '.',
+                           data_dir: Optional[str] = None,
+                           workers: Optional[int] = None,
+                           cache_dir: Optional[str] = None,
+                           location: Optional[Dict[str, Any]] = None,
+                           instrumentation: Optional[Instrumentation] = None,
+                           options: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """
+    Gera relatórios diários para várias datas em paralelo
+    
+    Cada processo do pool inicializa um único AuroraReportGenerator e o
+    reutiliza para todas as datas que receber; a falha de uma data não
+    interrompe as demais.
+    
+    Args:
+        dates: Datas dos relatórios
+        output_dir: Diretório de saída dos PDFs
+        data_dir: Diretório das bases de dados
+        workers: Número de processos (padrão: número de CPUs)
+        cache_dir: Diretório do cache de relatórios (opcional)
+        location: Local das horas planetárias (padrão: São Paulo)
+        instrumentation: Recebe as métricas dos processos do pool (se ligada)
+            e repassa os eventos deles aos seus ganchos
+        options: PDFGenerationRequest.options de todos os relatórios
+        
+    Returns:
+        Um resultado por data, na ordem recebida: {date, success, filename | error}
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    results = []
+    instrumented = instrumentation is not None and instrumentation.enabled
+    record_events = instrumented and instrumentation.has_hooks
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                             initargs=(data_dir, cache_dir, location, instrumented, options,
+                                       record_events)) as executor:
+        futures = [executor.submit(_generate_batch_item, date, str(output_dir)) for date in dates]
+        for date, future in zip(dates, futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                # Processo do pool encerrado abruptamente (ex.: BrokenProcessPool)
+                result = {"date": date.isoformat(), "success": False, "error": f"{type(e).__name__}: {e}"}
+            if 'metrics' in result:
+                instrumentation.merge(result.pop('metrics'))
+            if instrumented:
+                instrumentation.count('batch_reports', result='ok' if result['success'] else 'error')
+            results.append(result)
+    
+    return results
+
+
+def group_subscribers(subscribers: Dict[str, Optional[Dict[str, Any]]]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """
+    Agrupa assinantes pela variante do PDF que receberiam
+    
+    Returns:
+        ({variant_id: {options, subscribers}}, {assinante: resultado de erro}
+        para opções inválidas)
+    """
+    groups: Dict[str, Dict[str, Any]] = {}
+    errors: Dict[str, Dict[str, Any]] = {}
+    for subscriber, options in subscribers.items():
+        try:
+            variant = variant_options(options)
+        except ValueError as e:
+            errors[subscriber] = {"success": False, "error": f"Opções inválidas: {e}"}
+            continue
+        group = groups.setdefault(variant_id(variant), {'options': variant, 'subscribers': []})
+        group['subscribers'].append(subscriber)
+    return groups, errors
+
+
+def fanout_filename(date: datetime.date, key: str) -> str:
+    """Nome do PDF de uma variante"""
+    return f"aurora_sagrada_{date.strftime('%Y%m%d')}_{key}.pdf"
+
+
+def _generate_variant_item(date: datetime.date, options: Dict[str, Any], output_path: str) -> Dict[str, Any]:
+    """Gera a variante de um relatório dentro do pool"""
+    try:
+        with _worker_generator.using_options(options):
+            _worker_generator.generate_daily_report(date, output_path)
+        return {"success": True, "filename": output_path}
+    except Exception as e:
+        return {"success": False, "error": f"{type(e).__name__}: {e}"}
+
+
+def generate_fanout_reports(date: datetime.date, subscribers: Dict[str, Optional[Dict[str, Any]]],
+                            output_dir: str = '.', data_dir: Optional[str] = None,
+                            workers: Optional[int] = None, cache_dir: Optional[str] = None,
+                            location: Optional[Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Gera o relatório diário de muitos assinantes, com as variantes distintas em paralelo
+    
+    Cada variante (ver variant_options) é renderizada uma única vez, e todos
+    os assinantes dela recebem o mesmo arquivo.
+    
+    Args:
+        date: Data dos relatórios
+        subscribers: {assinante: PDFGenerationRequest.options}
+        output_dir: Diretório de saída dos PDFs
+        data_dir: Diretório das bases de dados
+        workers: Número de processos (padrão: número de CPUs, no máximo um por variante)
+        cache_dir: Diretório do cache de relatórios (opcional)
+        location: Local das horas planetárias (padrão: São Paulo)
+        
+    Returns:
+        {assinante: {success, variant, filename | error}}
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    groups, results = group_subscribers(subscribers)
+    if not groups:
+        return results
+    
+    workers = min(workers or os.cpu_count() or 1, len(groups))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                             initargs=(data_dir, cache_dir, location)) as executor:
+        futures = {key: executor.submit(_generate_variant_item, date, group['options'],
+                                        str(Path(output_dir) / fanout_filename(date, key)))
+                   for key, group in groups.items()}
+        for key, future in futures.items():
+            try:
+                result = {"variant": key, **future.result()}
+            except Exception as e:
+                # Processo do pool encerrado abruptamente (ex.: BrokenProcessPool)
+                result = {"success": False, "variant": key, "error": f"{type(e).__name__}: {e}"}
+            results.update((subscriber, result) for subscriber in groups[key]['subscribers'])
+    
+    return {subscriber: results[subscriber] for subscriber in subscribers}
+
+
+def period_for_format(fmt: str, date: datetime.date) -> tuple:
+    """Intervalo (início, fim inclusive) coberto por um formato de documento"""
+    if fmt == 'daily-report':
+        return date, date
+    if fmt == 'weekly-summary':
+        return date, date + datetime.timedelta(days=6)
+    if fmt == 'monthly-overview':
+        next_month = (date.replace(day=28) + datetime.timedelta(days=4)).replace(day=1)
+        return date.replace(day=1), next_month - datetime.timedelta(days=1)
+    if fmt == 'annual-almanac':
+        return datetime.date(date.year, 1, 1), datetime.date(date.year, 12, 31)
+    raise ValueError(f"Formato desconhecido: {fmt}")
+
+
+def _render_almanac_chunk(output_path: str, dates: List[datetime.date],
+                          period_start: datetime.date, period_end: datetime.date, title: str,
+                          include_cover: bool, include_footer: bool) -> List[Any]:
+    """Renderiza um bloco de dias de um almanaque dentro do pool"""
+    return _worker_generator._render_almanac(output_path, dates, period_start, period_end, title,
+                                             include_cover, include_footer, standalone=False)
+
+
+def _merge_almanac_chunks(chunk_paths: List[str], outlines: List[List[Any]], output_path: str):
+    """
+    Mescla os blocos em um único PDF com sumário e numeração de páginas contínuos
+    """
+    from report_layout import A4, canvas, draw_page_number
+    from pypdf import PdfReader, PdfWriter
+    writer = PdfWriter()
+    entries = []
+    
+    for path, outline in zip(chunk_paths, outlines):
+        offset = len(writer.pages)
+        writer.append(path, import_outline=False)
+        entries.extend((title, level, offset + page) for title, level, page in outline)
+    
+    # Numeração de páginas: uma página de carimbo por página do documento
+    buffer = BytesIO()
+    stamp = canvas.Canvas(buffer, pagesize=A4, pageCompression=1)
+    for number in range(1, len(writer.pages) + 1):
+        draw_page_number(stamp, number)
+        stamp.showPage()
+    stamp.save()
+    stamps = PdfReader(BytesIO(buffer.getvalue()))
+    for page, stamp_page in zip(writer.pages, stamps.pages):
+        page.merge_page(stamp_page)
+        page.compress_content_streams()
+    
+    # Recursos repetidos entre os blocos (estilos gráficos, fontes idênticas) viram um só
+    writer.compress_identical_objects(remove_identicals=True, remove_orphans=True)
+    
+    parent = None
+    for title, level, page in entries:
+        if level == 0:
+            parent = writer.add_outline_item(title, page)
         else:
-            return "Desfavorável"
+            writer.add_outline_item(title, page, parent=parent)
+    writer.page_mode = '/UseOutlines'
+    
+    with open(output_path, 'wb') as f:
+        writer.write(f)
+
+
+def generate_almanac_parallel(start: datetime.date, end: datetime.date, output_path: str = None,
+                              title: str = 'Almanaque', data_dir: Optional[str] = None,
+                              workers: Optional[int] = None,
+                              chunk_days: Optional[int] = None,
+                              location: Optional[Dict[str, Any]] = None,
+                              options: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Gera um documento de vários dias renderizando blocos de dias em paralelo
+    
+    Cada bloco começa em uma nova página, então corresponde a um intervalo de
+    páginas do documento final; os blocos são mesclados com sumário e
+    numeração contínuos. Sem pypdf, ou com um único bloco, o documento é
+    gerado em um único processo.
+    
+    Args:
+        start: Primeiro dia
+        end: Último dia (inclusive)
+        output_path: Caminho de saída do PDF
+        title: Título do documento
+        data_dir: Diretório das bases de dados
+        workers: Número de processos (padrão: número de CPUs)
+        chunk_days: Dias por bloco (padrão: dois blocos por processo, mínimo 7)
+        location: Local das horas planetárias (padrão: São Paulo)
+        options: PDFGenerationRequest.options (hemisfério, idioma, seções)
+        
+    Returns:
+        Caminho do arquivo PDF gerado
+    """
+    import importlib.util
+    from concurrent.futures import ProcessPoolExecutor
+    if not output_path:
+        output_path = f"aurora_sagrada_{start.strftime('%Y%m%d')}_{end.strftime('%Y%m%d')}.pdf"
+    
+    dates = date_range(start, end)
+    workers = workers or os.cpu_count() or 1
+    chunk_days = chunk_days or max(7, math.ceil(len(dates) / (workers * 2)))
+    chunks = [dates[i:i + chunk_days] for i in range(0, len(dates), chunk_days)]
+    
+    if importlib.util.find_spec('pypdf') is None or workers == 1 or len(chunks) == 1:
+        return AuroraReportGenerator(data_dir=data_dir, location=location, options=options).generate_almanac(
+            start, end, output_path, title)
+    
+    with tempfile.TemporaryDirectory(prefix='aurora_almanac_') as tmp_dir:
+        chunk_paths = [str(Path(tmp_dir) / f"chunk_{i:04d}.pdf") for i in range(len(chunks))]
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                 initargs=(data_dir, None, location, False, options)) as executor:
+            futures = [
+                executor.submit(_render_almanac_chunk, path, chunk, start, end, title,
+                                i == 0, i == len(chunks) - 1)
+                for i, (path, chunk) in enumerate(zip(chunk_paths, chunks))
+            ]
+            outlines = [future.result() for future in futures]
+        
+        _merge_almanac_chunks(chunk_paths, outlines, output_path)
+    
+    return output_path
+
+
+def _parse_date(value: str) -> datetime.date:
+    """Converte YYYY-MM-DD em data"""
+    return datetime.datetime.strptime(value.strip(), '%Y-%m-%d').date()
+
+
+def date_range(start: datetime.date, end: datetime.date) -> List[datetime.date]:
+    """Lista de datas de start até end, inclusive"""
+    return [start + datetime.timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+def _write_metrics(instrumentation: Instrumentation, path: Optional[str]):
+    """Grava as métricas no formato de texto do Prometheus (escrita atômica)"""
+    if not path:
+        return
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(instrumentation.prometheus())
+    os.replace(tmp_path, path)
+
 
 def main():
     """Função principal para teste"""
@@ -591,10 +1562,70 @@ def main():
     
     parser = argparse.ArgumentParser(description='Gerador de Relatórios Aurora Sagrada')
     parser.add_argument('--date', type=str, help='Data no formato YYYY-MM-DD')
-    parser.add_argument('--output', type=str, help='Arquivo de saída PDF')
+    parser.add_argument('--output', type=str, help="Arquivo de saída PDF ('-' para a saída padrão)")
     parser.add_argument('--data-dir', type=str, help='Diretório das bases de dados')
+    parser.add_argument('--from', dest='date_from', type=str, help='Lote: data inicial YYYY-MM-DD')
+    parser.add_argument('--to', dest='date_to', type=str, help='Lote: data final YYYY-MM-DD (inclusive)')
+    parser.add_argument('--dates', type=str, help='Lote: datas YYYY-MM-DD separadas por vírgula')
+    parser.add_argument('--output-dir', type=str, default='.', help='Lote: diretório de saída')
+    parser.add_argument('--workers', type=int, help='Lote: número de processos')
+    parser.add_argument('--cache-dir', type=str, help='Diretório do cache de relatórios renderizados')
+    parser.add_argument('--format', type=str, default='daily-report', choices=list(DOCUMENT_TITLES),
+                        help='Formato do documento (a partir de --date)')
+    parser.add_argument('--lat', type=float, help='Latitude das horas planetárias (padrão: São Paulo)')
+    parser.add_argument('--lon', type=float, help='Longitude das horas planetárias (leste positiva)')
+    parser.add_argument('--timezone', type=str, help='Fuso horário IANA das horas planetárias')
+    parser.add_argument('--hemisphere', type=str, choices=HEMISPHERES, help='Hemisfério das estações (padrão: south)')
+    parser.add_argument('--subscribers', type=str,
+                        help='JSON {assinante: options}: um relatório por variante distinta, na data de --date')
+    parser.add_argument('--metrics', type=str,
+                        help='Grava as métricas das etapas neste arquivo (formato do Prometheus)')
+    parser.add_argument('--log-json', action='store_true',
+                        help='Escreve cada span e contador como uma linha JSON na saída de erro')
     
     args = parser.parse_args()
+    if args.date_to and not args.date_from:
+        parser.error("--to requer --from")
+    if (args.lat is None) != (args.lon is None):
+        parser.error("--lat e --lon devem ser informados juntos")
+    
+    location = {}
+    if args.lat is not None:
+        location = {'nome': f"{args.lat:.4f}, {args.lon:.4f}", 'latitude': args.lat, 'longitude': args.lon,
+                    'timezone': args.timezone or 'UTC'}
+    elif args.timezone:
+        location = {'timezone': args.timezone}
+    
+    options = {'hemisphere': args.hemisphere} if args.hemisphere else {}
+    
+    instrumentation = Instrumentation(enabled=bool(args.metrics or args.log_json))
+    if args.log_json:
+        instrumentation.subscribe(json_log_hook())
+    
+    # Modo lote
+    if args.date_from or args.dates:
+        try:
+            if args.dates:
+                dates = [_parse_date(d) for d in args.dates.split(',') if d.strip()]
+            else:
+                dates = date_range(_parse_date(args.date_from), _parse_date(args.date_to or args.date_from))
+        except ValueError:
+            print("Formato de data inválido. Use YYYY-MM-DD")
+            return
+        
+        results = generate_batch_reports(dates, args.output_dir, args.data_dir, args.workers, args.cache_dir,
+                                         location, instrumentation, options)
+        _write_metrics(instrumentation, args.metrics)
+        failures = [r for r in results if not r['success']]
+        for result in results:
+            if result['success']:
+                print(f"{result['date']}: {result['filename']}")
+            else:
+                print(f"{result['date']}: ERRO {result['error']}")
+        print(f"Relatórios gerados: {len(results) - len(failures)}/{len(results)}")
+        if failures:
+            sys.exit(1)
+        return
     
     # Determinar data
     if args.date:
@@ -606,17 +1637,56 @@ def main():
     else:
         date = datetime.date.today()
     
+    # Um relatório por variante distinta entre os assinantes
+    if args.subscribers:
+        with open(args.subscribers, 'r', encoding='utf-8') as f:
+            subscribers = json.load(f)
+        results = generate_fanout_reports(date, subscribers, args.output_dir, args.data_dir, args.workers,
+                                          args.cache_dir, location)
+        failures = [subscriber for subscriber, result in results.items() if not result['success']]
+        for subscriber in failures:
+            print(f"{subscriber}: ERRO {results[subscriber]['error']}")
+        variants = {result['variant'] for result in results.values() if result['success']}
+        print(f"Assinantes atendidos: {len(results) - len(failures)}/{len(results)} "
+              f"({len(variants)} variantes renderizadas)")
+        if failures:
+            sys.exit(1)
+        return
+    
+    # Documentos de vários dias
+    if args.format != 'daily-report':
+        start, end = period_for_format(args.format, date)
+        try:
+            output_path = generate_almanac_parallel(start, end, args.output, DOCUMENT_TITLES[args.format],
+                                                    args.data_dir, args.workers, location=location,
+                                                    options=options)
+            print(f"Relatório gerado: {output_path}")
+        except Exception as e:
+            print(f"Erro ao gerar relatório: {e}")
+            import traceback
+            traceback.print_exc()
+        return
+    
     # Criar gerador
-    generator = AuroraReportGenerator(data_dir=args.data_dir)
+    generator = AuroraReportGenerator(data_dir=args.data_dir, cache_dir=args.cache_dir, location=location,
+                                      instrumentation=instrumentation, options=options)
     
     # Gerar relatório
+    streaming = args.output == '-'
     try:
-        output_path = generator.generate_daily_report(date, args.output)
-        print(f"Relatório gerado: {output_path}")
+        if streaming:
+            # PDF direto na saída padrão, sem arquivo intermediário
+            for chunk in generator.iter_daily_report(date):
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+        else:
+            output_path = generator.generate_daily_report(date, args.output)
+            print(f"Relatório gerado: {output_path}")
     except Exception as e:
-        print(f"Erro ao gerar relatório: {e}")
+        print(f"Erro ao gerar relatório: {e}", file=sys.stderr if streaming else sys.stdout)
         import traceback
         traceback.print_exc()
+    _write_metrics(instrumentation, args.metrics)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AURORA SAGRADA - SERVIÇO HTTP DE GERAÇÃO DE PDF
+Implementa o contrato usado por src/utils/pdf-api.ts:
+
+    POST /api/generate-pdf            -> PDFGenerationResponse
+    GET  /api/download-pdf/{filename} -> application/pdf
+    GET  /api/pdf-status              -> { available, version }
+    GET  /api/metrics                 -> métricas no formato do Prometheus
+
+Os geradores ficam aquecidos em um pool de processos, pedidos idênticos
+em andamento são atendidos por uma única renderização, PDFs já gerados
+vêm do cache endereçado por conteúdo e o pool é recriado quando arquivos
+em data/ mudam ou quando um processo do pool morre.
+
+    python src/utils/pdf_service.py --port 8765
+"""
+
+import os
+import re
+import sys
+import json
+import asyncio
+import datetime
+import tempfile
+import urllib.parse
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from aurora_pdf import generator
+from instrumentation import Instrumentation, json_log_hook
+from report_cache import DEFAULT_MAX_BYTES, ReportCache, is_source_file
+
+SERVICE_VERSION = '1.0.0'
+MAX_BODY_SIZE = 64 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+FILENAME_PATTERN = re.compile(r'^[\w.-]+\.pdf$')
+
+HTTP_REASONS = {
+    200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+    413: 'Payload Too Large', 500: 'Internal Server Error'
+}
+
+
+def data_fingerprint(data_dir: Path) -> Tuple:
+    """Impressão digital (caminho, tamanho, mtime) dos arquivos de origem em data/"""
+    entries = []
+    for path in sorted(Path(data_dir).rglob('*')):
+        if is_source_file(path, data_dir):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Removido entre a listagem e o stat (ex.: troca atômica)
+                continue
+            entries.append((str(path.relative_to(data_dir)), stat.st_size, stat.st_mtime_ns))
+    return tuple(entries)
+
+
+def _warm_worker() -> int:
+    """Tarefa que inicializa um processo do pool e carrega o gerador por inteiro"""
+    generator._worker_generator.warm_up()
+    return os.getpid()
+
+
+def _render_document(fmt: str, date: datetime.date, options: Dict[str, Any], output_path: str) -> Dict[str, Any]:
+    """
+    Renderiza um documento no processo do pool, com escrita atômica
+
+    Returns:
+        Snapshot das métricas desta renderização (somado pelo serviço)
+    """
+    worker = generator._worker_generator
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    try:
+        with worker.using_options(options):
+            if fmt == 'daily-report':
+                worker.generate_daily_report(date, tmp_path)
+            else:
+                start, end = generator.period_for_format(fmt, date)
+                worker.generate_almanac(start, end, tmp_path, generator.DOCUMENT_TITLES[fmt])
+        os.replace(tmp_path, output_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return worker.instrumentation.snapshot(reset=True)
+
+
+class PDFService:
+    """Serviço assíncrono de geração de PDF Aurora Sagrada"""
+
+    def __init__(self, data_dir: Optional[str] = None, output_dir: Optional[str] = None,
+                 workers: Optional[int] = None, prefix: str = '/api',
+                 reload_interval: float = 2.0, cache_max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Inicializa o serviço
+
+        Args:
+            data_dir: Diretório das bases de dados
+            output_dir: Diretório dos PDFs gerados (cache LRU)
+            workers: Número de processos de renderização (padrão: número de CPUs)
+            prefix: Prefixo das rotas (baseUrl de AuroraPDFAPI)
+            reload_interval: Intervalo, em segundos, da verificação de data/
+            cache_max_bytes: Tamanho máximo do diretório de PDFs
+        """
+        self.data_dir = Path(data_dir) if data_dir else Path(__file__).resolve().parent.parent.parent / 'data'
+        self.output_dir = Path(output_dir) if output_dir else Path(tempfile.gettempdir()) / 'aurora_sagrada_pdfs'
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.workers = workers or os.cpu_count() or 1
+        self.prefix = prefix.rstrip('/')
+        self.reload_interval = reload_interval
+        self.cache = ReportCache(self.output_dir, self.data_dir, cache_max_bytes)
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._fingerprint = data_fingerprint(self.data_dir)
+        self._watch_task: Optional[asyncio.Task] = None
+        self._pool_broken = False
+        self.stats = {'renders': 0, 'merged': 0, 'failures': 0, 'reloads': 0, 'pool_restarts': 0}
+        self.instrumentation = Instrumentation(enabled=True)
+
+    def _start_pool(self) -> ProcessPoolExecutor:
+        """
+        Cria um pool novo e aquece todos os processos
+
+        Os eventos das renderizações chegam aos ganchos inscritos em
+        self.instrumentation antes da criação do pool.
+        """
+        executor = ProcessPoolExecutor(max_workers=self.workers, initializer=generator._init_batch_worker,
+                                       initargs=(str(self.data_dir), None, None, True, None,
+                                                 self.instrumentation.has_hooks))
+        for _ in range(self.workers):
+            executor.submit(_warm_worker)
+        return executor
+
+    async def start(self):
+        """Inicia o pool e a observação de data/"""
+        self._executor = self._start_pool()
+        self._watch_task = asyncio.create_task(self._watch_data_dir())
+
+    async def close(self):
+        """Encerra a observação e o pool"""
+        if self._watch_task:
+            self._watch_task.cancel()
+        if self._executor:
+            self._executor.shutdown(wait=False)
+
+    async def _watch_data_dir(self):
+        """Recria o pool (recarregando as bases) quando arquivos em data/ mudam"""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            try:
+                fingerprint = await loop.run_in_executor(None, data_fingerprint, self.data_dir)
+                if fingerprint != self._fingerprint:
+                    self._fingerprint = fingerprint
+                    old_executor, self._executor = self._executor, self._start_pool()
+                    # Renderizações em andamento terminam no pool antigo
+                    old_executor.shutdown(wait=False)
+                    self._pool_broken = False
+                    self.stats['reloads'] += 1
+            except Exception as e:
+                # Uma falha (ex.: data/ indisponível) não pode encerrar a observação
+                print(f"Erro ao observar {self.data_dir}: {e}", file=sys.stderr)
+
+    async def generate(self, request: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        """
+        Atende um PDFGenerationRequest
+
+        Returns:
+            (status HTTP, PDFGenerationResponse)
+        """
+        try:
+            date = datetime.datetime.strptime(str(request.get('date', '')), '%Y-%m-%d').date()
+        except ValueError:
+            return 400, {"success": False, "error": "Formato de data inválido. Use YYYY-MM-DD"}
+
+        fmt = request.get('format', 'daily-report')
+        if fmt not in generator.DOCUMENT_TITLES:
+            return 400, {"success": False, "error": f"Formato desconhecido: {fmt}"}
+
+        # Pedidos que resultariam no mesmo PDF compartilham a chave
+        try:
+            options = generator.variant_options(request.get('options'))
+        except ValueError as e:
+            return 400, {"success": False, "error": str(e)}
+
+        # Varredura e hash de data/ e do código fora do event loop
+        loop = asyncio.get_running_loop()
+        fingerprint = await loop.run_in_executor(None, self.cache.inputs_fingerprint)
+        key = self.cache.key(fmt, date, options, fingerprint)
+        filename = self.cache.path(key).name
+
+        future = self._inflight.get(key)
+        if future is None and self.cache.get(key) is None:
+            future = asyncio.ensure_future(self._render(fmt, date, options, str(self.cache.path(key))))
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._finish_render(key, done))
+            self.stats['renders'] += 1
+        elif future is not None:
+            self.stats['merged'] += 1
+
+        if future is not None:
+            try:
+                await asyncio.shield(future)
+            except Exception as e:
+                return 500, {"success": False, "error": f"Erro ao gerar relatório: {e}"}
+
+        return 200, {
+            "success": True,
+            "filename": filename,
+            "downloadUrl": f"{self.prefix}/download-pdf/{filename}",
+            "generatedAt": datetime.datetime.now(datetime.timezone.utc).isoformat()
+        }
+
+    async def _render(self, fmt: str, date: datetime.date, options: Dict[str, Any],
+                      output_path: str) -> Dict[str, Any]:
+        """
+        Renderiza no pool; se um processo morreu (pool quebrado), troca o pool
+        e tenta mais uma vez
+        """
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            executor = self._executor
+            try:
+                return await loop.run_in_executor(executor, _render_document, fmt, date, options, output_path)
+            except BrokenProcessPool:
+                self._pool_broken = True
+                if attempt:
+                    raise
+                self._restart_pool(executor)
+
+    def _restart_pool(self, broken: ProcessPoolExecutor):
+        """Substitui um pool quebrado (uma só vez, mesmo com várias renderizações afetadas)"""
+        if self._executor is broken:
+            self._executor = self._start_pool()
+            broken.shutdown(wait=False)
+            self.stats['pool_restarts'] += 1
+            self.instrumentation.count('pool_restarts')
+        self._pool_broken = False
+
+    def _finish_render(self, key: str, future: asyncio.Future):
+        """Registra no cache (uma única vez) o resultado de uma renderização"""
+        self._inflight.pop(key, None)
+        if future.cancelled() or future.exception() is not None:
+            self.stats['failures'] += 1
+            self.instrumentation.count('renders', result='error')
+        else:
+            self.cache.add(key)
+            self.instrumentation.merge(future.result())
+            self.instrumentation.count('renders', result='ok')
+
+    def status(self) -> Dict[str, Any]:
+        """Resposta de /pdf-status"""
+        return {
+            "available": self._executor is not None and not self._pool_broken,
+            "version": SERVICE_VERSION,
+            "workers": self.workers,
+            "inflight": len(self._inflight),
+            **self.stats,
+            "cache": self.cache.stats()
+        }
+
+    def metrics(self) -> str:
+        """Resposta de /metrics: etapas das renderizações e estado do serviço"""
+        lines = [self.instrumentation.prometheus().rstrip('\n')]
+        prefix = self.instrumentation.prefix
+        for name, value in (('inflight', len(self._inflight)), ('workers', self.workers)):
+            lines.append(f"# TYPE {prefix}_service_{name} gauge")
+            lines.append(f"{prefix}_service_{name} {value}")
+        for name, value in self.cache.stats().items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                lines.append(f"# TYPE {prefix}_cache_{name} gauge")
+                lines.append(f"{prefix}_cache_{name} {value}")
+        return '\n'.join(line for line in lines if line) + '\n'
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Atende uma conexão HTTP/1.1 (uma requisição por conexão)"""
+        try:
+            request_line = await reader.readline()
+            if not request_line:
+                return
+            method, target, _ = request_line.decode('latin-1').split(' ', 2)
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+            length = int(headers.get('content-length') or 0)
+            if length > MAX_BODY_SIZE:
+                await self._send_json(writer, 413, {"success": False, "error": "Requisição muito grande"})
+                return
+            body = await reader.readexactly(length) if length else b''
+
+            path = urllib.parse.unquote(urllib.parse.urlsplit(target).path)
+            await self._dispatch(method.upper(), path, body, writer)
+        except (ValueError, asyncio.IncompleteReadError):
+            await self._send_json(writer, 400, {"success": False, "error": "Requisição HTTP inválida"})
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _dispatch(self, method: str, path: str, body: bytes, writer: asyncio.StreamWriter):
+        """Roteia a requisição"""
+        if not path.startswith(self.prefix + '/'):
+            await self._send_json(writer, 404, {"success": False, "error": "Rota não encontrada"})
+            return
+        route = path[len(self.prefix):]
+
+        if route == '/generate-pdf':
+            if method != 'POST':
+                await self._send_json(writer, 405, {"success": False, "error": "Use POST"})
+                return
+            try:
+                request = json.loads(body.decode('utf-8') or '{}')
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                await self._send_json(writer, 400, {"success": False, "error": "JSON inválido"})
+                return
+            if not isinstance(request, dict):
+                await self._send_json(writer, 400, {"success": False, "error": "JSON inválido"})
+                return
+            with self.instrumentation.span('request', route='generate-pdf'):
+                status, payload = await self.generate(request)
+            self.instrumentation.count('requests', route='generate-pdf', status=status)
+            await self._send_json(writer, status, payload)
+
+        elif route.startswith('/download-pdf/'):
+            if method != 'GET':
+                await self._send_json(writer, 405, {"success": False, "error": "Use GET"})
+                return
+            filename = route[len('/download-pdf/'):]
+            filepath = self.output_dir / filename
+            if not FILENAME_PATTERN.match(filename) or not filepath.is_file():
+                await self._send_json(writer, 404, {"success": False, "error": "PDF não encontrado"})
+                return
+            await self._send_file(writer, filepath)
+
+        elif route == '/pdf-status':
+            await self._send_json(writer, 200, self.status())
+
+        elif route == '/metrics':
+            body = self.metrics().encode('utf-8')
+            await self._send_headers(writer, 200, PROMETHEUS_CONTENT_TYPE, len(body))
+            writer.write(body)
+            await writer.drain()
+
+        else:
+            await self._send_json(writer, 404, {"success": False, "error": "Rota não encontrada"})
+
+    async def _send_headers(self, writer: asyncio.StreamWriter, status: int, content_type: str,
+                            length: int, extra: Optional[Dict[str, str]] = None):
+        """Envia a linha de status e os cabeçalhos"""
+        lines = [
+            f"HTTP/1.1 {status} {HTTP_REASONS.get(status, 'OK')}",
+            f"Content-Type: {content_type}",
+            f"Content-Length: {length}",
+            "Connection: close",
+        ]
+        for name, value in (extra or {}).items():
+            lines.append(f"{name}: {value}")
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+
+    async def _send_json(self, writer: asyncio.StreamWriter, status: int, payload: Dict[str, Any]):
+        """Envia uma resposta JSON"""
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        await self._send_headers(writer, status, 'application/json; charset=utf-8', len(body))
+        writer.write(body)
+        await writer.drain()
+
+    async def _send_file(self, writer: asyncio.StreamWriter, filepath: Path):
+        """Envia um PDF em blocos"""
+        size = filepath.stat().st_size
+        await self._send_headers(writer, 200, 'application/pdf', size, {
+            "Content-Disposition": f'attachment; filename="{filepath.name}"'
+        })
+        with open(filepath, 'rb') as f:
+            for chunk in iter(lambda: f.read(STREAM_CHUNK_SIZE), b''):
+                writer.write(chunk)
+                await writer.drain()
+
+    async def serve(self, host: str = '127.0.0.1', port: int = 8765):
+        """Executa o servidor até ser interrompido"""
+        await self.start()
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        print(f"Serviço de PDF Aurora Sagrada em http://{host}:{port}{self.prefix}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.close()
+
+
+def main():
+    """Inicia o serviço HTTP"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Serviço de PDF Aurora Sagrada')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='Endereço de escuta')
+    parser.add_argument('--port', type=int, default=8765, help='Porta de escuta')
+    parser.add_argument('--data-dir', type=str, help='Diretório das bases de dados')
+    parser.add_argument('--output-dir', type=str, help='Diretório dos PDFs gerados')
+    parser.add_argument('--workers', type=int, help='Número de processos de renderização')
+    parser.add_argument('--prefix', type=str, default='/api', help='Prefixo das rotas')
+    parser.add_argument('--log-json', action='store_true', help='Eventos das renderizações em JSON no stderr')
+
+    args = parser.parse_args()
+
+    service = PDFService(args.data_dir, args.output_dir, args.workers, args.prefix)
+    if args.log_json:
+        service.instrumentation.subscribe(json_log_hook())
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
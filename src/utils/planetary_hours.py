@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AURORA SAGRADA - HORAS PLANETÁRIAS
+Nascer e pôr do Sol vetorizados sobre datas × locais e as 24 horas
+desiguais com os regentes na ordem caldaica (mesmas regras de
+src/astro/hora-planetaria.ts). Os resultados ficam em cache por
+(local arredondado, data).
+
+    python src/utils/planetary_hours.py --date 2025-03-20 --lat -23.5505 --lon -46.6333
+"""
+
+import datetime
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from astro_lib import from_julian_day, julian_centuries, to_julian_day
+from ephemeris import Ephemeris
+
+# Ordem caldaica e regente de cada dia (datetime.weekday: segunda = 0)
+CHALDEAN_ORDER = ['Saturno', 'Jupiter', 'Marte', 'Sol', 'Venus', 'Mercurio', 'Lua']
+DAY_RULERS = ['Lua', 'Marte', 'Mercurio', 'Jupiter', 'Venus', 'Saturno', 'Sol']
+
+# Local padrão de hora-planetaria.ts (São Paulo)
+DEFAULT_LOCATION = {'nome': 'São Paulo', 'latitude': -23.5505, 'longitude': -46.6333,
+                    'timezone': 'America/Sao_Paulo'}
+
+# Altura do centro do Sol no nascer/pôr (refração e semidiâmetro)
+SUNRISE_ALTITUDE = -0.8333
+
+# Locais mais próximos que isso (graus, ~1 km) compartilham o cache
+LOCATION_BUCKET_DEGREES = 0.01
+
+DEFAULT_CACHE_ENTRIES = 4096
+SUN_EVENT_ITERATIONS = 4
+
+
+def sidereal_time(jd) -> np.ndarray:
+    """Tempo sideral médio de Greenwich em graus (Meeus 12.4)"""
+    jd = np.asarray(jd, dtype=np.float64)
+    T = julian_centuries(jd)
+    return np.mod(280.46061837 + 360.98564736629 * (jd - 2451545.0) + 0.000387933 * T**2, 360.0)
+
+
+def sun_events(ephemeris: Ephemeris, jd0, latitude, longitude) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Nascer e pôr do Sol (Julian Days UT) para arrays que se combinam por broadcasting
+
+    Args:
+        jd0: Julian Day de 0h UT de cada data civil
+        latitude: Latitude em graus (norte positiva)
+        longitude: Longitude em graus (leste positiva)
+
+    Returns:
+        (nascer, pôr); NaN quando o Sol não nasce ou não se põe
+    """
+    jd0, latitude, longitude = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64)
+                                                     for a in (jd0, latitude, longitude)))
+    phi = np.radians(latitude)
+    # Meio-dia solar médio local como ponto de partida
+    noon = jd0 + 0.5 - longitude / 360.0
+
+    # Longitude do Sol só em 0h UT dos dias vizinhos, interpolada no resto
+    # (erro < 0,001°): o custo não cresce com o número de locais
+    grid = np.unique(np.concatenate([jd0.ravel() + offset for offset in (-1.0, 0.0, 1.0, 2.0)]))
+    grid_longitudes = np.degrees(np.unwrap(np.radians(ephemeris.longitudes(grid, ['Sol'])['Sol'])))
+
+    def solve(guess: np.ndarray, sign: float) -> np.ndarray:
+        t = guess
+        for _ in range(SUN_EVENT_ITERATIONS):
+            sun = np.radians(np.interp(t, grid, grid_longitudes))
+            epsilon = np.radians(23.439291 - 0.0130042 * julian_centuries(t))
+            ra = np.degrees(np.arctan2(np.cos(epsilon) * np.sin(sun), np.cos(sun)))
+            dec = np.arcsin(np.sin(epsilon) * np.sin(sun))
+            cos_h0 = ((np.sin(np.radians(SUNRISE_ALTITUDE)) - np.sin(phi) * np.sin(dec))
+                      / (np.cos(phi) * np.cos(dec)))
+            h0 = np.degrees(np.arccos(np.where(np.abs(cos_h0) <= 1.0, cos_h0, np.nan)))
+            hour_angle = sidereal_time(t) + longitude - ra
+            t = t - (np.mod(hour_angle - sign * h0 + 180.0, 360.0) - 180.0) / 360.98564736629
+        return t
+
+    return solve(noon - 0.25, -1.0), solve(noon + 0.25, 1.0)
+
+
+class PlanetaryHoursCalculator:
+    """Horas planetárias em lote, com cache por (local arredondado, data)"""
+
+    def __init__(self, ephemeris: Ephemeris, max_entries: int = DEFAULT_CACHE_ENTRIES):
+        """
+        Args:
+            ephemeris: Fonte da longitude do Sol
+            max_entries: Número máximo de dias-local em cache (LRU)
+        """
+        self.ephemeris = ephemeris
+        self.max_entries = max_entries
+        self._cache: 'OrderedDict[Tuple[float, float, datetime.date], Dict[str, Any]]' = OrderedDict()
+
+    @staticmethod
+    def bucket(latitude: float, longitude: float) -> Tuple[float, float]:
+        """Local arredondado usado como chave do cache"""
+        return (round(round(latitude / LOCATION_BUCKET_DEGREES) * LOCATION_BUCKET_DEGREES, 6),
+                round(round(longitude / LOCATION_BUCKET_DEGREES) * LOCATION_BUCKET_DEGREES, 6))
+
+    def compute(self, dates: Sequence[datetime.date],
+                locations: Sequence[Tuple[float, float]]) -> Dict[str, np.ndarray]:
+        """
+        Calcula as horas de todas as datas × locais de uma vez, sem cache
+
+        Returns:
+            Dict com 'boundaries' (datas × locais × 25 Julian Days: início de
+            cada hora e fim da última), 'sunrise', 'sunset' e 'rulers' (datas
+            × 24 índices em CHALDEAN_ORDER)
+        """
+        jd0 = np.array([to_julian_day(date) - 0.5 for date in dates])[:, None]
+        latitude = np.array([location[0] for location in locations], dtype=np.float64)[None, :]
+        longitude = np.array([location[1] for location in locations], dtype=np.float64)[None, :]
+
+        # Nascer do dia seguinte fecha a última hora da noite (as datas não precisam ser contíguas)
+        sunrise, sunset = sun_events(self.ephemeris, np.concatenate([jd0, jd0 + 1.0]), latitude, longitude)
+        next_sunrise = sunrise[len(dates):]
+        sunrise, sunset = sunrise[:len(dates)], sunset[:len(dates)]
+
+        fractions = np.arange(13) / 12.0
+        day = sunrise[..., None] + (sunset - sunrise)[..., None] * fractions
+        night = sunset[..., None] + (next_sunrise - sunset)[..., None] * fractions
+        boundaries = np.concatenate([day, night[..., 1:]], axis=-1)
+
+        first = np.array([CHALDEAN_ORDER.index(DAY_RULERS[date.weekday()]) for date in dates])
+        rulers = (first[:, None] + np.arange(24)) % len(CHALDEAN_ORDER)
+        return {'boundaries': boundaries, 'sunrise': sunrise, 'sunset': sunset, 'rulers': rulers}
+
+    def _day(self, date: datetime.date, boundaries: np.ndarray, rulers: np.ndarray) -> Dict[str, Any]:
+        """Horas de um dia e local no formato de hora-planetaria.ts"""
+        valid = bool(np.all(np.isfinite(boundaries)))
+        hours = []
+        if valid:
+            times = [from_julian_day(jd) for jd in boundaries]
+            hours = [{
+                'hour': i + 1,
+                'planet': CHALDEAN_ORDER[rulers[i]],
+                'start': times[i],
+                'end': times[i + 1],
+                'day': i < 12,
+            } for i in range(24)]
+        return {
+            'date': date,
+            'day_ruler': DAY_RULERS[date.weekday()],
+            'sunrise': hours[0]['start'] if valid else None,
+            'sunset': hours[12]['start'] if valid else None,
+            'hours': hours,
+        }
+
+    def table(self, dates: Sequence[datetime.date],
+              locations: Sequence[Tuple[float, float]]) -> List[List[Dict[str, Any]]]:
+        """
+        Horas planetárias de cada data × local (UTC)
+
+        Os pares ausentes do cache são calculados juntos num único lote.
+        """
+        keys = [[self.bucket(*location) + (date,) for location in locations] for date in dates]
+        missing_dates = sorted({key[2] for row in keys for key in row if key not in self._cache})
+        missing_locations = sorted({key[:2] for row in keys for key in row if key not in self._cache})
+        if missing_dates:
+            result = self.compute(missing_dates, missing_locations)
+            for i, date in enumerate(missing_dates):
+                for j, location in enumerate(missing_locations):
+                    self._cache[location + (date,)] = self._day(date, result['boundaries'][i, j],
+                                                                result['rulers'][i])
+        table = []
+        for row in keys:
+            for key in row:
+                self._cache.move_to_end(key)
+            table.append([self._cache[key] for key in row])
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return table
+
+    def hours_for(self, date: datetime.date, latitude: float, longitude: float) -> Dict[str, Any]:
+        """Horas planetárias de uma data e local"""
+        return self.table([date], [(latitude, longitude)])[0][0]
+
+    def hour_at(self, moment: datetime.datetime, latitude: float, longitude: float) -> Optional[Dict[str, Any]]:
+        """Hora planetária em curso num instante UTC (None nas regiões polares)"""
+        for date in (moment.date() - datetime.timedelta(days=1), moment.date()):
+            for hour in self.hours_for(date, latitude, longitude)['hours']:
+                if hour['start'] <= moment < hour['end']:
+                    return hour
+        return None
+
+
+def main():
+    """Mostra as horas planetárias de uma data e local"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Horas planetárias Aurora Sagrada')
+    parser.add_argument('--date', type=str, help='Data YYYY-MM-DD (padrão: hoje)')
+    parser.add_argument('--lat', type=float, default=DEFAULT_LOCATION['latitude'], help='Latitude (norte positiva)')
+    parser.add_argument('--lon', type=float, default=DEFAULT_LOCATION['longitude'], help='Longitude (leste positiva)')
+    parser.add_argument('--data-dir', type=str, help='Diretório das bases de dados')
+
+    args = parser.parse_args()
+
+    data_dir = Path(args.data_dir) if args.data_dir else Path(__file__).resolve().parent.parent.parent / 'data'
+    calculator = PlanetaryHoursCalculator(Ephemeris(data_dir))
+
+    date = datetime.datetime.strptime(args.date, '%Y-%m-%d').date() if args.date else datetime.date.today()
+    day = calculator.hours_for(date, args.lat, args.lon)
+    print(f"Regente do dia: {day['day_ruler']}")
+    for hour in day['hours']:
+        print(f"{hour['hour']:>2} {'dia  ' if hour['day'] else 'noite'} {hour['start']:%H:%M}–{hour['end']:%H:%M} UTC  {hour['planet']}")
+    if not day['hours']:
+        print("Sem nascer ou pôr do Sol nesta data e latitude")
+
+
+if __name__ == '__main__':
+    main()
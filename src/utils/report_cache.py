@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AURORA SAGRADA - CACHE DE RELATÓRIOS RENDERIZADOS
+Cache em disco endereçado por conteúdo: a chave é o hash de (formato, data,
+opções, conteúdo de cada arquivo em data/ e do código do gerador). Tamanho
+limitado com despejo LRU, escritas atômicas seguras entre processos e
+estatísticas de acerto.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+CACHE_VERSION = 1
+CACHE_SUFFIX = '.pdf'
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Código cujo conteúdo altera o PDF gerado
+CODE_DIR = Path(__file__).resolve().parent
+
+# Artefatos gerados dentro de data/ (ver .gitignore): compilá-los no primeiro
+# uso não pode mudar a chave nem disparar a recarga do serviço
+DERIVED_DATA_PATTERNS = ('vsop87/*.bin', 'chebyshev/*')
+
+
+def is_source_file(path: Path, root: Path) -> bool:
+    """Se um arquivo sob root é conteúdo de origem (não oculto, temporário nem derivado)"""
+    relative = path.relative_to(root)
+    return (path.is_file()
+            and not path.name.endswith('.tmp')
+            and not any(part.startswith('.') for part in relative.parts)
+            and not any(relative.match(pattern) for pattern in DERIVED_DATA_PATTERNS))
+
+
+class ContentFingerprint:
+    """Hash do conteúdo de árvores de arquivos, recalculado só para arquivos alterados"""
+
+    def __init__(self):
+        self._hashes: Dict[Path, Tuple[int, int, str]] = {}
+
+    def _file_hash(self, path: Path, stat: os.stat_result) -> str:
+        """SHA-256 de um arquivo, memorizado por (tamanho, mtime)"""
+        known = self._hashes.get(path)
+        if known and known[0] == stat.st_size and known[1] == stat.st_mtime_ns:
+            return known[2]
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        self._hashes[path] = (stat.st_size, stat.st_mtime_ns, digest.hexdigest())
+        return digest.hexdigest()
+
+    def of(self, root: Path, pattern: str = '*') -> str:
+        """Impressão digital de todos os arquivos sob root que casam com pattern"""
+        digest = hashlib.sha256()
+        for path in sorted(Path(root).rglob(pattern)):
+            if not is_source_file(path, root):
+                continue
+            digest.update(str(path.relative_to(root)).encode('utf-8'))
+            digest.update(self._file_hash(path, path.stat()).encode('ascii'))
+        return digest.hexdigest()
+
+
+class ReportCache:
+    """Cache LRU de PDFs renderizados em disco"""
+
+    def __init__(self, cache_dir: Path, data_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Inicializa o cache
+
+        Args:
+            cache_dir: Diretório dos PDFs em cache
+            data_dir: Diretório das bases de dados (parte da chave)
+            max_bytes: Tamanho máximo do cache antes do despejo
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.data_dir = Path(data_dir)
+        self.max_bytes = max_bytes
+        self._fingerprint = ContentFingerprint()
+        self.counters = {'hits': 0, 'misses': 0, 'puts': 0, 'evictions': 0}
+
+    def inputs_fingerprint(self) -> str:
+        """Impressão digital das bases e do código (varre e consulta o disco)"""
+        return self._fingerprint.of(self.data_dir) + self._fingerprint.of(CODE_DIR, '*.py')
+
+    def key(self, fmt: str, date: datetime.date, options: Optional[Dict[str, Any]] = None,
+            fingerprint: Optional[str] = None) -> str:
+        """
+        Chave de um relatório (também o nome do arquivo, sem extensão)
+
+        Formato e data aparecem no nome para facilitar a inspeção; o hash
+        cobre todas as entradas. fingerprint (de inputs_fingerprint) evita
+        varrer o disco de novo, ex.: quando calculado fora do event loop.
+        """
+        digest = hashlib.sha256()
+        digest.update(json.dumps({
+            'version': CACHE_VERSION,
+            'format': fmt,
+            'date': date.isoformat(),
+            'options': options or {},
+        }, sort_keys=True).encode('utf-8'))
+        digest.update((fingerprint or self.inputs_fingerprint()).encode('ascii'))
+        return f"aurora_sagrada_{fmt}_{date.strftime('%Y%m%d')}_{digest.hexdigest()[:24]}"
+
+    def path(self, key: str) -> Path:
+        """Caminho do arquivo de uma chave"""
+        return self.cache_dir / f"{key}{CACHE_SUFFIX}"
+
+    def get(self, key: str) -> Optional[Path]:
+        """Retorna o PDF em cache (marcando-o como recente) ou None"""
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self.counters['misses'] += 1
+            return None
+        self.counters['hits'] += 1
+        return path
+
+    def open(self, key: str) -> Optional[BinaryIO]:
+        """
+        Abre o PDF em cache para leitura (marcando-o como recente) ou None
+
+        Um arquivo despejado por outro processo entre a consulta e a abertura
+        conta como falta; depois de aberto, o despejo não afeta a leitura.
+        """
+        path = self.path(key)
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError:
+            self.counters['misses'] += 1
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        self.counters['hits'] += 1
+        return f
+
+    def put(self, key: str, source: Path) -> Path:
+        """Copia um PDF renderizado para o cache (escrita atômica)"""
+        target = self.path(key)
+        tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, target)
+        return self.add(key)
+
+    def write(self, key: str, data: bytes) -> Path:
+        """Grava um PDF renderizado em memória no cache (escrita atômica)"""
+        target = self.path(key)
+        tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, target)
+        return self.add(key)
+
+    def add(self, key: str) -> Path:
+        """Registra um PDF já escrito atomicamente em path(key)"""
+        self.counters['puts'] += 1
+        self.evict(keep=self.path(key))
+        return self.path(key)
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        """(mtime, tamanho, caminho) de cada PDF em cache"""
+        entries = []
+        for path in self.cache_dir.glob(f"*{CACHE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self, keep: Optional[Path] = None):
+        """
+        Remove os PDFs menos usados até o cache caber em max_bytes
+
+        Args:
+            keep: Arquivo que nunca é removido (o que acabou de ser gravado,
+                mesmo que sozinho passe de max_bytes)
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+                self.counters['evictions'] += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def stats(self) -> Dict[str, Any]:
+        """Estatísticas de uso do cache"""
+        entries = self._entries()
+        lookups = self.counters['hits'] + self.counters['misses']
+        return {
+            **self.counters,
+            'hit_rate': self.counters['hits'] / lookups if lookups else 0.0,
+            'entries': len(entries),
+            'bytes': sum(size for _, size, _ in entries),
+            'max_bytes': self.max_bytes,
+        }
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AURORA SAGRADA - FONTES DOS RELATÓRIOS
+Registra uma família TrueType (DejaVu Sans, Noto Sans...) uma única vez por
+processo; o ReportLab embute no PDF só o subconjunto de glifos usados. As
+fontes são procuradas em $AURORA_FONT_DIR, data/fonts e nos diretórios do
+sistema; sem nenhuma, os relatórios voltam à Helvetica (base 14).
+
+font_safe() prepara o texto para a fonte registrada: dá forma contextual
+aos nomes árabes (nomeArabico) e os põe em ordem visual, troca para uma
+fonte de símbolos os caracteres que a família não cobre e, sem fonte que os
+cubra, usa um substituto (🌙 → ☽).
+
+Os subconjuntos embutidos saem sem hinting (instruções TrueType, cvt, fpgm,
+prep) e com a tabela name reduzida aos nomes da fonte: no DejaVu Sans isso
+é mais da metade de cada subconjunto, e os leitores de PDF não precisam.
+"""
+
+import os
+import re
+import sys
+import struct
+from pathlib import Path
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont, TTFontFace
+
+REPO_DIR = Path(__file__).resolve().parent.parent.parent
+
+FONT_DIRS = [
+    REPO_DIR / 'data' / 'fonts',
+    Path('/usr/share/fonts'),
+    Path('/usr/local/share/fonts'),
+    Path.home() / '.fonts',
+    Path.home() / '.local' / 'share' / 'fonts',
+    Path('/Library/Fonts'),
+    Path('/System/Library/Fonts'),
+    Path(os.environ.get('WINDIR', 'C:\\Windows')) / 'Fonts',
+]
+
+# Famílias em ordem de preferência: nome registrado → arquivo de cada variante
+FAMILIES = [
+    ('AuroraSans', {
+        'regular': 'DejaVuSans.ttf',
+        'bold': 'DejaVuSans-Bold.ttf',
+        'italic': 'DejaVuSans-Oblique.ttf',
+        'boldItalic': 'DejaVuSans-BoldOblique.ttf',
+    }),
+    ('AuroraNoto', {
+        'regular': 'NotoSans-Regular.ttf',
+        'bold': 'NotoSans-Bold.ttf',
+        'italic': 'NotoSans-Italic.ttf',
+        'boldItalic': 'NotoSans-BoldItalic.ttf',
+    }),
+]
+
+# Fontes de símbolos para caracteres fora da família (TrueType com contornos glyf)
+FALLBACK_FILES = ['NotoEmoji-Regular.ttf', 'Symbola.ttf', 'NotoSansSymbols2-Regular.ttf',
+                  'NotoSansSymbols-Regular.ttf']
+
+# Usada quando nenhuma família TrueType é encontrada
+BASE14 = {
+    'regular': 'Helvetica',
+    'bold': 'Helvetica-Bold',
+    'italic': 'Helvetica-Oblique',
+    'boldItalic': 'Helvetica-BoldOblique',
+}
+
+# Substitutos para caracteres que nenhuma fonte registrada cobre
+SUBSTITUTES = {
+    '\U0001F319': '\u263D',  # 🌙 → ☽
+    '\U0001F311': '\u25CF',  # 🌑 → ●
+    '\U0001F315': '\u25CB',  # 🌕 → ○
+    '\u2728': '\u2727',      # ✨ → ✧
+    '\uFE0F': '',            # seletor de variação emoji
+}
+
+# Formas de apresentação árabes (U+FE80–U+FEFC): letra → (forma isolada, liga à letra seguinte).
+# As letras que ligam dos dois lados têm quatro formas seguidas (isolada, final,
+# inicial, medial); as demais, duas (isolada, final)
+ARABIC_FORMS = {
+    '\u0621': (0xFE80, False), '\u0622': (0xFE81, False), '\u0623': (0xFE83, False),
+    '\u0624': (0xFE85, False), '\u0625': (0xFE87, False), '\u0626': (0xFE89, True),
+    '\u0627': (0xFE8D, False), '\u0628': (0xFE8F, True), '\u0629': (0xFE93, False),
+    '\u062A': (0xFE95, True), '\u062B': (0xFE99, True), '\u062C': (0xFE9D, True),
+    '\u062D': (0xFEA1, True), '\u062E': (0xFEA5, True), '\u062F': (0xFEA9, False),
+    '\u0630': (0xFEAB, False), '\u0631': (0xFEAD, False), '\u0632': (0xFEAF, False),
+    '\u0633': (0xFEB1, True), '\u0634': (0xFEB5, True), '\u0635': (0xFEB9, True),
+    '\u0636': (0xFEBD, True), '\u0637': (0xFEC1, True), '\u0638': (0xFEC5, True),
+    '\u0639': (0xFEC9, True), '\u063A': (0xFECD, True), '\u0641': (0xFED1, True),
+    '\u0642': (0xFED5, True), '\u0643': (0xFED9, True), '\u0644': (0xFEDD, True),
+    '\u0645': (0xFEE1, True), '\u0646': (0xFEE5, True), '\u0647': (0xFEE9, True),
+    '\u0648': (0xFEED, False), '\u0649': (0xFEEF, False), '\u064A': (0xFEF1, True),
+}
+# Lam + alef → ligadura (forma isolada; a final é a seguinte)
+LAM_ALEF = {'\u0622': 0xFEF5, '\u0623': 0xFEF7, '\u0625': 0xFEF9, '\u0627': 0xFEFB}
+ARABIC_LAM = '\u0644'
+ARABIC_TATWEEL = '\u0640'
+# Sinais diacríticos: não interrompem a ligação entre letras
+ARABIC_MARKS = set(map(chr, range(0x064B, 0x0653))) | {'\u0670'}
+
+ARABIC_RUN = re.compile(r'[\u0600-\u06FF\uFE70-\uFEFF]+(?:\s+[\u0600-\u06FF\uFE70-\uFEFF]+)*')
+
+# Tabelas de hinting, descartadas dos subconjuntos
+HINTING_TABLES = ('cvt ', 'fpgm', 'prep')
+# Flags dos componentes de glifos compostos (tabela glyf)
+ARG_1_AND_2_ARE_WORDS = 0x0001
+WE_HAVE_A_SCALE = 0x0008
+MORE_COMPONENTS = 0x0020
+WE_HAVE_AN_X_AND_Y_SCALE = 0x0040
+WE_HAVE_A_TWO_BY_TWO = 0x0080
+WE_HAVE_INSTRUCTIONS = 0x0100
+# Registros da tabela name mantidos: família, estilo, identificador, nome completo, PostScript
+NAME_IDS = (1, 2, 3, 4, 6)
+
+
+def _tables(font: bytes) -> Dict[str, bytes]:
+    """Tabelas de um arquivo TrueType"""
+    count = struct.unpack('>H', font[4:6])[0]
+    tables = {}
+    for i in range(count):
+        tag, _, offset, length = struct.unpack('>4sIII', font[12 + 16 * i:28 + 16 * i])
+        tables[tag.decode('latin-1')] = font[offset:offset + length]
+    return tables
+
+
+def _compact_name(name: bytes) -> bytes:
+    """Tabela name (formato 0) só com os registros de NAME_IDS"""
+    count, storage = struct.unpack('>HH', name[2:6])
+    records, strings = [], b''
+    for i in range(count):
+        platform, encoding, language, name_id, length, offset = struct.unpack(
+            '>6H', name[6 + 12 * i:18 + 12 * i])
+        if name_id in NAME_IDS:
+            records.append(struct.pack('>6H', platform, encoding, language, name_id, length, len(strings)))
+            strings += name[storage + offset:storage + offset + length]
+    return struct.pack('>3H', 0, len(records), 6 + 12 * len(records)) + b''.join(records) + strings
+
+
+def _strip_instructions(glyph: bytes) -> bytes:
+    """Glifo sem as instruções de hinting (simples ou composto)"""
+    if len(glyph) < 10:
+        return glyph
+    contours = struct.unpack('>h', glyph[:2])[0]
+    if contours >= 0:
+        at = 10 + 2 * contours
+        length = struct.unpack('>H', glyph[at:at + 2])[0]
+        return glyph[:at] + b'\0\0' + glyph[at + 2 + length:]
+
+    # Composto: limpa WE_HAVE_INSTRUCTIONS e corta as instruções após o último componente
+    out = bytearray(glyph)
+    at = 10
+    while True:
+        flags = struct.unpack('>H', glyph[at:at + 2])[0]
+        struct.pack_into('>H', out, at, flags & ~WE_HAVE_INSTRUCTIONS)
+        at += 4 + (4 if flags & ARG_1_AND_2_ARE_WORDS else 2)
+        if flags & WE_HAVE_A_SCALE:
+            at += 2
+        elif flags & WE_HAVE_AN_X_AND_Y_SCALE:
+            at += 4
+        elif flags & WE_HAVE_A_TWO_BY_TWO:
+            at += 8
+        if not flags & MORE_COMPONENTS:
+            return bytes(out[:at])
+
+
+def _checksum(data: bytes) -> int:
+    data += b'\0' * (-len(data) % 4)
+    return sum(struct.unpack(f'>{len(data) // 4}I', data)) & 0xFFFFFFFF
+
+
+def build_font(tables: Dict[str, bytes]) -> bytes:
+    """Arquivo TrueType (sfnt) a partir das tabelas, com checksums e checkSumAdjustment"""
+    tables = dict(tables)
+    tables['head'] = tables['head'][:8] + b'\0\0\0\0' + tables['head'][12:]
+    tags = sorted(tables)
+    entry_selector = max(len(tags).bit_length() - 1, 0)
+    search_range = 16 << entry_selector
+    header = struct.pack('>IHHHH', 0x00010000, len(tags), search_range, entry_selector,
+                         16 * len(tags) - search_range)
+
+    directory, body = [], []
+    offset = 12 + 16 * len(tags)
+    for tag in tags:
+        data = tables[tag]
+        directory.append(struct.pack('>4sIII', tag.encode('latin-1'), _checksum(data), offset, len(data)))
+        body.append(data + b'\0' * (-len(data) % 4))
+        offset += len(body[-1])
+    font = bytearray(header + b''.join(directory) + b''.join(body))
+
+    head = 12 + 16 * len(tags) + sum(len(data) for data in body[:tags.index('head')])
+    struct.pack_into('>I', font, head + 8, (0xB1B0AFBA - _checksum(bytes(font))) & 0xFFFFFFFF)
+    return bytes(font)
+
+
+def compact_subset(font: bytes) -> bytes:
+    """Subconjunto TrueType sem hinting e com a tabela name reduzida"""
+    tables = _tables(font)
+    long_offsets = struct.unpack('>h', tables['head'][50:52])[0]
+    loca, glyf = tables['loca'], tables['glyf']
+    if long_offsets:
+        offsets = struct.unpack(f'>{len(loca) // 4}I', loca)
+    else:
+        offsets = [2 * offset for offset in struct.unpack(f'>{len(loca) // 2}H', loca)]
+
+    glyphs, new_offsets, position = [], [], 0
+    for start, end in zip(offsets, offsets[1:]):
+        glyph = _strip_instructions(glyf[start:end]) if end > start else b''
+        glyph += b'\0' * (-len(glyph) % 4)
+        new_offsets.append(position)
+        glyphs.append(glyph)
+        position += len(glyph)
+    new_offsets.append(position)
+
+    compact = {tag: data for tag, data in tables.items() if tag not in HINTING_TABLES}
+    compact['name'] = _compact_name(tables['name'])
+    compact['glyf'] = b''.join(glyphs)
+    if long_offsets:
+        compact['loca'] = struct.pack(f'>{len(new_offsets)}I', *new_offsets)
+    else:
+        compact['loca'] = struct.pack(f'>{len(new_offsets)}H', *(offset // 2 for offset in new_offsets))
+    return build_font(compact)
+
+
+class CompactTTFontFace(TTFontFace):
+    """TTFontFace cujos subconjuntos passam por compact_subset"""
+
+    def makeSubset(self, subset):
+        return compact_subset(super().makeSubset(subset))
+
+
+class CompactTTFont(TTFont):
+    """TTFont que embute subconjuntos compactos"""
+
+    def __init__(self, name: str, filename: str, validate: int = 0, subfontIndex: int = 0, **kwargs):
+        super().__init__(name, filename, validate=validate, subfontIndex=subfontIndex, **kwargs)
+        # O TTFont sempre cria um TTFontFace; a face compacta lê o arquivo de novo (uma vez por processo)
+        self.face = CompactTTFontFace(filename, validate=validate, subfontIndex=subfontIndex)
+
+
+class FontSet:
+    """Família registrada para os relatórios e as fontes de símbolos de reserva"""
+
+    def __init__(self, names: Dict[str, str], faces: Optional[Dict[str, TTFont]] = None,
+                 fallbacks: Optional[List[TTFont]] = None):
+        """
+        Args:
+            names: Variante (regular, bold, italic, boldItalic) → nome registrado
+            faces: Variante → TTFont (vazio com a Helvetica)
+            fallbacks: Fontes de símbolos registradas, em ordem de preferência
+        """
+        self.names = names
+        self.faces = faces or {}
+        self.fallbacks = fallbacks or []
+        self.embedded = bool(self.faces)
+
+    def __getitem__(self, variant: str) -> str:
+        return self.names[variant]
+
+    def covers(self, char: str, variant: str = 'regular') -> bool:
+        """Se a variante tem um glifo para o caractere"""
+        face = self.faces.get(variant)
+        if face is None:
+            # Helvetica: só o que cabe na codificação WinAnsi
+            try:
+                char.encode('cp1252')
+                return True
+            except UnicodeEncodeError:
+                return False
+        return ord(char) in face.face.charToGlyph
+
+    def fallback_for(self, char: str) -> Optional[str]:
+        """Nome da primeira fonte de símbolos que cobre o caractere"""
+        for font in self.fallbacks:
+            if ord(char) in font.face.charToGlyph:
+                return font.fontName
+        return None
+
+
+def _font_index(dirs: List[Path]) -> Dict[str, Path]:
+    """Nome do arquivo → caminho, do primeiro diretório em que aparece"""
+    index: Dict[str, Path] = {}
+    for base in dirs:
+        if not base.is_dir():
+            continue
+        for root, _, files in os.walk(base):
+            for name in files:
+                if name.lower().endswith('.ttf'):
+                    index.setdefault(name, Path(root) / name)
+    return index
+
+
+def _register(name: str, path: Path) -> Optional[TTFont]:
+    try:
+        font = CompactTTFont(name, str(path))
+    except Exception as e:
+        print(f"Fonte ignorada {path}: {e}", file=sys.stderr)
+        return None
+    pdfmetrics.registerFont(font)
+    return font
+
+
+def _font_dirs() -> List[Path]:
+    extra = os.environ.get('AURORA_FONT_DIR')
+    return ([Path(p) for p in extra.split(os.pathsep) if p] if extra else []) + FONT_DIRS
+
+
+@lru_cache(maxsize=None)
+def register_fonts() -> FontSet:
+    """
+    Registra a família dos relatórios (uma vez por processo)
+
+    Variantes ausentes usam a regular; <b> e <i> nos parágrafos são mapeados
+    para as variantes da família.
+    """
+    index = _font_index(_font_dirs())
+    fallbacks = [font for i, filename in enumerate(FALLBACK_FILES) if filename in index
+                 for font in [_register(f'AuroraSymbols{i}', index[filename])] if font]
+
+    for family, files in FAMILIES:
+        if files['regular'] not in index:
+            continue
+        regular = _register(family, index[files['regular']])
+        if regular is None:
+            continue
+        faces = {'regular': regular}
+        for variant, suffix in (('bold', 'Bold'), ('italic', 'Italic'), ('boldItalic', 'BoldItalic')):
+            font = _register(f'{family}-{suffix}', index[files[variant]]) if files[variant] in index else None
+            faces[variant] = font or faces['bold' if variant == 'boldItalic' and 'bold' in faces else 'regular']
+        names = {variant: font.fontName for variant, font in faces.items()}
+        pdfmetrics.registerFontFamily(family, normal=names['regular'], bold=names['bold'],
+                                      italic=names['italic'], boldItalic=names['boldItalic'])
+        return FontSet(names, faces, fallbacks)
+
+    print("Nenhuma fonte TrueType encontrada; usando Helvetica", file=sys.stderr)
+    return FontSet(dict(BASE14), fallbacks=fallbacks)
+
+
+def shape_arabic(text: str) -> str:
+    """
+    Formas contextuais (inicial, medial, final) e ligaduras lam-alef
+
+    O ReportLab não faz shaping sem o uharfbuzz; as formas de apresentação
+    (U+FE70–U+FEFF) dão o mesmo resultado visual para o árabe sem vogais.
+    """
+    letters = [c for c in text if c not in ARABIC_MARKS]
+    shaped = []
+    i = 0
+    while i < len(letters):
+        char = letters[i]
+        if char not in ARABIC_FORMS and char != ARABIC_TATWEEL:
+            shaped.append(char)
+            i += 1
+            continue
+        previous = letters[i - 1] if i else ''
+        joins_previous = previous == ARABIC_TATWEEL or ARABIC_FORMS.get(previous, (0, False))[1]
+        following = letters[i + 1] if i + 1 < len(letters) else ''
+
+        if char == ARABIC_LAM and following in LAM_ALEF:
+            shaped.append(chr(LAM_ALEF[following] + joins_previous))
+            i += 2
+            continue
+        if char == ARABIC_TATWEEL:
+            shaped.append(char)
+            i += 1
+            continue
+
+        base, dual = ARABIC_FORMS[char]
+        joins_next = dual and (following in ARABIC_FORMS or following == ARABIC_TATWEEL)
+        # Formas seguidas: isolada, final, inicial, medial
+        shaped.append(chr(base + bool(joins_previous) + 2 * bool(joins_next)))
+        i += 1
+    return ''.join(shaped)
+
+
+def visual_arabic(text: str) -> str:
+    """Trechos árabes com forma contextual e em ordem visual (direita para esquerda)"""
+    return ARABIC_RUN.sub(lambda m: shape_arabic(m.group(0))[::-1], text)
+
+
+@lru_cache(maxsize=4096)
+def font_safe(text: str, markup: bool = True) -> str:
+    """
+    Texto pronto para a família registrada
+
+    Args:
+        text: Texto (com a marcação dos Paragraph se markup)
+        markup: Se pode trocar de fonte com <font name=...>; senão (células de
+            tabela em texto puro) só usa os substitutos
+    """
+    if text.isascii():
+        return text
+    fonts = register_fonts()
+    text = visual_arabic(text)
+
+    parts: List[Tuple[Optional[str], str]] = []
+    for char in text:
+        font = None
+        if not fonts.covers(char):
+            font = fonts.fallback_for(char) if markup else None
+            if font is None:
+                substitute = SUBSTITUTES.get(char)
+                if substitute is not None and all(fonts.covers(c) for c in substitute):
+                    char = substitute
+        if parts and parts[-1][0] == font:
+            parts[-1] = (font, parts[-1][1] + char)
+        else:
+            parts.append((font, char))
+    return ''.join(f'<font name="{font}">{run}</font>' if font else run for font, run in parts)
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AURORA SAGRADA - LAYOUT DOS RELATÓRIOS EM PDF
+Tudo o que depende do ReportLab: paleta, estilos de parágrafo, modelos de
+documento e flowables reutilizáveis. pdf-generator.py só importa este
+módulo quando monta um documento, então a CLI (--help, entradas inválidas,
+relatórios vindos do cache) não paga a importação do ReportLab.
+
+Paleta, fontes (report_fonts.py) e estilos são criados uma única vez por
+processo e compartilhados por todos os geradores; não devem ser alterados.
+Os streams dos PDFs saem só com Flate, sem a camada ASCII85 (25% maior).
+"""
+
+from typing import Dict
+
+from reportlab import rl_config
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.colors import HexColor
+from reportlab.lib.units import cm
+from reportlab.platypus import SimpleDocTemplate, Spacer, PageBreak, TableStyle, HRFlowable
+from reportlab.platypus import Paragraph as _Paragraph, Table as _Table
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from reportlab.pdfgen import canvas
+
+from report_fonts import register_fonts, font_safe
+
+# Streams binários comprimidos (vale para todos os documentos do processo)
+rl_config.useA85 = 0
+
+# Família dos relatórios, registrada uma vez por processo
+FONTS = register_fonts()
+
+# Paleta de cores Aurora Sagrada
+COLORS = {
+    'vinho': HexColor('#661D48'),
+    'azul_noite': HexColor('#0B1836'),
+    'dourado': HexColor('#DAA520'),
+    'pergaminho': HexColor('#F2EAFF'),
+    'salvia': HexColor('#B2D1B1'),
+    'preto': HexColor('#000000'),
+    'branco': HexColor('#FFFFFF')
+}
+
+
+def _create_styles() -> Dict[str, ParagraphStyle]:
+    """Cria estilos personalizados Aurora Sagrada"""
+    styles = getSampleStyleSheet()
+
+    return {
+        'AuroraTitle': ParagraphStyle(
+            'AuroraTitle',
+            parent=styles['Title'],
+            fontName=FONTS['bold'],
+            fontSize=24,
+            textColor=COLORS['dourado'],
+            alignment=TA_CENTER,
+            spaceAfter=20
+        ),
+        'AuroraHeading1': ParagraphStyle(
+            'AuroraHeading1',
+            parent=styles['Heading1'],
+            fontName=FONTS['bold'],
+            fontSize=18,
+            textColor=COLORS['vinho'],
+            spaceBefore=20,
+            spaceAfter=12
+        ),
+        'AuroraHeading2': ParagraphStyle(
+            'AuroraHeading2',
+            parent=styles['Heading2'],
+            fontName=FONTS['bold'],
+            fontSize=14,
+            textColor=COLORS['azul_noite'],
+            spaceBefore=15,
+            spaceAfter=8
+        ),
+        'AuroraBody': ParagraphStyle(
+            'AuroraBody',
+            parent=styles['Normal'],
+            fontName=FONTS['regular'],
+            fontSize=11,
+            textColor=COLORS['azul_noite'],
+            alignment=TA_JUSTIFY,
+            spaceAfter=8,
+            leading=14
+        ),
+        'AuroraQuote': ParagraphStyle(
+            'AuroraQuote',
+            parent=styles['Normal'],
+            fontName=FONTS['italic'],
+            fontSize=10,
+            textColor=COLORS['vinho'],
+            alignment=TA_CENTER,
+            leftIndent=20,
+            rightIndent=20,
+            spaceAfter=12,
+            leading=13
+        ),
+        'AuroraCaption': ParagraphStyle(
+            'AuroraCaption',
+            parent=styles['Normal'],
+            fontName=FONTS['regular'],
+            fontSize=9,
+            textColor=COLORS['salvia'],
+            alignment=TA_CENTER,
+            spaceAfter=6
+        )
+    }
+
+
+# Estilos compartilhados por todos os geradores do processo
+STYLES = _create_styles()
+
+
+class ReportDocTemplate(SimpleDocTemplate):
+    """Documento que aceita flowables compartilhados entre builds (ver _fragment)"""
+
+    def afterFlowable(self, flowable):
+        # O ReportLab só limpa esta marca em multiBuild; num flowable
+        # reutilizado ela viraria um LayoutError no próximo documento
+        flowable.__dict__.pop('_postponed', None)
+
+
+class AlmanacDocTemplate(ReportDocTemplate):
+    """Documento de vários dias que registra as entradas do sumário (outline)"""
+
+    def __init__(self, filename, native_outline: bool = True, **kwargs):
+        super().__init__(filename, **kwargs)
+        self.native_outline = native_outline
+        self.outline_entries = []
+
+    def afterFlowable(self, flowable):
+        """Registra títulos marcados com outline_entry = (título, nível)"""
+        super().afterFlowable(flowable)
+        entry = getattr(flowable, 'outline_entry', None)
+        if entry is None:
+            return
+
+        title, level = entry
+        if self.native_outline:
+            key = f"aurora-{len(self.outline_entries)}"
+            self.canv.bookmarkPage(key)
+            self.canv.addOutlineEntry(title, key, level=level, closed=level == 0)
+        self.outline_entries.append((title, level, self.page - 1))
+
+
+def report_document(target, document_class=ReportDocTemplate, **kwargs) -> ReportDocTemplate:
+    """Documento A4 comprimido, com as margens dos relatórios Aurora Sagrada"""
+    return document_class(
+        target,
+        pagesize=A4,
+        rightMargin=2*cm,
+        leftMargin=2*cm,
+        topMargin=2*cm,
+        bottomMargin=2*cm,
+        pageCompression=1,
+        **kwargs
+    )
+
+
+def draw_page_number(canv: canvas.Canvas, number: int):
+    """Desenha o número da página no rodapé"""
+    canv.saveState()
+    canv.setFont(FONTS['regular'], 8)
+    canv.setFillColor(COLORS['salvia'])
+    canv.drawCentredString(A4[0] / 2, 1*cm, str(number))
+    canv.restoreState()
+
+
+class Paragraph(_Paragraph):
+    """Paragraph com o texto preparado para a fonte registrada (ver font_safe)"""
+
+    def __init__(self, text, style=None, *args, **kwargs):
+        super().__init__(font_safe(text) if isinstance(text, str) else text, style, *args, **kwargs)
+
+
+class Table(_Table):
+    """Table com as células de texto puro preparadas para a fonte registrada"""
+
+    def __init__(self, data, *args, **kwargs):
+        data = [[font_safe(cell, markup=False) if isinstance(cell, str) else cell for cell in row]
+                for row in data]
+        super().__init__(data, *args, **kwargs)
+
+
+class CachedParagraph(Paragraph):
+    """
+    Paragraph reutilizável entre documentos: a quebra de linhas é calculada
+    uma vez por largura disponível e reaproveitada nos builds seguintes
+    """
+
+    _wrapped = None
+
+    def wrap(self, availWidth, availHeight):
+        # A altura do parágrafo não depende de availHeight
+        if self._wrapped is not None and self._wrapped[0] == availWidth:
+            return self._wrapped[1]
+        size = super().wrap(availWidth, availHeight)
+        self._wrapped = (availWidth, size)
+        return size
+
+    def split(self, availWidth, availHeight):
+        self._wrapped = None
+        return super().split(availWidth, availHeight)
+
+
+def decorative_line() -> HRFlowable:
+    """Linha dourada que separa as partes do relatório"""
+    return HRFlowable(width="100%", thickness=1, color=COLORS['dourado'])
+
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AURORA SAGRADA - LUA FORA DE CURSO
+A Lua fica fora de curso do último aspecto ptolomaico exato que faz com um
+planeta até entrar no signo seguinte. Ingressos nos signos e aspectos exatos
+de um ano inteiro saem das posições reais da Lua (cruzamentos de ângulo
+vetorizados, um por planeta) e viram arrays ordenados de períodos; consulta
+por instante, por array de instantes ou por intervalo é busca binária.
+
+    python src/utils/void_of_course.py --from 2025-01-01 --to 2025-01-31
+"""
+
+import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from astro_lib import DateLike, find_angle_crossings, from_julian_day, to_julian_day
+from aspects import ASPECT_NAMES
+from chebyshev import BODIES
+from ephemeris import Ephemeris
+
+SIGNS = ['Áries', 'Touro', 'Gêmeos', 'Câncer', 'Leão', 'Virgem',
+         'Libra', 'Escorpião', 'Sagitário', 'Capricórnio', 'Aquário', 'Peixes']
+
+# Elongações da Lua em relação ao planeta que formam aspecto (crescente/minguante)
+ELONGATION_ASPECTS = [(0.0, 'conjuncao'), (60.0, 'sextil'), (90.0, 'quadratura'), (120.0, 'trigono'),
+                      (180.0, 'oposicao'), (240.0, 'trigono'), (270.0, 'quadratura'), (300.0, 'sextil')]
+
+# A Lua avança pelo menos ~11,8° por dia em relação a qualquer planeta
+SEARCH_STEP = 1.0
+
+# Margem antes do ano: a Lua fica no máximo ~2,7 dias num signo
+YEAR_MARGIN_DAYS = 3.0
+
+
+class VoidOfCourseTimeline:
+    """Períodos de Lua fora de curso, indexados por ano"""
+
+    def __init__(self, ephemeris: Ephemeris, bodies: Optional[Sequence[str]] = None):
+        """
+        Args:
+            ephemeris: Fonte das longitudes
+            bodies: Planetas cujos aspectos contam (padrão: Sol a Netuno)
+        """
+        self.ephemeris = ephemeris
+        self.bodies = [body for body in (bodies or BODIES) if body != 'Lua']
+        self._years: Dict[int, Dict[str, np.ndarray]] = {}
+
+    def _elongation(self, body: str):
+        def angle(jd: np.ndarray) -> np.ndarray:
+            longitudes = self.ephemeris.longitudes(jd, ['Lua', body])
+            return np.mod(longitudes['Lua'] - longitudes[body], 360.0)
+        return angle
+
+    def year(self, year: int) -> Dict[str, np.ndarray]:
+        """
+        Períodos que terminam num ano UTC (calculados uma vez)
+
+        Returns:
+            Arrays paralelos: 'starts' e 'ends' (Julian Days), 'signs' (signo em
+            que a Lua entra ao fim do período), 'bodies' e 'aspects' (último
+            aspecto; -1 se a Lua não fez aspectos no signo)
+        """
+        if year not in self._years:
+            start = to_julian_day(datetime.datetime(year, 1, 1))
+            end = to_julian_day(datetime.datetime(year + 1, 1, 1))
+            first = start - YEAR_MARGIN_DAYS
+
+            ingresses, signs = find_angle_crossings(
+                lambda jd: self.ephemeris.longitudes(jd, ['Lua'])['Lua'],
+                first, end, np.arange(12) * 30.0, SEARCH_STEP)
+
+            times, bodies, aspects = [], [], []
+            for index, body in enumerate(self.bodies):
+                found, kinds = find_angle_crossings(self._elongation(body), first, end,
+                                                    [angle for angle, _ in ELONGATION_ASPECTS], SEARCH_STEP)
+                times.append(found)
+                bodies.append(np.full(len(found), index))
+                aspects.append(kinds)
+            times, bodies, aspects = (np.concatenate(values) for values in (times, bodies, aspects))
+            order = np.argsort(times, kind='stable')
+            times, bodies, aspects = times[order], bodies[order], aspects[order]
+
+            # Último aspecto antes de cada ingresso, se ocorreu depois do ingresso anterior
+            last = np.searchsorted(times, ingresses[1:]) - 1
+            valid = last >= 0
+            last_time = np.where(valid, times[np.maximum(last, 0)], -np.inf)
+            in_sign = last_time > ingresses[:-1]
+            starts = np.where(in_sign, last_time, ingresses[:-1])
+
+            keep = ingresses[1:] >= start
+            self._years[year] = {
+                'starts': starts[keep],
+                'ends': ingresses[1:][keep],
+                'signs': signs[1:][keep],
+                'bodies': np.where(in_sign, bodies[np.maximum(last, 0)], -1)[keep],
+                'aspects': np.where(in_sign, aspects[np.maximum(last, 0)], -1)[keep],
+            }
+        return self._years[year]
+
+    def _span(self, start_jd: float, end_jd: float) -> Dict[str, np.ndarray]:
+        """Períodos dos anos que podem tocar [start_jd, end_jd] concatenados"""
+        first = from_julian_day(start_jd).year
+        last = from_julian_day(end_jd + YEAR_MARGIN_DAYS).year
+        years = [self.year(year) for year in range(first, last + 1)]
+        return {key: np.concatenate([year[key] for year in years]) for key in years[0]}
+
+    def _period(self, span: Dict[str, np.ndarray], i: int) -> Dict[str, Any]:
+        body, aspect = int(span['bodies'][i]), int(span['aspects'][i])
+        return {
+            'start': from_julian_day(span['starts'][i]),
+            'end': from_julian_day(span['ends'][i]),
+            'start_jd': float(span['starts'][i]),
+            'end_jd': float(span['ends'][i]),
+            'sign': SIGNS[int(span['signs'][i])],
+            'body': self.bodies[body] if body >= 0 else None,
+            'aspect': ASPECT_NAMES[ELONGATION_ASPECTS[aspect][1]] if aspect >= 0 else None,
+        }
+
+    def is_void(self, jd) -> np.ndarray:
+        """Se a Lua está fora de curso, para um array de Julian Days (UT)"""
+        jd = np.asarray(jd, dtype=np.float64)
+        span = self._span(jd.min(), jd.max())
+        i = np.searchsorted(span['ends'], jd, side='right')
+        inside = i < len(span['ends'])
+        return inside & (span['starts'][np.minimum(i, len(span['ends']) - 1)] <= jd)
+
+    def period_at(self, moment: DateLike) -> Optional[Dict[str, Any]]:
+        """Período fora de curso em andamento num instante ou data (12:00 UTC), se houver"""
+        jd = to_julian_day(moment)
+        span = self._span(jd, jd)
+        i = int(np.searchsorted(span['ends'], jd, side='right'))
+        if i < len(span['ends']) and span['starts'][i] <= jd:
+            return self._period(span, i)
+        return None
+
+    def periods_between(self, start: DateLike, end: DateLike) -> List[Dict[str, Any]]:
+        """Períodos que se sobrepõem a [start, end)"""
+        start_jd, end_jd = to_julian_day(start), to_julian_day(end)
+        span = self._span(start_jd, end_jd)
+        lo = int(np.searchsorted(span['ends'], start_jd, side='right'))
+        hi = int(np.searchsorted(span['starts'], end_jd))
+        return [self._period(span, i) for i in range(lo, hi)]
+
+    def release(self, before_year: int):
+        """Descarta os anos anteriores a before_year (percursos longos em ordem)"""
+        for year in [year for year in self._years if year < before_year]:
+            del self._years[year]
+
+
+def main():
+    """Lista os períodos de Lua fora de curso num intervalo"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Lua fora de curso Aurora Sagrada')
+    parser.add_argument('--from', dest='start', type=str, help='Data inicial YYYY-MM-DD (padrão: hoje)')
+    parser.add_argument('--to', dest='end', type=str, help='Data final YYYY-MM-DD (padrão: 7 dias)')
+    parser.add_argument('--data-dir', type=str, help='Diretório das bases de dados')
+
+    args = parser.parse_args()
+
+    data_dir = Path(args.data_dir) if args.data_dir else Path(__file__).resolve().parent.parent.parent / 'data'
+    timeline = VoidOfCourseTimeline(Ephemeris(data_dir))
+
+    start = datetime.datetime.strptime(args.start, '%Y-%m-%d') if args.start else datetime.datetime.utcnow()
+    end = (datetime.datetime.strptime(args.end, '%Y-%m-%d') + datetime.timedelta(days=1)
+           if args.end else start + datetime.timedelta(days=7))
+
+    for period in timeline.periods_between(start, end):
+        last = f"após {period['aspect']} com {period['body']}" if period['body'] else 'sem aspectos no signo'
+        print(f"{period['start']:%Y-%m-%d %H:%M} – {period['end']:%d/%m %H:%M} UTC  "
+              f"→ {period['sign']} ({last})")
+
+
+if __name__ == '__main__':
+    main()
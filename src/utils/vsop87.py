@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AURORA SAGRADA - MOTOR PLANETÁRIO VSOP87A
+Avalia as séries VSOP87A (data/vsop87/VSOP87A.*) com NumPy sobre lotes
+inteiros de datas julianas de uma só vez
+
+Os arquivos em texto são compilados uma única vez em tabelas binárias
+(VSOP87A.*.bin) abertas com np.memmap, compartilhadas via page cache
+entre todos os processos:
+
+    python src/utils/vsop87.py compile
+"""
+
+import os
+import struct
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from astro_lib import J2000, julian_centuries, normalize_degrees
+from file_stamps import refresh_stamps, source_stamp
+
+# Planetas em português (como em engine-efemerides.ts) -> extensão do arquivo VSOP87A
+PLANETS = {
+    'Mercurio': 'mer',
+    'Venus': 'ven',
+    'Terra': 'ear',
+    'Marte': 'mar',
+    'Jupiter': 'jup',
+    'Saturno': 'sat',
+    'Urano': 'ura',
+    'Netuno': 'nep',
+}
+
+VARIABLES = ('X', 'Y', 'Z')
+MAX_POWER = 5
+
+# Limite de elementos (termos x datas) por bloco de avaliação, para conter o uso de memória
+CHUNK_ELEMENTS = 2_000_000
+
+# Termos por variável: lista indexada pela potência de T com arrays (n, 3) de [A, B, C]
+TermTable = Dict[str, List[np.ndarray]]
+
+# Cabeçalho da tabela binária: magic, sha256 da fonte, tamanho e mtime da fonte,
+# número de termos por (variável, potência); seguido dos termos float64 [A, B, C]
+CACHE_MAGIC = b'AURVSOP1'
+CACHE_SUFFIX = '.bin'
+HEADER_FORMAT = '<8s32sQq' + 'I' * (len(VARIABLES) * (MAX_POWER + 1))
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+# Tamanho e mtime da fonte, logo após magic e checksum
+STAMP_OFFSET = struct.calcsize('<8s32s')
+
+
+def parse_vsop87_file(filepath: Path) -> TermTable:
+    """
+    Lê um arquivo VSOP87A em texto
+
+    Returns:
+        Dicionário {'X'|'Y'|'Z': [termos T^0, ..., termos T^5]}
+    """
+    rows: Dict[str, List[List[List[float]]]] = {
+        var: [[] for _ in range(MAX_POWER + 1)] for var in VARIABLES
+    }
+    current = None
+
+    with open(filepath, 'r', encoding='ascii') as f:
+        for line in f:
+            if 'VSOP87' in line:
+                # Ex.: "VSOP87 VERSION A1    EARTH     VARIABLE 1 (XYZ)       *T**0    843 TERMS"
+                variable = int(line.split('VARIABLE')[1].split()[0])
+                power = int(line.split('*T**')[1].split()[0])
+                current = rows[VARIABLES[variable - 1]][power]
+                continue
+            if current is None or not line.strip():
+                continue
+            fields = line.split()
+            current.append([float(fields[-3]), float(fields[-2]), float(fields[-1])])
+
+    return {
+        var: [np.array(terms, dtype=np.float64).reshape(-1, 3) for terms in powers]
+        for var, powers in rows.items()
+    }
+
+
+def file_checksum(filepath: Path) -> bytes:
+    """SHA-256 do conteúdo de um arquivo"""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.digest()
+
+
+def compile_vsop87_file(source: Path, target: Path) -> Path:
+    """
+    Compila um arquivo VSOP87A em uma tabela binária de termos
+
+    A escrita é atômica (arquivo temporário + os.replace), segura para
+    processos concorrentes.
+    """
+    source, target = Path(source), Path(target)
+    table = parse_vsop87_file(source)
+    stat = source.stat()
+
+    blocks = [table[var][power] for var in VARIABLES for power in range(MAX_POWER + 1)]
+    header = struct.pack(
+        HEADER_FORMAT,
+        CACHE_MAGIC,
+        file_checksum(source),
+        stat.st_size,
+        stat.st_mtime_ns,
+        *[len(block) for block in blocks]
+    )
+
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(np.concatenate(blocks).astype('<f8').tobytes())
+    os.replace(tmp_path, target)
+    return target
+
+
+def compiled_path(source: Path, cache_dir: Optional[Path] = None) -> Path:
+    """Caminho da tabela binária correspondente a um arquivo VSOP87A"""
+    source = Path(source)
+    directory = Path(cache_dir) if cache_dir else source.parent
+    return directory / f"{source.name}{CACHE_SUFFIX}"
+
+
+def _read_header(target: Path) -> Optional[tuple]:
+    """Lê o cabeçalho de uma tabela binária; None se ausente ou inválido"""
+    try:
+        with open(target, 'rb') as f:
+            raw = f.read(HEADER_SIZE)
+    except OSError:
+        return None
+    if len(raw) != HEADER_SIZE:
+        return None
+    header = struct.unpack(HEADER_FORMAT, raw)
+    if header[0] != CACHE_MAGIC:
+        return None
+    return header
+
+
+def is_compiled_current(source: Path, target: Path) -> bool:
+    """
+    Verifica se a tabela binária corresponde ao arquivo fonte
+
+    Tamanho e mtime iguais bastam; caso contrário o checksum é conferido e,
+    se bater (ex.: checkout novo), o cabeçalho passa a ter os metadados atuais.
+    """
+    header = _read_header(target)
+    if header is None:
+        return False
+    stat = Path(source).stat()
+    if header[2] == stat.st_size and header[3] == stat.st_mtime_ns:
+        return True
+    if header[1] != file_checksum(source):
+        return False
+    refresh_stamps(target, STAMP_OFFSET, source_stamp(stat))
+    return True
+
+
+def load_compiled_table(target: Path) -> TermTable:
+    """Abre uma tabela binária com np.memmap (somente leitura, sem cópia)"""
+    header = _read_header(target)
+    if header is None:
+        raise ValueError(f"Tabela VSOP87 inválida: {target}")
+    counts = header[4:]
+
+    table: TermTable = {var: [] for var in VARIABLES}
+    if sum(counts) == 0:
+        empty = np.zeros((0, 3))
+        for var in VARIABLES:
+            table[var] = [empty] * (MAX_POWER + 1)
+        return table
+
+    terms = np.memmap(target, dtype='<f8', mode='r', offset=HEADER_SIZE, shape=(sum(counts), 3))
+    start = 0
+    for i, count in enumerate(counts):
+        table[VARIABLES[i // (MAX_POWER + 1)]].append(terms[start:start + count])
+        start += count
+    return table
+
+
+def compile_all(vsop_dir: Path, cache_dir: Optional[Path] = None, force: bool = False) -> List[Path]:
+    """Compila todos os arquivos VSOP87A de um diretório"""
+    compiled = []
+    for code in PLANETS.values():
+        source = Path(vsop_dir) / f"VSOP87A.{code}"
+        if not source.exists():
+            continue
+        target = compiled_path(source, cache_dir)
+        if force or not is_compiled_current(source, target):
+            compile_vsop87_file(source, target)
+        compiled.append(target)
+    return compiled
+
+
+def evaluate_series(terms: List[np.ndarray], t: np.ndarray) -> np.ndarray:
+    """
+    Soma Σ_α t^α Σ A·cos(B + C·t) para um vetor de tempos
+
+    Args:
+        terms: Arrays (n, 3) de [A, B, C] por potência de t
+        t: Milênios julianos desde J2000, shape (N,)
+    """
+    result = np.zeros_like(t)
+    for power in range(len(terms) - 1, -1, -1):
+        table = terms[power]
+        partial = np.zeros_like(t)
+        if len(table):
+            amplitude, phase, frequency = table[:, 0], table[:, 1], table[:, 2]
+            step = max(1, CHUNK_ELEMENTS // len(table))
+            for start in range(0, len(t), step):
+                chunk = t[start:start + step]
+                angles = phase[:, None] + frequency[:, None] * chunk[None, :]
+                partial[start:start + step] = amplitude @ np.cos(angles)
+        # Horner em t
+        result = result * t + partial
+    return result
+
+
+def precession_in_longitude(jd) -> np.ndarray:
+    """Precessão geral em longitude de J2000 até a data (graus)"""
+    T = julian_centuries(jd)
+    return (5029.0966 * T + 1.11113 * T ** 2) / 3600.0
+
+
+class VSOP87Engine:
+    """Posições planetárias a partir das séries VSOP87A completas"""
+
+    def __init__(self, vsop_dir: Path, min_amplitude: float = 0.0,
+                 cache_dir: Optional[Path] = None):
+        """
+        Inicializa o motor
+
+        Args:
+            vsop_dir: Diretório com os arquivos VSOP87A.*
+            min_amplitude: Descarta termos com |A| abaixo deste valor (UA), trocando
+                precisão por velocidade; 0 usa a série completa
+            cache_dir: Diretório das tabelas binárias (padrão: vsop_dir)
+        """
+        self.vsop_dir = Path(vsop_dir)
+        self.min_amplitude = min_amplitude
+        self.cache_dir = Path(cache_dir) if cache_dir else self.vsop_dir
+        self._tables: Dict[str, TermTable] = {}
+
+    def _open_table(self, planet: str) -> TermTable:
+        """
+        Abre a tabela binária do planeta, compilando-a se ausente ou desatualizada
+
+        Se o diretório não for gravável, recorre à leitura do texto.
+        """
+        source = self.vsop_dir / f"VSOP87A.{PLANETS[planet]}"
+        target = compiled_path(source, self.cache_dir)
+        if not source.exists() and _read_header(target) is not None:
+            return load_compiled_table(target)
+        if not is_compiled_current(source, target):
+            try:
+                compile_vsop87_file(source, target)
+            except OSError:
+                return parse_vsop87_file(source)
+        return load_compiled_table(target)
+
+    def _load_table(self, planet: str) -> TermTable:
+        """Carrega (uma única vez) os termos de um planeta"""
+        if planet not in self._tables:
+            if planet not in PLANETS:
+                raise ValueError(f"Planeta desconhecido: {planet}")
+            table = self._open_table(planet)
+            if self.min_amplitude > 0:
+                table = {
+                    var: [terms[np.abs(terms[:, 0]) >= self.min_amplitude] for terms in powers]
+                    for var, powers in table.items()
+                }
+            self._tables[planet] = table
+        return self._tables[planet]
+
+    def heliocentric_xyz(self, planet: str, jd) -> np.ndarray:
+        """
+        Coordenadas retangulares heliocêntricas (eclíptica e equinócio J2000, UA)
+
+        Args:
+            planet: Nome do planeta (chave de PLANETS)
+            jd: Julian Day escalar ou array
+
+        Returns:
+            Array com shape (..., 3)
+        """
+        jd = np.asarray(jd, dtype=np.float64)
+        t = np.atleast_1d((jd - J2000) / 365250.0).ravel()
+        table = self._load_table(planet)
+        xyz = np.stack([evaluate_series(table[var], t) for var in VARIABLES], axis=-1)
+        return xyz.reshape(jd.shape + (3,))
+
+    def geocentric_xyz(self, planet: str, jd) -> np.ndarray:
+        """Coordenadas retangulares geocêntricas (J2000, UA); 'Sol' é aceito"""
+        earth = self.heliocentric_xyz('Terra', jd)
+        if planet == 'Sol':
+            return -earth
+        return self.heliocentric_xyz(planet, jd) - earth
+
+    def geocentric_longitude(self, planet: str, jd, of_date: bool = True) -> np.ndarray:
+        """
+        Longitude eclíptica geocêntrica geométrica em graus
+
+        Args:
+            planet: Nome do planeta ou 'Sol'
+            jd: Julian Day escalar ou array
+            of_date: Referir ao equinócio da data (zodíaco tropical) em vez de J2000
+        """
+        xyz = self.geocentric_xyz(planet, jd)
+        longitude = np.degrees(np.arctan2(xyz[..., 1], xyz[..., 0]))
+        if of_date:
+            longitude = longitude + precession_in_longitude(jd)
+        return normalize_degrees(longitude)
+
+    def geocentric_longitudes(self, jd, planets: Optional[Sequence[str]] = None,
+                              of_date: bool = True) -> Dict[str, np.ndarray]:
+        """
+        Longitudes geocêntricas do Sol e de todos os planetas para um lote de datas
+
+        A posição da Terra é avaliada uma só vez e reaproveitada para todos os corpos.
+        """
+        if planets is None:
+            planets = ['Sol'] + [p for p in PLANETS if p != 'Terra']
+        earth = self.heliocentric_xyz('Terra', jd)
+        shift = precession_in_longitude(jd) if of_date else 0.0
+
+        longitudes = {}
+        for planet in planets:
+            xyz = -earth if planet == 'Sol' else self.heliocentric_xyz(planet, jd) - earth
+            longitude = np.degrees(np.arctan2(xyz[..., 1], xyz[..., 0])) + shift
+            longitudes[planet] = normalize_degrees(longitude)
+        return longitudes
+
+
+def main():
+    """Compila as tabelas binárias VSOP87A"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Motor VSOP87A Aurora Sagrada')
+    parser.add_argument('command', choices=['compile'], help='Ação a executar')
+    parser.add_argument('--data-dir', type=str, help='Diretório dos arquivos VSOP87A')
+    parser.add_argument('--cache-dir', type=str, help='Diretório de saída das tabelas binárias')
+    parser.add_argument('--force', action='store_true', help='Recompila mesmo se atualizadas')
+
+    args = parser.parse_args()
+
+    vsop_dir = Path(args.data_dir) if args.data_dir else Path(__file__).resolve().parent.parent.parent / 'data' / 'vsop87'
+    for target in compile_all(vsop_dir, args.cache_dir, force=args.force):
+        print(f"Tabela compilada: {target}")
+
+
+if __name__ == '__main__':
+    main()